@@ -0,0 +1,272 @@
+import threading
+import time
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import date
+from itertools import compress
+from typing import Any, Iterable, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.scheduler import BULK, priority
+
+GROUP_KEYS = ("opportunity_stage_id", "owner_id", "account_id", "is_won", "is_closed", "closed_year", "closed_quarter", "closed_month")
+
+_NO_DATE = 0
+
+
+def _ordinal(value: Any) -> int:
+    if not value:
+        return _NO_DATE
+    try:
+        return date.fromisoformat(str(value)[:10]).toordinal()
+    except ValueError:
+        return _NO_DATE
+
+
+def _filter_date(name: str, value: Any) -> int:
+    if not value:
+        return _NO_DATE
+    try:
+        return date.fromisoformat(str(value)).toordinal()
+    except ValueError:
+        raise ValueError(f"'{name}' must be a date in YYYY-MM-DD format (got {value!r})") from None
+
+
+def _flag(value: Any) -> int:
+    return -1 if value is None else int(bool(value))
+
+
+class _Codes:
+    """Dictionary encoding of a string column: each distinct value gets a small int."""
+
+    def __init__(self) -> None:
+        self.values: list[Optional[str]] = [None]
+        self._codes: dict[Optional[str], int] = {None: 0}
+
+    def encode(self, value: Optional[str]) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, values: Iterable[Optional[str]]) -> set[int]:
+        return {self._codes[v] for v in values if v in self._codes}
+
+
+class DealTable:
+    """
+    In-memory, column-oriented copy of the team's deals.
+
+    Each field is one ``array`` column (amounts as doubles, stage, owner and
+    account IDs dictionary-encoded as ints, closed dates as day ordinals,
+    flags as bytes), so a deal costs a few dozen bytes and a query is a
+    handful of passes over flat arrays rather than a walk over dicts. Rows
+    are upserted in place by deal ID; deals missing from a full refresh are
+    dropped, and their rows reclaimed once they outnumber the live ones.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        # Held for a whole refresh, so concurrent callers share one pull.
+        self._refresh_lock = threading.Lock()
+        self._row: dict[str, int] = {}
+        self.ids: list[str] = []
+        self.amount = array("d")
+        self.stage = array("i")
+        self.owner = array("i")
+        self.account = array("i")
+        self.closed = array("i")
+        self.is_won = array("b")
+        self.is_closed = array("b")
+        self.alive = array("b")
+        self.stages = _Codes()
+        self.owners = _Codes()
+        self.accounts = _Codes()
+        self.refreshed_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return sum(self.alive)
+
+    def upsert(self, deal: dict[str, Any]) -> bool:
+        """Insert or update one deal. Returns True if anything changed."""
+        values = (
+            float(deal.get("amount") or 0.0),
+            self.stages.encode(deal.get("opportunity_stage_id")),
+            self.owners.encode(deal.get("owner_id")),
+            self.accounts.encode(deal.get("account_id")),
+            _ordinal(deal.get("closed_date")),
+            _flag(deal.get("is_won")),
+            _flag(deal.get("is_closed")),
+            1,
+        )
+        columns = (self.amount, self.stage, self.owner, self.account, self.closed, self.is_won, self.is_closed, self.alive)
+        with self._lock:
+            row = self._row.get(deal["id"])
+            if row is None:
+                self._row[deal["id"]] = len(self.ids)
+                self.ids.append(deal["id"])
+                for column, value in zip(columns, values):
+                    column.append(value)
+                return True
+            changed = False
+            for column, value in zip(columns, values):
+                if column[row] != value:
+                    column[row] = value
+                    changed = True
+            return changed
+
+    def remove_missing(self, seen: set[str]) -> int:
+        with self._lock:
+            removed = 0
+            for deal_id, row in self._row.items():
+                if self.alive[row] and deal_id not in seen:
+                    self.alive[row] = 0
+                    removed += 1
+            if 2 * sum(self.alive) < len(self.ids):
+                self._compact()
+            return removed
+
+    def _compact(self) -> None:
+        keep = [row for row in range(len(self.ids)) if self.alive[row]]
+        for name in ("amount", "stage", "owner", "account", "closed", "is_won", "is_closed", "alive"):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, (column[row] for row in keep)))
+        self.ids = [self.ids[row] for row in keep]
+        self._row = {deal_id: row for row, deal_id in enumerate(self.ids)}
+
+    def refresh(self, app, per_page: int = 100, workers: int = 4) -> dict[str, Any]:
+        """
+        Page through ``list_all_deals`` and upsert every deal. After the first
+        page the remaining pages are fetched concurrently at bulk priority.
+
+        Apollo cannot list deals changed since a given time, so every refresh
+        fetches all of them; only applying them to the table is incremental.
+        """
+        started = time.monotonic()
+
+        def fetch(page: int) -> dict[str, Any]:
+            with priority(BULK):
+                return app.list_all_deals(page=page, per_page=per_page) or {}
+
+        first = fetch(1)
+        total_pages = int((first.get("pagination") or {}).get("total_pages") or 1)
+        payloads = [first]
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="apollo-deals") as pool:
+                # Each page is fetched in a copy of the caller's context, so it is profiled with the tool call.
+                futures = [pool.submit(copy_context().run, fetch, page) for page in range(2, total_pages + 1)]
+                payloads.extend(future.result() for future in futures)
+        seen: set[str] = set()
+        changed = 0
+        for payload in payloads:
+            for deal in payload.get("opportunities") or []:
+                seen.add(deal["id"])
+                changed += self.upsert(deal)
+        removed = self.remove_missing(seen)
+        self.refreshed_at = time.monotonic()
+        stats = {"deals": len(seen), "changed": changed, "removed": removed, "pages": total_pages, "seconds": round(self.refreshed_at - started, 3)}
+        logger.info(f"DealTable: refreshed {stats}")
+        return stats
+
+    def _mask(self, filters: dict[str, Any]) -> list[bool]:
+        mask = list(self.alive)
+        for name, column, codes in (
+            ("opportunity_stage_ids", self.stage, self.stages),
+            ("owner_ids", self.owner, self.owners),
+            ("account_ids", self.account, self.accounts),
+        ):
+            if filters.get(name):
+                wanted = codes.lookup(filters[name])
+                mask = [m and c in wanted for m, c in zip(mask, column)]
+        for name, column in (("is_won", self.is_won), ("is_closed", self.is_closed)):
+            if filters.get(name) is not None:
+                flag = int(bool(filters[name]))
+                mask = [m and f == flag for m, f in zip(mask, column)]
+        low = _filter_date("closed_from", filters.get("closed_from"))
+        high = _filter_date("closed_to", filters.get("closed_to"))
+        if low or high:
+            high = high or date.max.toordinal()
+            mask = [m and low <= d <= high and d != _NO_DATE for m, d in zip(mask, self.closed)]
+        if filters.get("min_amount") is not None:
+            floor = float(filters["min_amount"])
+            mask = [m and a >= floor for m, a in zip(mask, self.amount)]
+        return mask
+
+    def _key_column(self, key: str, rows: list[int]) -> list[Any]:
+        if key == "opportunity_stage_id":
+            return [self.stages.values[self.stage[r]] for r in rows]
+        if key == "owner_id":
+            return [self.owners.values[self.owner[r]] for r in rows]
+        if key == "account_id":
+            return [self.accounts.values[self.account[r]] for r in rows]
+        if key in ("is_won", "is_closed"):
+            column = self.is_won if key == "is_won" else self.is_closed
+            return [None if column[r] < 0 else bool(column[r]) for r in rows]
+        days = [self.closed[r] for r in rows]
+        dates = [date.fromordinal(d) if d != _NO_DATE else None for d in days]
+        if key == "closed_year":
+            return [d and d.year for d in dates]
+        if key == "closed_quarter":
+            return [d and f"{d.year}-Q{(d.month - 1) // 3 + 1}" for d in dates]
+        return [d and f"{d.year}-{d.month:02d}" for d in dates]
+
+    def query(self, group_by: Optional[list[str]] = None, filters: Optional[dict[str, Any]] = None) -> list[dict[str, Any]]:
+        """
+        Count, total and average amount of the deals matching ``filters``,
+        per combination of ``group_by`` keys (see :data:`GROUP_KEYS`), largest
+        total first.
+        """
+        group_by = group_by or []
+        unknown = set(group_by) - set(GROUP_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown group_by keys {sorted(unknown)}; expected any of {GROUP_KEYS}.")
+        with self._lock:
+            rows = list(compress(range(len(self.ids)), self._mask(filters or {})))
+            amounts = [self.amount[r] for r in rows]
+            keys = list(zip(*(self._key_column(key, rows) for key in group_by))) if group_by else [()] * len(rows)
+        counts: dict[tuple, int] = defaultdict(int)
+        totals: dict[tuple, float] = defaultdict(float)
+        for key, amount in zip(keys, amounts):
+            counts[key] += 1
+            totals[key] += amount
+        groups = [
+            {**dict(zip(group_by, key)), "count": counts[key], "amount": round(totals[key], 2), "average_amount": round(totals[key] / counts[key], 2)}
+            for key in counts
+        ]
+        return sorted(groups, key=lambda g: g["amount"], reverse=True)
+
+
+def analyze(app, table: DealTable, group_by: Optional[list[str]] = None, filters: Optional[dict[str, Any]] = None, max_age: float = 300.0, refresh: bool = False) -> dict[str, Any]:
+    """
+    Refresh ``table`` when stale (or asked to) and answer one group-by query.
+
+    Stage and owner names are resolved first, so a bad name fails before any
+    deals are fetched. A caller that finds a refresh already running waits
+    for it and uses its result instead of pulling the deals again.
+    """
+    unknown = set(group_by or []) - set(GROUP_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown group_by keys {sorted(unknown)}; expected any of {GROUP_KEYS}.")
+    filters = dict(filters or {})
+    for name, kind in (("opportunity_stage_ids", "deal_stage"), ("owner_ids", "user")):
+        if filters.get(name):
+            filters[name] = [app.reference.resolve(kind, value) for value in filters[name]]
+    refreshed = None
+    seen_at = table.refreshed_at
+    if refresh or seen_at is None or time.monotonic() - seen_at > max_age:
+        with table._refresh_lock:
+            if table.refreshed_at == seen_at:
+                refreshed = table.refresh(app)
+    started = time.perf_counter()
+    groups = table.query(group_by, filters)
+    return {
+        "groups": groups,
+        "deals": len(table),
+        "query_ms": round((time.perf_counter() - started) * 1000, 3),
+        "data_age_seconds": round(time.monotonic() - table.refreshed_at, 1),
+        "refreshed": refreshed,
+    }
@@ -1,12 +1,207 @@
-from typing import Any, Optional, List, Dict
+import threading
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from functools import cached_property, partial, wraps
+from pathlib import Path
+from typing import Any, Callable, Optional, List, Dict
+import httpx
 from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
 from loguru import logger
 
+from universal_mcp_apollo.analytics import DealTable, analyze
+from universal_mcp_apollo.cassette import Cassette
+from universal_mcp_apollo.concurrency import AdaptiveLimiter
+from universal_mcp_apollo.crawler import PostingStore, crawl_postings
+from universal_mcp_apollo.cursors import DEFAULT_CHUNK_BYTES, ResultStore
+from universal_mcp_apollo.enrollment import enroll
+from universal_mcp_apollo.export import export_search
+from universal_mcp_apollo.fanout import fan_out
+from universal_mcp_apollo.hashing import enrich_hashed_file
+from universal_mcp_apollo.importer import ImportPipeline
+from universal_mcp_apollo.jobs import DEFAULT_JOURNAL_PATH, JobJournal, JobRunner
+from universal_mcp_apollo.multisearch import multi_search
+from universal_mcp_apollo.planner import EnrichmentPlanner, PersistentPersonIndex, enrich_organizations
+from universal_mcp_apollo.profiling import Profiler, current_call
+from universal_mcp_apollo.ratelimit import FileTokenBucket, TokenBucket
+from universal_mcp_apollo.reference import ReferenceRegistry
+from universal_mcp_apollo.scheduler import BACKGROUND, PriorityScheduler
+from universal_mcp_apollo.tasks import create_tasks
+from universal_mcp_apollo.transport import DEFAULT, TransportProfile, build_client, endpoint_family, load_profiles, warm_up
+from universal_mcp_apollo.validation import compile_validators
+
+# Endpoint family of the request being sent, read by the ``client`` property.
+_active_family: ContextVar[str] = ContextVar("apollo_endpoint_family", default=DEFAULT)
+
 class ApolloApp(APIApplication):
-    def __init__(self, integration: Integration = None, **kwargs) -> None:
+    def __init__(self, integration: Integration = None, reference_refresh_interval: float = 300.0, rate_limit_per_minute: Optional[float] = None, job_journal_path: Optional[str] = None, transport_profiles: Optional[Dict[str, TransportProfile]] = None, adaptive_concurrency: bool = True, cassette: Optional[Cassette] = None, result_chunk_bytes: Optional[int] = None, rate_limit_path: Optional[str] = None, cache_path: Optional[str] = None, profiler: Optional[Profiler] = None, data_dir: Optional[str] = None, **kwargs) -> None:
         super().__init__(name='apollo', integration=integration, **kwargs)
         self.base_url = "https://api.apollo.io/api/v1"
+        self.reference = ReferenceRegistry(self, refresh_interval=reference_refresh_interval)
+        self.concurrency = AdaptiveLimiter() if adaptive_concurrency else None
+        if rate_limit_per_minute and rate_limit_path:
+            # Shared with every process using the same file, e.g. server workers.
+            bucket = FileTokenBucket(rate_limit_path, rate_limit_per_minute)
+        else:
+            bucket = TokenBucket(rate_limit_per_minute) if rate_limit_per_minute else None
+        self.scheduler = PriorityScheduler(bucket=bucket, max_inflight=self.concurrency)
+        self.job_journal_path = job_journal_path or DEFAULT_JOURNAL_PATH
+        # Every file a tool reads or writes must lie under this directory. When None, a tool
+        # given a file argument raises PermissionError; omitting the argument is still fine.
+        self.data_dir: Optional[Path] = Path(data_dir).expanduser() if data_dir else Path(self.job_journal_path).parent / "data"
+        self.enrichment_planner = EnrichmentPlanner(self, index=PersistentPersonIndex(cache_path) if cache_path else None)
+        self.transport_profiles = transport_profiles or load_profiles()
+        self.cassette = cassette
+        self.profiler = profiler
+        self.results = ResultStore(chunk_bytes=result_chunk_bytes or DEFAULT_CHUNK_BYTES)
+        self.deals = DealTable()
+        # Optional extra admission per request, taken after the scheduler's (the multi-tenant FairGate).
+        self.request_gate: Optional[Callable[[], Any]] = None
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """
+        HTTP client for the endpoint family of the request being sent. Each
+        family has its own connection pool, timeouts and protocol settings.
+        """
+        family = _active_family.get()
+        client = self._clients.get(family)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(family)
+                if client is None:
+                    profile = self.transport_profiles.get(family) or self.transport_profiles[DEFAULT]
+                    client = build_client(profile, self.base_url, self._get_headers())
+                    self._clients[family] = client
+        return client
+
+    def warm_up(self) -> None:
+        """Open keep-alive connections for every endpoint family ahead of the first tool call, at background priority."""
+        clients = {}
+        for family in self.transport_profiles:
+            token = _active_family.set(family)
+            try:
+                clients[family] = self.client
+            finally:
+                _active_family.reset(token)
+        warm_up(clients, self.transport_profiles, self.base_url, admit=partial(self.scheduler.slot, BACKGROUND))
+
+    @cached_property
+    def jobs(self) -> JobRunner:
+        """Runner for resumable bulk jobs, journaled to ``job_journal_path``."""
+        return JobRunner(self, JobJournal(self.job_journal_path), workers=self.bulk_workers)
+
+    @cached_property
+    def posting_store(self) -> PostingStore:
+        """Known job postings per organization, kept next to the job journal."""
+        return PostingStore(Path(self.job_journal_path).parent / "job_postings.sqlite3")
+
+    def _data_path(self, path: Optional[str]) -> Optional[str]:
+        """
+        Resolve a tool's file argument inside ``data_dir``. Relative paths are
+        taken from ``data_dir``; a path that resolves anywhere else (an
+        absolute path, ``..`` or a symlink leading out) is refused.
+
+        Raises:
+            PermissionError: If the path leaves ``data_dir``, or file
+                arguments are disabled.
+        """
+        if not path:
+            return path
+        if self.data_dir is None:
+            raise PermissionError("File arguments are not available on this server.")
+        root = self.data_dir.resolve()
+        resolved = (root / Path(path).expanduser()).resolve()
+        if not resolved.is_relative_to(root):
+            raise PermissionError(f"{path!r} is outside the data directory {root}.")
+        root.mkdir(parents=True, exist_ok=True)
+        return str(resolved)
+
+    @property
+    def bulk_workers(self) -> int:
+        """
+        Thread count for bulk paths. Sized to the adaptive limiter's ceiling so
+        that the limiter, not the pool, decides how many requests are in flight.
+        """
+        return self.concurrency.max_limit if self.concurrency is not None else 8
+
+    def _dispatch(self, method: str, url: str, send: Callable[[], Any], params: Optional[Dict[str, Any]] = None, data: Any = None) -> Any:
+        """
+        Single choke point for every HTTP request the tools make.
+        Requests are admitted by the priority scheduler (interactive first,
+        bulk and background with a guaranteed minimum share, in-flight count
+        capped by the adaptive concurrency limiter) before being handed off to
+        the base class transport; each outcome is fed back to the limiter.
+        With a cassette attached, the transport is swapped for recording or
+        replay, so replayed calls still exercise the whole request path.
+        """
+        if self.cassette is not None:
+            send = self.cassette.wrap(method, url, params, data, send)
+        profile = current_call.get()
+        token = _active_family.set(endpoint_family(url))
+        try:
+            if profile is not None:
+                with profile.phase("headers"):
+                    self.client
+            with self.scheduler.slot() as queued, (self.request_gate() if self.request_gate is not None else nullcontext()):
+                start = time.monotonic()
+                try:
+                    response = send()
+                except httpx.HTTPStatusError as e:
+                    self._record_outcome(start, status=e.response.status_code)
+                    if profile is not None:
+                        profile.watch(method, url, e.response, queued, time.monotonic() - start)
+                    raise
+                except httpx.TransportError:
+                    self._record_outcome(start, error=True)
+                    raise
+                finally:
+                    if profile is not None:
+                        profile.add("queueing", queued)
+                        profile.add("http", time.monotonic() - start)
+                self._record_outcome(start, status=response.status_code)
+                if profile is not None:
+                    profile.watch(method, url, response, queued, time.monotonic() - start)
+                return response
+        finally:
+            _active_family.reset(token)
+
+    def _record_outcome(self, start: float, status: Optional[int] = None, error: bool = False) -> None:
+        if self.concurrency is not None:
+            self.concurrency.record(time.monotonic() - start, status=status, error=error, family=_active_family.get())
+
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None):
+        return self._dispatch("GET", url, partial(super()._get, url, params=params), params)
+
+    def _post(self, url: str, data: Any, params: Optional[Dict[str, Any]] = None, **kwargs):
+        return self._dispatch("POST", url, partial(super()._post, url, data, params=params, **kwargs), params, data)
+
+    def _put(self, url: str, data: Any, params: Optional[Dict[str, Any]] = None, **kwargs):
+        return self._dispatch("PUT", url, partial(super()._put, url, data, params=params, **kwargs), params, data)
+
+    def _patch(self, url: str, data: Any, params: Optional[Dict[str, Any]] = None, **kwargs):
+        return self._dispatch("PATCH", url, partial(super()._patch, url, data, params=params, **kwargs), params, data)
+
+    def close(self) -> None:
+        """Stop background refreshes and release pooled HTTP connections."""
+        self.reference.stop()
+        if self.cassette is not None:
+            self.cassette.close()
+        if "jobs" in self.__dict__:
+            self.jobs.journal.close()
+        if "posting_store" in self.__dict__:
+            self.posting_store.close()
+        if isinstance(self.enrichment_planner.index, PersistentPersonIndex):
+            self.enrichment_planner.index.close()
+        if isinstance(self.scheduler.bucket, FileTokenBucket):
+            self.scheduler.bucket.close()
+        with self._clients_lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
 
     def _get_headers(self) -> Dict[str, str]:
         """
@@ -291,8 +486,8 @@ class ApolloApp(APIApplication):
         Args:
             name (string): A unique, human-readable name for the new account, such as "The Irish Copywriters."
             domain (string): The domain name for the account, entered without any prefixes like "www."; for example, use "apollo.io" or "microsoft.com".
-            owner_id (string): The unique identifier of the account owner within your team's Apollo account, required to assign ownership; retrieve valid user IDs using the Get a List of Users endpoint.
-            account_stage_id (string): Apollo ID of the account stage to assign the account to; otherwise, it defaults to your team's settings.
+            owner_id (string): The unique identifier of the account owner within your team's Apollo account, required to assign ownership; retrieve valid user IDs using the Get a List of Users endpoint. The user name or email may be given instead of the ID and is resolved locally.
+            account_stage_id (string): Apollo ID of the account stage to assign the account to; otherwise, it defaults to your team's settings. The account stage name may be given instead of the ID and is resolved locally.
             phone (string): The primary phone number for the account, which may be for headquarters, a branch, or a main contact; any format is accepted and sanitized for consistency in the response.
             raw_address (string): Corporate location for the account, including city, state, and country, matched to a pre-defined location by Apollo.
 
@@ -307,6 +502,8 @@ class ApolloApp(APIApplication):
             Accounts
         """
         request_body_data = None
+        owner_id = self.reference.resolve('user', owner_id)
+        account_stage_id = self.reference.resolve('account_stage', account_stage_id)
         url = f"{self.base_url}/accounts"
         query_params = {k: v for k, v in [('name', name), ('domain', domain), ('owner_id', owner_id), ('account_stage_id', account_stage_id), ('phone', phone), ('raw_address', raw_address)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -326,8 +523,8 @@ class ApolloApp(APIApplication):
             account_id (string): account_id
             name (string): Specify the account's human-readable name. Example: "The Fast Irish Copywriters"
             domain (string): Specify the account's domain name to update, excluding any prefixes like "www."; use only the base domain such as "example.com" or "company.org".
-            owner_id (string): The ID of the user within your Apollo team to assign as the account owner; changing this updates the account owner. Retrieve valid user IDs via the Get a List of Users endpoint.
-            account_stage_id (string): The Apollo ID of the account stage to assign or update the account's stage; omit to auto-assign based on your team's default settings. Use List Account Stages to find IDs.
+            owner_id (string): The ID of the user within your Apollo team to assign as the account owner; changing this updates the account owner. Retrieve valid user IDs via the Get a List of Users endpoint. The user name or email may be given instead of the ID and is resolved locally.
+            account_stage_id (string): The Apollo ID of the account stage to assign or update the account's stage; omit to auto-assign based on your team's default settings. Use List Account Stages to find IDs. The account stage name may be given instead of the ID and is resolved locally.
             raw_address (string): Update the corporate location for the account. Provide a city, state, and country to match our pre-defined locations. Examples: `Belfield, Dublin 4, Ireland`; `Dallas, United States`.
             phone (string): Update the account's primary phone number, which may be the corporate headquarters, a branch, or a direct contact; input in any format, sanitized and returned formatted.
 
@@ -344,6 +541,8 @@ class ApolloApp(APIApplication):
         if account_id is None:
             raise ValueError("Missing required parameter 'account_id'.")
         request_body_data = None
+        owner_id = self.reference.resolve('user', owner_id)
+        account_stage_id = self.reference.resolve('account_stage', account_stage_id)
         url = f"{self.base_url}/accounts/{account_id}"
         query_params = {k: v for k, v in [('name', name), ('domain', domain), ('owner_id', owner_id), ('account_stage_id', account_stage_id), ('raw_address', raw_address), ('phone', phone)] if v is not None}
         response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -361,7 +560,7 @@ class ApolloApp(APIApplication):
 
         Args:
             q_organization_name (string): Search for accounts by name using keywords. Matches part of the name, e.g., 'marketing' returns 'NY Marketing Unlimited'.
-            account_stage_ids_ (array): Specify Apollo IDs for account stages to include in search results. Multiple stages will match any of them.
+            account_stage_ids_ (array): Specify Apollo IDs for account stages to include in search results. Multiple stages will match any of them. Account stage names may be given instead of the IDs and is resolved locally.
             sort_by_field (string): Sort matching accounts by one of these fields: `account_last_activity_date` (most recent activity first), `account_created_at` (newest accounts first), or `account_updated_at` (most recently updated first).
             sort_ascending (boolean): Sort results in ascending order using the specified `sort_by_field`.
             page (integer): The page number of the Apollo data to retrieve, used with the `per_page` parameter to paginate search results and optimize endpoint performance; for example, `4`.
@@ -378,6 +577,8 @@ class ApolloApp(APIApplication):
             Accounts
         """
         request_body_data = None
+        if account_stage_ids_ is not None:
+            account_stage_ids_ = [self.reference.resolve('account_stage', v) for v in account_stage_ids_]
         url = f"{self.base_url}/accounts/search"
         query_params = {k: v for k, v in [('q_organization_name', q_organization_name), ('account_stage_ids[]', account_stage_ids_), ('sort_by_field', sort_by_field), ('sort_ascending', sort_ascending), ('page', page), ('per_page', per_page)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -395,7 +596,7 @@ class ApolloApp(APIApplication):
 
         Args:
             account_ids_ (array): The Apollo ID(s) of the account(s) to update; obtain these IDs by using the Search for Accounts endpoint and referencing each account’s `id` value.
-            account_stage_id (string): Specify the Apollo account stage ID to assign to accounts; find available IDs via the List Account Stages endpoint.
+            account_stage_id (string): Specify the Apollo account stage ID to assign to accounts; find available IDs via the List Account Stages endpoint. The account stage name may be given instead of the ID and is resolved locally.
 
         Returns:
             dict[str, Any]: 200
@@ -408,6 +609,7 @@ class ApolloApp(APIApplication):
             Accounts
         """
         request_body_data = None
+        account_stage_id = self.reference.resolve('account_stage', account_stage_id)
         url = f"{self.base_url}/accounts/bulk_update"
         query_params = {k: v for k, v in [('account_ids[]', account_ids_), ('account_stage_id', account_stage_id)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -425,7 +627,7 @@ class ApolloApp(APIApplication):
 
         Args:
             account_ids_ (array): The Apollo IDs of the accounts to assign new owners; obtain these IDs by using the Search for Accounts endpoint and referencing each account's `id` value.
-            owner_id (string): The owner_id is the unique identifier of the user in your Apollo team who will be assigned as the owner of the specified accounts; retrieve user IDs via the Get a List of Users endpoint.
+            owner_id (string): The owner_id is the unique identifier of the user in your Apollo team who will be assigned as the owner of the specified accounts; retrieve user IDs via the Get a List of Users endpoint. The user name or email may be given instead of the ID and is resolved locally.
 
         Returns:
             dict[str, Any]: 200
@@ -438,6 +640,7 @@ class ApolloApp(APIApplication):
             Accounts
         """
         request_body_data = None
+        owner_id = self.reference.resolve('user', owner_id)
         url = f"{self.base_url}/accounts/update_owners"
         query_params = {k: v for k, v in [('account_ids[]', account_ids_), ('owner_id', owner_id)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -487,7 +690,7 @@ class ApolloApp(APIApplication):
             email (string): String: The email address of the contact; must be a valid, properly formatted email, e.g., example@email.com.
             website_url (string): The full corporate website URL of the contact's current employer, including the domain (e.g., .com), without any subdirectories or social media links, to ensure accurate data enrichment.
             label_names_ (array): Add contact to existing or new lists using any list name; unmatched names create new lists automatically. Example: "2024 big marketing conference attendees".
-            contact_stage_id (string): Specify the Apollo contact stage ID to assign the contact; if omitted, Apollo will assign a default stage per your settings. Example: 6095a710bd01d100a506d4ae
+            contact_stage_id (string): Specify the Apollo contact stage ID to assign the contact; if omitted, Apollo will assign a default stage per your settings. Example: 6095a710bd01d100a506d4ae. The contact stage name may be given instead of the ID and is resolved locally.
             present_raw_address (string): The contact's personal location, which can include city, state, and country, matched to the closest predefined location for accurate identification (e.g., "Atlanta, United States").
             direct_phone (string): Primary phone number for the contact. Enter in any format; Apollo sanitizes it. Examples: `555-303-1234`, `+44 7911 123456`.
             corporate_phone (string): The direct work/office phone number for the contact (not the headquarters), which is sanitized and can be provided in any format; examples: 555-303-1234 or +44 7911 123456.
@@ -506,6 +709,7 @@ class ApolloApp(APIApplication):
             Contacts, important
         """
         request_body_data = None
+        contact_stage_id = self.reference.resolve('contact_stage', contact_stage_id)
         url = f"{self.base_url}/contacts"
         query_params = {k: v for k, v in [('first_name', first_name), ('last_name', last_name), ('organization_name', organization_name), ('title', title), ('account_id', account_id), ('email', email), ('website_url', website_url), ('label_names[]', label_names_), ('contact_stage_id', contact_stage_id), ('present_raw_address', present_raw_address), ('direct_phone', direct_phone), ('corporate_phone', corporate_phone), ('mobile_phone', mobile_phone), ('home_phone', home_phone), ('other_phone', other_phone)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -531,7 +735,7 @@ class ApolloApp(APIApplication):
             email (string): Update the contact's email address with a valid, unique email string (e.g., example@email.com); duplicate emails will cause an error response.
             website_url (string): Update the full corporate website URL for the contact’s current employer, including the domain (e.g., .com) but excluding any subdirectories or social media links like LinkedIn, to ensure accurate data enrichment.
             label_names_ (array): Update lists the contact belongs to in your Apollo account. If a list does not exist, Apollo creates it. Adding lists removes existing ones unless they are included again.
-            contact_stage_id (string): Specifies the Apollo contact stage ID; use this to assign or update the contact stage, available via List Contact Stages. Example: 6095a710bd01d100a506d4af.
+            contact_stage_id (string): Specifies the Apollo contact stage ID; use this to assign or update the contact stage, available via List Contact Stages. Example: 6095a710bd01d100a506d4af. The contact stage name may be given instead of the ID and is resolved locally.
             present_raw_address (string): Set the contact's location by providing a city, state, and country, which will be matched to a predefined location.
             direct_phone (string): Update the contact's primary phone number in any format; Apollo automatically sanitizes and standardizes the number, which is returned in the response for confirmation.
             corporate_phone (string): Update the direct office phone number for the contact at their employer; Apollo sanitizes all formats and the cleaned number appears in the response.
@@ -552,6 +756,7 @@ class ApolloApp(APIApplication):
         if contact_id is None:
             raise ValueError("Missing required parameter 'contact_id'.")
         request_body_data = None
+        contact_stage_id = self.reference.resolve('contact_stage', contact_stage_id)
         url = f"{self.base_url}/contacts/{contact_id}"
         query_params = {k: v for k, v in [('first_name', first_name), ('last_name', last_name), ('organization_name', organization_name), ('title', title), ('account_id', account_id), ('email', email), ('website_url', website_url), ('label_names[]', label_names_), ('contact_stage_id', contact_stage_id), ('present_raw_address', present_raw_address), ('direct_phone', direct_phone), ('corporate_phone', corporate_phone), ('mobile_phone', mobile_phone), ('home_phone', home_phone), ('other_phone', other_phone)] if v is not None}
         response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -569,7 +774,7 @@ class ApolloApp(APIApplication):
 
         Args:
             q_keywords (string): Narrow search results by adding keywords such as names, job titles, companies, or email addresses.
-            contact_stage_ids_ (array): The Apollo IDs of the contact stages to include in the search; multiple IDs return contacts matching any listed stage combined with other search filters.
+            contact_stage_ids_ (array): The Apollo IDs of the contact stages to include in the search; multiple IDs return contacts matching any listed stage combined with other search filters. Contact stage names may be given instead of the IDs and is resolved locally.
             sort_by_field (string): Specify which field to sort results by: contact_last_activity_date, contact_email_last_opened_at, contact_email_last_clicked_at, contact_created_at, or contact_updated_at.
             sort_ascending (boolean): Set to `true` to sort matching contacts in ascending order, but only if the `sort_by_field` parameter is specified; otherwise, sorting is ignored.
             per_page (integer): Specifies the number of results to return per page, enhancing search result navigation and performance.
@@ -586,6 +791,8 @@ class ApolloApp(APIApplication):
             Contacts, important
         """
         request_body_data = None
+        if contact_stage_ids_ is not None:
+            contact_stage_ids_ = [self.reference.resolve('contact_stage', v) for v in contact_stage_ids_]
         url = f"{self.base_url}/contacts/search"
         query_params = {k: v for k, v in [('q_keywords', q_keywords), ('contact_stage_ids[]', contact_stage_ids_), ('sort_by_field', sort_by_field), ('sort_ascending', sort_ascending), ('per_page', per_page), ('page', page)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -603,7 +810,7 @@ class ApolloApp(APIApplication):
 
         Args:
             contact_ids_ (array): The Apollo contact IDs to update, provided as an array of strings; obtain these IDs from the Search for Contacts endpoint's `id` field. Example: `66e34b81740c50074e3d1bd4`
-            contact_stage_id (string): The Apollo ID of the contact stage to assign to contacts; retrieve valid IDs via the List Contact Stages endpoint. Example: `6095a710bd01d100a506d4af`.
+            contact_stage_id (string): The Apollo ID of the contact stage to assign to contacts; retrieve valid IDs via the List Contact Stages endpoint. Example: `6095a710bd01d100a506d4af`. The contact stage name may be given instead of the ID and is resolved locally.
 
         Returns:
             dict[str, Any]: 200
@@ -616,6 +823,7 @@ class ApolloApp(APIApplication):
             Contacts
         """
         request_body_data = None
+        contact_stage_id = self.reference.resolve('contact_stage', contact_stage_id)
         url = f"{self.base_url}/contacts/update_stages"
         query_params = {k: v for k, v in [('contact_ids[]', contact_ids_), ('contact_stage_id', contact_stage_id)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -633,7 +841,7 @@ class ApolloApp(APIApplication):
 
         Args:
             contact_ids_ (array): The Apollo contact IDs to update ownership for; provide one or more IDs obtained from the Search for Contacts endpoint to assign new owners.
-            owner_id (string): Specifies the Apollo account user ID to assign as owner for the contacts; find user IDs via the Get List of Users endpoint. Example: 66302798d03b9601c7934ebf.
+            owner_id (string): Specifies the Apollo account user ID to assign as owner for the contacts; find user IDs via the Get List of Users endpoint. Example: 66302798d03b9601c7934ebf. The user name or email may be given instead of the ID and is resolved locally.
 
         Returns:
             dict[str, Any]: 200
@@ -646,6 +854,7 @@ class ApolloApp(APIApplication):
             Contacts
         """
         request_body_data = None
+        owner_id = self.reference.resolve('user', owner_id)
         url = f"{self.base_url}/contacts/update_owners"
         query_params = {k: v for k, v in [('contact_ids[]', contact_ids_), ('owner_id', owner_id)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -688,10 +897,10 @@ class ApolloApp(APIApplication):
 
         Args:
             name (string): Specify a short, descriptive, human-readable name for the opportunity or deal being created, such as "Massive Q3 Deal."
-            owner_id (string): Specify the unique Apollo user ID (found via Get Users endpoint) responsible for the opportunity as the deal owner.
+            owner_id (string): Specify the unique Apollo user ID (found via Get Users endpoint) responsible for the opportunity as the deal owner. The user name or email may be given instead of the ID and is resolved locally.
             account_id (string): The unique Apollo account ID for the company targeted in this deal; retrieve via Organization Search as organization_id—example: 5e66b6381e05b4008c8331b8.
             amount (string): The monetary value of the deal to create, entered as a numeric amount without commas or currency symbols; the currency is set automatically from your Apollo account settings.
-            opportunity_stage_id (string): The unique identifier for the deal stage in your team's Apollo account; use the List Deal Stages endpoint to retrieve valid IDs for this parameter.
+            opportunity_stage_id (string): The unique identifier for the deal stage in your team's Apollo account; use the List Deal Stages endpoint to retrieve valid IDs for this parameter. The deal stage name may be given instead of the ID and is resolved locally.
             closed_date (string): The estimated close date for the deal, in YYYY-MM-DD format.
 
         Returns:
@@ -705,6 +914,8 @@ class ApolloApp(APIApplication):
             Deals
         """
         request_body_data = None
+        owner_id = self.reference.resolve('user', owner_id)
+        opportunity_stage_id = self.reference.resolve('deal_stage', opportunity_stage_id)
         url = f"{self.base_url}/opportunities"
         query_params = {k: v for k, v in [('name', name), ('owner_id', owner_id), ('account_id', account_id), ('amount', amount), ('opportunity_stage_id', opportunity_stage_id), ('closed_date', closed_date)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -752,10 +963,10 @@ class ApolloApp(APIApplication):
 
         Args:
             opportunity_id (string): opportunity_id
-            owner_id (string): The ID of the user within your Apollo team to assign as the new owner of the deal; use the List Users endpoint to find valid user IDs.
+            owner_id (string): The ID of the user within your Apollo team to assign as the new owner of the deal; use the List Users endpoint to find valid user IDs. The user name or email may be given instead of the ID and is resolved locally.
             name (string): Update the deal’s name with a clear, human-readable title that identifies the opportunity, such as "Massive Q3 Deal."
             amount (string): The monetary value of the deal to update; enter a numeric value without commas or currency symbols—currency is set by your Apollo account settings. Example: 55123478 represents $55,123,478 if USD.
-            opportunity_stage_id (string): Unique ID of the deal stage to update an opportunity's status. Replace with a different ID to change the stage.
+            opportunity_stage_id (string): Unique ID of the deal stage to update an opportunity's status. Replace with a different ID to change the stage. The deal stage name may be given instead of the ID and is resolved locally.
             closed_date (string): Update the estimated close date for the opportunity, which can be any past or future date, formatted as YYYY-MM-DD (e.g., 2025-10-30).
             is_closed (boolean): Set to true to mark the opportunity as closed, or omit/use false to keep it open.
             is_won (boolean): Set this parameter to `true` in the query to mark the opportunity as won and update the deal status accordingly.
@@ -775,6 +986,8 @@ class ApolloApp(APIApplication):
         if opportunity_id is None:
             raise ValueError("Missing required parameter 'opportunity_id'.")
         request_body_data = None
+        owner_id = self.reference.resolve('user', owner_id)
+        opportunity_stage_id = self.reference.resolve('deal_stage', opportunity_stage_id)
         url = f"{self.base_url}/opportunities/{opportunity_id}"
         query_params = {k: v for k, v in [('owner_id', owner_id), ('name', name), ('amount', amount), ('opportunity_stage_id', opportunity_stage_id), ('closed_date', closed_date), ('is_closed', is_closed), ('is_won', is_won), ('source', source), ('account_id', account_id)] if v is not None}
         response = self._patch(url, data=request_body_data, params=query_params)
@@ -819,13 +1032,13 @@ class ApolloApp(APIApplication):
             sequence_id (string): sequence_id
             emailer_campaign_id (string): The emailer_campaign_id query parameter must match the sequence_id path parameter and represents the unique identifier of the email campaign to which contacts are being added.
             contact_ids_ (array): Apollo IDs of contacts to add to the sequence. Use the Search for Contacts endpoint to find IDs.
-            send_email_from_email_account_id (string): The Apollo ID of the email account used to send emails to contacts added to the sequence; obtain this ID from the Get a List of Email Accounts endpoint.
+            send_email_from_email_account_id (string): The Apollo ID of the email account used to send emails to contacts added to the sequence; obtain this ID from the Get a List of Email Accounts endpoint. The email address of the email account may be given instead of the ID and is resolved locally.
             sequence_no_email (boolean): Add contacts to the sequence even if they lack an email address by setting this to `true`.
             sequence_unverified_email (boolean): Indicates whether to allow adding contacts with unverified email addresses to the sequence.
             sequence_job_change (boolean): Set to `true` to add contacts to the email sequence even if they have recently changed jobs, overriding any default restrictions on re-adding such contacts.
             sequence_active_in_other_campaigns (boolean): When true, allows adding contacts even if they are already in other sequences, regardless of those sequences’ status (active or paused).
             sequence_finished_in_other_campaigns (boolean): Set to `true` to add contacts to this sequence even if they have completed a different sequence and are marked as finished there.
-            user_id (string): The user_id query parameter specifies the ID of the Apollo team user performing the action to add contacts to a sequence, which appears in the sequence's activity log to identify who added the contacts.
+            user_id (string): The user_id query parameter specifies the ID of the Apollo team user performing the action to add contacts to a sequence, which appears in the sequence's activity log to identify who added the contacts. The user name or email may be given instead of the ID and is resolved locally.
 
         Returns:
             dict[str, Any]: 200
@@ -840,6 +1053,8 @@ class ApolloApp(APIApplication):
         if sequence_id is None:
             raise ValueError("Missing required parameter 'sequence_id'.")
         request_body_data = None
+        send_email_from_email_account_id = self.reference.resolve('email_account', send_email_from_email_account_id)
+        user_id = self.reference.resolve('user', user_id)
         url = f"{self.base_url}/emailer_campaigns/{sequence_id}/add_contact_ids"
         query_params = {k: v for k, v in [('emailer_campaign_id', emailer_campaign_id), ('contact_ids[]', contact_ids_), ('send_email_from_email_account_id', send_email_from_email_account_id), ('sequence_no_email', sequence_no_email), ('sequence_unverified_email', sequence_unverified_email), ('sequence_job_change', sequence_job_change), ('sequence_active_in_other_campaigns', sequence_active_in_other_campaigns), ('sequence_finished_in_other_campaigns', sequence_finished_in_other_campaigns), ('user_id', user_id)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -887,7 +1102,7 @@ class ApolloApp(APIApplication):
         Creates multiple tasks in bulk with specified user, contact IDs, priority, due date, type, status, and optional note parameters.
 
         Args:
-            user_id (string): The user_id query parameter specifies the unique identifier of the Apollo team member who will own and take action on the created tasks; retrieve user IDs from the Get a List of Users endpoint.
+            user_id (string): The user_id query parameter specifies the unique identifier of the Apollo team member who will own and take action on the created tasks; retrieve user IDs from the Get a List of Users endpoint. The user name or email may be given instead of the ID and is resolved locally.
             contact_ids_ (array): Apollo IDs of contacts to receive the action; multiple IDs create separate tasks with the same details.
             priority (string): Specify the priority level for each task being created in bulk; valid values are "high," "medium," or "low" to indicate urgency.
             due_at (string): The full date and time when the task is due, in ISO 8601 format. Use GMT by default or specify a time zone offset (e.g., `2025-02-15T08:10:30Z`, `2025-03-25T10:15:30+05:00`).
@@ -906,6 +1121,7 @@ class ApolloApp(APIApplication):
             Tasks
         """
         request_body_data = None
+        user_id = self.reference.resolve('user', user_id)
         url = f"{self.base_url}/tasks/bulk_create"
         query_params = {k: v for k, v in [('user_id', user_id), ('contact_ids[]', contact_ids_), ('priority', priority), ('due_at', due_at), ('type', type), ('status', status), ('note', note)] if v is not None}
         response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
@@ -917,6 +1133,27 @@ class ApolloApp(APIApplication):
         except ValueError:
             return None
 
+    def create_tasks_in_bulk(self, tasks: List[dict[str, Any]], template: Optional[dict[str, Any]] = None, path: Optional[str] = None, workers: Optional[int] = None) -> dict[str, Any]:
+        """
+        Creates many tasks with differing owners, types, priorities, due dates, statuses and notes in the fewest `create_task` calls: tasks that share all of those are grouped into one bulk call (split every 100 contacts), and the calls run concurrently. A note with `{field}` placeholders is personalized per contact and so costs one call per contact. Invalid tasks are rejected locally before anything is sent.
+
+        Args:
+            tasks (array): One object per task or group of tasks with `contact_id` or `contact_ids`, plus any of `user_id` (ID, name or email), `priority`, `due_at`, `type`, `status` and `note` not given in `template`. The note may contain `{field}` placeholders filled from the cached contact record, e.g. `"Call {first_name} about {title}"`.
+            template (object): Fields shared by every task unless the task sets them, e.g. `{"user_id": "...", "type": "call", "status": "scheduled", "priority": "medium"}`.
+            path (string): Write the per-contact outcome table to this CSV file in the server's data directory instead of returning it.
+            workers (integer): Maximum number of bulk calls in flight; defaults to 8.
+
+        Returns:
+            dict[str, Any]: Counts of tasks created, unconfirmed (sent and accepted, but Apollo's response did not list them), duplicate, invalid and failed, the number of groups and API calls (and of those, calls made for a single personalized note), the created task IDs per contact ID, and one outcome row per contact and task (or the CSV path).
+
+        Raises:
+            ValueError: Raised when `workers` is not positive.
+
+        Tags:
+            Tasks
+        """
+        return create_tasks(self, tasks, template=template, path=self._data_path(path), workers=8 if workers is None else workers)
+
     def search_tasks(self, sort_by_field: Optional[str] = None, open_factor_names_: Optional[List[str]] = None, page: Optional[int] = None, per_page: Optional[int] = None) -> dict[str, Any]:
         """
         Searches for tasks using specified parameters and returns a paginated list of results, allowing users to sort by a field and filter by open factor names.
@@ -1108,7 +1345,417 @@ class ApolloApp(APIApplication):
         except ValueError:
             return None                
 
+    def enrich_people_with_cache(self, details: List[dict[str, Any]], reveal_personal_emails: Optional[bool] = None, reveal_phone_number: Optional[bool] = None, webhook_url: Optional[str] = None) -> dict[str, Any]:
+        """
+        Enriches any number of people while spending credits only on records not already held locally, matching inputs against cached enrichments and synced contacts by Apollo `id`, email, hashed_email or linkedin_url.
+
+        Args:
+            details (array): One object per person to enrich, with the same fields as `people_enrichment` (e.g. `email`, `hashed_email`, `linkedin_url`, `id`, `first_name`, `last_name`, `domain`). There is no limit on the number of people; unknown records are sent to Apollo in batches of 10.
+            reveal_personal_emails (boolean): Set to true to require personal emails; cached records without them are re-enriched, consuming credits.
+            reveal_phone_number (boolean): Set to true to require phone numbers; cached records without them are re-enriched, consuming credits. Requires a `webhook_url`.
+            webhook_url (string): Webhook URL for asynchronous phone number delivery when `reveal_phone_number` is true.
+
+        Returns:
+            dict[str, Any]: `matches` aligned with `details` (null where Apollo found no match) and a `report` with the number of records served from cache, sent to the API, API calls made, and credits consumed and saved.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+
+        Tags:
+            People
+        """
+        return self.enrichment_planner.enrich(details, reveal_personal_emails=reveal_personal_emails, reveal_phone_number=reveal_phone_number, webhook_url=webhook_url)
+
+    def enrich_organizations_deduped(self, inputs: List[str]) -> dict[str, Any]:
+        """
+        Enriches any number of companies given as domains, website URLs or names, normalizing and deduplicating them first so variants such as "www.Acme.com/", "https://acme.com" and "acme.com" are enriched once.
+
+        Args:
+            inputs (array): Company domains, website URLs or names. Names carry no domain and cannot be enriched; variants such as "ACME Inc" and "Acme, Inc." still fold together.
+
+        Returns:
+            dict[str, Any]: `organizations` aligned with `inputs` (null where the company could not be enriched) and a `report` with the number of unique companies, API calls made and credits saved.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+
+        Tags:
+            Organizations
+        """
+        return enrich_organizations(self, inputs)
+
+    def enrich_hashed_email_file(self, path: str, output_path: str, column: Optional[str] = None, algorithm: Optional[str] = None) -> dict[str, Any]:
+        """
+        Hashes an email column of a local CSV or NDJSON file across all CPU cores and enriches the distinct hashes through the credit-saving enrichment planner, so raw email addresses are never sent to Apollo.
+
+        Args:
+            path (string): Input file path, relative to the server's data directory.
+            output_path (string): NDJSON file in the server's data directory receiving one line per input row with its match; a `.lookup.csv` reverse-lookup table from row to hash is written alongside it.
+            column (string): Name of the email column; defaults to `email`.
+            algorithm (string): `sha256` (default) or `md5`.
+
+        Returns:
+            dict[str, Any]: Rows processed, invalid emails, records served from cache or sent to the API, credits saved, and the output path.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            ValueError: Raised when the algorithm is not supported.
+
+        Tags:
+            People
+        """
+        return enrich_hashed_file(self.enrichment_planner, self._data_path(path), self._data_path(output_path), column=column or "email", algorithm=algorithm or "sha256")
+
+    def sync_enrichment_cache(self, max_pages: Optional[int] = None) -> dict[str, Any]:
+        """
+        Loads the team's existing contacts into the local enrichment cache so that `enrich_people_with_cache` can skip people already held.
+
+        Args:
+            max_pages (integer): Stop after this many pages of 100 contacts; omit to load every contact.
+
+        Returns:
+            dict[str, Any]: The number of contacts loaded and the cumulative enrichment savings so far.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+
+        Tags:
+            People
+        """
+        loaded = self.enrichment_planner.sync_contacts(max_pages=max_pages)
+        return {"contacts_loaded": loaded, "totals": dict(self.enrichment_planner.totals)}
+
+    def export_search_results(self, tool: str, path: str, format: Optional[str] = None, filters: Optional[dict[str, Any]] = None, per_page: Optional[int] = None, max_pages: Optional[int] = None) -> dict[str, Any]:
+        """
+        Streams every page of a search tool's results into a local file as the pages arrive, so memory use does not grow with the result size.
+
+        Args:
+            tool (string): The search tool to page through: `people_search`, `organization_search`, `search_for_contacts`, `search_for_accounts`, `list_all_deals`, `search_tasks` or `search_for_sequences`.
+            path (string): Output file path, relative to the server's data directory.
+            format (string): `ndjson` (default), `csv` (nested fields flattened to dotted columns), `parquet` or `arrow` (columnar, written in bounded row groups; requires pyarrow). For csv, parquet and arrow the columns come from the first page or row group; fields first seen later are dropped and listed in the result's `warnings`.
+            filters (object): Arguments passed to the search tool on every page, e.g. `{"person_titles_": ["cto"], "person_locations_": ["Berlin"]}`.
+            per_page (integer): Records requested per page; defaults to 100.
+            max_pages (integer): Stop after this many pages; omit to export every page.
+
+        Returns:
+            dict[str, Any]: The output path and format, the number of records and pages written, the file size in bytes and the elapsed seconds, plus `warnings` naming any fields dropped or values written as null to fit the columns.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            ValueError: Raised when the tool or format is not supported.
+
+        Tags:
+            Export
+        """
+        return export_search(self, tool, self._data_path(path), format=format or "ndjson", filters=filters, per_page=per_page or 100, max_pages=max_pages)
+
+    def import_records(self, path: str, target: Optional[str] = None, format: Optional[str] = None, workers: Optional[int] = None) -> dict[str, Any]:
+        """
+        Imports a CSV or NDJSON file of leads into Apollo contacts or accounts, streaming the file in constant memory, canonicalizing emails, domains and phone numbers, skipping invalid and duplicate rows, and creating records concurrently.
+
+        Args:
+            path (string): Input file path, relative to the server's data directory. Columns are named after the `create_a_contact` or `create_an_account` parameters (use `label_names` with `;`-separated list names); other columns are ignored.
+            target (string): `contacts` (default) or `accounts`.
+            format (string): `csv` or `ndjson`; inferred from the file extension when omitted.
+            workers (integer): Maximum number of records created concurrently; by default the adaptive concurrency limiter finds the highest safe rate.
+
+        Returns:
+            dict[str, Any]: Rows read, invalid, duplicate, created and failed, elapsed seconds and throughput, plus the first errors with their row numbers.
+
+        Raises:
+            ValueError: Raised when `target` is not supported.
+
+        Tags:
+            Import
+        """
+        pipeline = ImportPipeline(self, target=target or "contacts", workers=workers or self.bulk_workers)
+        return pipeline.run_file(self._data_path(path), format=format)
+
+    def multi_people_search(self, queries: Optional[List[dict[str, Any]]] = None, grid: Optional[dict[str, List[Any]]] = None, filters: Optional[dict[str, Any]] = None, per_page: Optional[int] = None, max_pages: Optional[int] = None, max_results: Optional[int] = None, path: Optional[str] = None) -> dict[str, Any]:
+        """
+        Runs several people searches concurrently and returns the union of their results with duplicates removed by person ID, each person tagged with the query that first matched it.
+
+        Args:
+            queries (array): Filter sets, each an object of `people_search` arguments, e.g. `[{"person_titles_": ["cto"]}, {"q_keywords": "platform engineering"}]`.
+            grid (object): Alternatives per `people_search` argument; one search is run for every combination, e.g. `{"person_titles_": ["cto", "vp engineering"], "person_locations_": ["Berlin", "Paris"]}` runs four searches. Combinations are generated lazily, so large grids are fine.
+            filters (object): Arguments shared by every query and grid combination.
+            per_page (integer): Results requested per page; defaults to 100.
+            max_pages (integer): Pages fetched per query; defaults to 1.
+            max_results (integer): Stop once this many unique people have been collected.
+            path (string): Stream the unique people to this NDJSON file in the server's data directory instead of returning them.
+
+        Returns:
+            dict[str, Any]: The unique people (or the output `path`), each with `matched_query`, the index of the first query that returned it (explicit `queries` come before grid combinations), plus per-query filters and counts of records, new records and pages, and the total number of duplicates removed.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            ValueError: Raised when neither `queries` nor `grid` is given, or a filter is not a `people_search` argument.
+
+        Tags:
+            People
+        """
+        return multi_search(self, queries=queries, grid=grid, filters=filters, per_page=per_page or 100, max_pages=max_pages or 1, max_results=max_results, path=self._data_path(path))
+
+    def find_people_at_organizations(self, organization_filters: Optional[dict[str, Any]] = None, people_filters: Optional[dict[str, Any]] = None, max_organization_pages: Optional[int] = None, people_pages: Optional[int] = None, enrich: Optional[bool] = None, include_job_postings: Optional[bool] = None, reveal_personal_emails: Optional[bool] = None, max_people: Optional[int] = None, path: Optional[str] = None) -> dict[str, Any]:
+        """
+        Finds organizations, the people who work there and their enriched profiles in one pipelined run: organization search, people search (ten organizations per call), bulk enrichment and optionally job postings all run at the same time, connected by bounded queues.
+
+        Args:
+            organization_filters (object): `organization_search` arguments selecting the organizations, e.g. `{"organization_locations_": ["Berlin"], "organization_num_employees_ranges_": ["50,200"]}`.
+            people_filters (object): `people_search` arguments applied within those organizations, e.g. `{"person_titles_": ["cto"]}`.
+            max_organization_pages (integer): Organization result pages to process; defaults to 1.
+            people_pages (integer): People result pages per people search; defaults to 1.
+            enrich (boolean): Enrich the people found (through the local enrichment cache, so known people cost no credits); defaults to true.
+            include_job_postings (boolean): Also fetch each organization's job postings; defaults to false.
+            reveal_personal_emails (boolean): Passed to the enrichment calls.
+            max_people (integer): Stop once this many people have been produced.
+            path (string): Stream results to this NDJSON file in the server's data directory instead of returning them.
+
+        Returns:
+            dict[str, Any]: The people (each with an `enriched` flag) and job postings found, or the output `path`, plus the elapsed seconds and per-stage counts and busy time.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+
+        Tags:
+            People, Organizations
+        """
+        return fan_out(
+            self,
+            path=self._data_path(path),
+            max_people=max_people,
+            organization_filters=organization_filters,
+            people_filters=people_filters,
+            max_organization_pages=max_organization_pages or 1,
+            people_pages=people_pages or 1,
+            enrich=enrich is not False,
+            include_job_postings=bool(include_job_postings),
+            reveal_personal_emails=reveal_personal_emails,
+        )
+
+    def track_job_postings(self, organization_ids: List[str], path: Optional[str] = None, per_page: Optional[int] = None, workers: Optional[int] = None) -> dict[str, Any]:
+        """
+        Crawls the job postings of many organizations concurrently and reports only what changed since the last crawl: postings added and postings removed. Organizations whose first page and posting count are unchanged cost a single request, and paging stops at the first already-known posting whenever the counts show nothing was removed.
+
+        Args:
+            organization_ids (array): Apollo organization IDs to crawl.
+            path (string): Write one NDJSON line per change to this file in the server's data directory instead of returning the changes.
+            per_page (integer): Postings requested per page; defaults to 100.
+            workers (integer): Organizations crawled concurrently; by default the adaptive concurrency limiter finds the highest safe rate.
+
+        Returns:
+            dict[str, Any]: Counts of organizations crawled, unchanged, changed and crawled for the first time, postings added and removed, pages fetched, failures and elapsed seconds, plus the changes (each with `organization_id`, `change` and the `posting` or `posting_id`) or the output `path`. The first crawl of an organization records its postings without reporting them as changes.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+
+        Tags:
+            Organizations
+        """
+        return crawl_postings(self, self.posting_store, organization_ids, path=self._data_path(path), per_page=per_page or 100, workers=workers or self.bulk_workers)
+
+    def enroll_contacts_in_sequences(self, enrollments: List[dict[str, Any]], path: Optional[str] = None, preflight: Optional[bool] = None, workers: Optional[int] = None) -> dict[str, Any]:
+        """
+        Adds large numbers of contacts to one or more sequences. Contacts that Apollo would skip (no email, an unverified, unavailable or bounced email, already active or finished in another sequence, already in this one) are filtered out locally using the cached contact data, the rest are sent in chunks of 100 concurrently across sequences and mailboxes, and every contact gets an outcome.
+
+        Args:
+            enrollments (array): One object per sequence and mailbox with `sequence_id`, `contact_ids` and `send_email_from_email_account_id` (ID or email address), plus optionally `user_id` and the `add_contacts_to_sequence` flags `sequence_no_email`, `sequence_unverified_email`, `sequence_job_change`, `sequence_active_in_other_campaigns` and `sequence_finished_in_other_campaigns`.
+            path (string): Write the outcome table to this CSV file in the server's data directory instead of returning it.
+            preflight (boolean): Filter contacts locally before sending; defaults to true. Contacts missing from the local cache are always sent (run `sync_enrichment_cache` first to fill it).
+            workers (integer): Chunks sent concurrently; by default the adaptive concurrency limiter finds the highest safe rate.
+
+        Returns:
+            dict[str, Any]: Counts of contacts added, filtered locally, rejected by Apollo and failed, the number of API calls and elapsed seconds, plus one outcome row per contact and sequence (`contact_id`, `sequence_id`, `outcome`, `reason`) or the output `path`.
+
+        Raises:
+            ValueError: Raised when an enrollment is missing a required field or has an unknown one.
+
+        Tags:
+            Contacts
+        """
+        return enroll(self, enrollments, path=self._data_path(path), check=preflight is not False, workers=workers or self.bulk_workers)
+
+    def analyze_deals(self, group_by: Optional[List[str]] = None, opportunity_stage_ids: Optional[List[str]] = None, owner_ids: Optional[List[str]] = None, is_won: Optional[bool] = None, is_closed: Optional[bool] = None, closed_from: Optional[str] = None, closed_to: Optional[str] = None, min_amount: Optional[float] = None, refresh: Optional[bool] = None, max_age_seconds: Optional[float] = None) -> dict[str, Any]:
+        """
+        Answers pipeline questions such as "open pipeline by stage and owner" or "won amount this quarter" from a local copy of all deals, returning deal counts and total and average amounts per group in milliseconds instead of paging through the deals endpoint.
+
+        Args:
+            group_by (array): Keys to group by, any of `opportunity_stage_id`, `owner_id`, `account_id`, `is_won`, `is_closed`, `closed_year`, `closed_quarter` and `closed_month`; omit for a single total.
+            opportunity_stage_ids (array): Only deals in these stages (IDs or stage names, resolved locally).
+            owner_ids (array): Only deals owned by these users (IDs, names or emails, resolved locally).
+            is_won (boolean): Only won (`true`) or not won (`false`) deals.
+            is_closed (boolean): Only closed (`true`) or open (`false`) deals.
+            closed_from (string): Only deals with a closed date on or after this date (YYYY-MM-DD).
+            closed_to (string): Only deals with a closed date on or before this date (YYYY-MM-DD).
+            min_amount (number): Only deals of at least this amount.
+            refresh (boolean): Reload the deals from Apollo before answering.
+            max_age_seconds (number): Reload automatically when the local copy is older than this; defaults to 300.
+
+        Returns:
+            dict[str, Any]: The groups (their keys plus `count`, `amount` and `average_amount`, largest amount first), the number of deals held, query time in milliseconds, age of the data in seconds, and refresh statistics when a reload happened.
+
+        Raises:
+            HTTPError: Raised when reloading the deals fails.
+            ValueError: Raised when a `group_by` key is unknown or a stage or owner name matches nothing.
+
+        Tags:
+            Deals
+        """
+        filters = {
+            "opportunity_stage_ids": opportunity_stage_ids,
+            "owner_ids": owner_ids,
+            "is_won": is_won,
+            "is_closed": is_closed,
+            "closed_from": closed_from,
+            "closed_to": closed_to,
+            "min_amount": min_amount,
+        }
+        return analyze(self, self.deals, group_by=group_by, filters=filters, max_age=max_age_seconds if max_age_seconds is not None else 300.0, refresh=bool(refresh))
+
+    def start_bulk_job(self, kind: str, items: List[Any], options: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """
+        Starts a resumable bulk job that sends items to Apollo in chunks, journaling each chunk to local disk so a restart resumes from the last checkpoint without re-sending completed work.
+
+        Args:
+            kind (string): The operation to run: `bulk_people_enrichment` (items are person detail objects), `bulk_organization_enrichment` (items are domains), `add_contacts_to_sequence`, `update_contact_stage` or `update_contact_ownership` (items are contact IDs).
+            items (array): The records to process; they are split into chunks of the largest size the endpoint accepts.
+            options (object): Remaining arguments of the underlying tool shared by every chunk, e.g. `{"sequence_id": "...", "emailer_campaign_id": "...", "send_email_from_email_account_id": "..."}` for `add_contacts_to_sequence`.
+
+        Returns:
+            dict[str, Any]: The initial progress report of the job, including its `id`.
+
+        Raises:
+            ValueError: Raised when `kind` is not a supported job kind.
+
+        Tags:
+            Jobs
+        """
+        job_id = self.jobs.submit(kind, items, **(options or {}))
+        return self.jobs.progress(job_id)[0]
+
+    def get_bulk_job_progress(self, job_id: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        Reports the progress of resumable bulk jobs, including how many chunks and items are pending, done, failed, or in an unknown state (possibly applied by Apollo, after a crash, timeout or dropped connection) and therefore never re-sent automatically.
+
+        Args:
+            job_id (string): The ID returned by `start_bulk_job`; omit to report on every journaled job.
+
+        Returns:
+            list[dict[str, Any]]: One progress report per job with its kind, status, chunk and item counts by state, and percent complete.
+
+        Tags:
+            Jobs
+        """
+        return self.jobs.progress(job_id)
+
+    def retry_bulk_job(self, job_id: str, include_unknown: Optional[bool] = None) -> dict[str, Any]:
+        """
+        Re-sends the failed chunks of a resumable bulk job, and optionally the chunks in an unknown state. Only include unknown chunks after checking in Apollo that they were not applied, or their contacts may be added or enriched twice.
+
+        Args:
+            job_id (string): The ID returned by `start_bulk_job`.
+            include_unknown (boolean): Also re-send chunks whose outcome is unknown; defaults to false.
+
+        Returns:
+            dict[str, Any]: The progress report of the job after re-queuing its chunks.
+
+        Raises:
+            ValueError: Raised when there is no job with this ID.
+
+        Tags:
+            Jobs
+        """
+        self.jobs.retry(job_id, include_unknown=bool(include_unknown))
+        return self.jobs.progress(job_id)[0]
+
+    def fetch_result_chunk(self, cursor: str, chunk: int) -> dict[str, Any]:
+        """
+        Fetches the next chunk of a tool result that was too large to return at once, without querying Apollo again. Oversized results come back as their first chunk plus a `result_cursor`.
+
+        Args:
+            cursor (string): The `result_cursor.token` of the original result.
+            chunk (integer): The chunk to fetch, normally the previous `result_cursor.next_chunk`.
+
+        Returns:
+            dict[str, Any]: The records of this chunk under the same key as in the original result (or a `data` string holding the next slice of the JSON text when the result had no large list), and an updated `result_cursor` whose `next_chunk` is null on the last chunk.
+
+        Raises:
+            ValueError: Raised when the cursor is unknown or expired, or the chunk is out of range.
+
+        Tags:
+            Results
+        """
+        return self.results.fetch(cursor, chunk)
+
+    def get_request_scheduler_metrics(self) -> dict[str, Any]:
+        """
+        Reports the request scheduler's queue depth and wait times for interactive, bulk and background traffic, and the current adaptive concurrency limit.
+
+        Returns:
+            dict[str, Any]: Requests in flight and the current in-flight limit, remaining rate-limit tokens, per priority class the queue depth, requests admitted, and average, p95 and maximum queueing time in seconds, and the concurrency limiter's smoothed and baseline latency per endpoint family.
+
+        Tags:
+            Admin
+        """
+        metrics = self.scheduler.metrics()
+        metrics["concurrency"] = self.concurrency.metrics() if self.concurrency is not None else None
+        metrics["result_cursors"] = self.results.metrics()
+        return metrics
+
+    def get_slow_tool_calls(self, tool: Optional[str] = None, limit: Optional[int] = None, path: Optional[str] = None) -> dict[str, Any]:
+        """
+        Reports the tool calls the profiler captured for exceeding the slow-call threshold, with the time each spent building headers, queueing, on HTTP, decoding and serializing, and per-tool latency and phase averages over the sampled calls. Profiling is off unless the server enables it.
+
+        Args:
+            tool (string): Only report calls to this tool.
+            limit (integer): Return at most this many calls, newest first.
+            path (string): Write the captured calls to this file in the server's data directory as NDJSON instead of returning them.
+
+        Returns:
+            dict[str, Any]: Whether profiling is enabled, the sample rate and slow threshold, per-tool statistics, and the captured calls (or the dump path and count) with their arguments, requests and phase breakdown.
+
+        Tags:
+            Admin
+        """
+        if self.profiler is None:
+            return {"enabled": False, "hint": "Set APOLLO_PROFILE_SAMPLE_RATE or APOLLO_SLOW_CALL_SECONDS to enable profiling."}
+        report = {"enabled": True, **self.profiler.metrics()}
+        if path:
+            path = self._data_path(path)
+            return {**report, "path": path, "dumped": self.profiler.dump(path, tool)}
+        return {**report, "calls": self.profiler.captured(tool, limit)}
+
+    def invoke_tool(self, name: str, *args, **kwargs) -> Any:
+        """
+        Validate the arguments locally, run tool ``name`` and hand oversized
+        results back as their first chunk and a cursor.
+        """
+        validator = VALIDATORS.get(name)
+        if validator is not None:
+            validator(args, kwargs)
+        if self.profiler is None:
+            result = getattr(self, name)(*args, **kwargs)
+            return result if name == "fetch_result_chunk" else self.results.paginate(result)
+        with self.profiler.call(name, args, kwargs) as profile:
+            result = getattr(self, name)(*args, **kwargs)
+            if name == "fetch_result_chunk":
+                return result
+            with profile.phase("serialize"):
+                return self.results.paginate(result)
+
+    def _expose(self, tool: Callable[..., Any]) -> Callable[..., Any]:
+        name = tool.__name__
+
+        @wraps(tool)
+        def exposed(*args, **kwargs):
+            return self.invoke_tool(name, *args, **kwargs)
+
+        return exposed
+
     def list_tools(self):
+        return [self._expose(tool) for tool in self.tools()]
+
+    def tools(self):
         return [
             self.people_enrichment,
             self.bulk_people_enrichment,
@@ -1136,11 +1783,33 @@ class ApolloApp(APIApplication):
             self.add_contacts_to_sequence,
             self.update_contact_status_sequence,
             self.create_task,
+            self.create_tasks_in_bulk,
             self.search_tasks,
             self.get_a_list_of_users,
             self.get_a_list_of_email_accounts,
             self.get_a_list_of_all_liststags,
             self.get_a_list_of_all_custom_fields,
             self.view_deal,
-            self.search_for_sequences
+            self.search_for_sequences,
+            self.enrich_people_with_cache,
+            self.enrich_organizations_deduped,
+            self.enrich_hashed_email_file,
+            self.sync_enrichment_cache,
+            self.export_search_results,
+            self.import_records,
+            self.multi_people_search,
+            self.find_people_at_organizations,
+            self.track_job_postings,
+            self.enroll_contacts_in_sequences,
+            self.analyze_deals,
+            self.start_bulk_job,
+            self.get_bulk_job_progress,
+            self.retry_bulk_job,
+            self.fetch_result_chunk,
+            self.get_request_scheduler_metrics,
+            self.get_slow_tool_calls
         ]
+
+
+# Compiled once: every tool's argument checks, from its signature and documented limits.
+VALIDATORS = compile_validators(ApolloApp)
@@ -0,0 +1,188 @@
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import httpx
+from loguru import logger
+
+RECORD = "record"
+REPLAY = "replay"
+REDACTED = "<REDACTED>"
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when no recorded interaction matches a request."""
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class Cassette:
+    """
+    Records Apollo request/response pairs to a gzip NDJSON file and replays
+    them without network access.
+
+    Interactions are matched on method, URL, query parameters and JSON body.
+    Identical requests replay their recordings in order, then repeat the last
+    one. Request headers are never stored, and every string in ``redact``
+    (the API key, typically) is scrubbed from whatever is written.
+
+    In replay mode each response is delayed by ``speed`` times its recorded
+    latency: ``1.0`` for the original timing, ``0.1`` for ten times faster,
+    ``0`` for no delay. The delay goes through ``sleep``.
+
+    In record mode one gzip stream stays open for the cassette's lifetime
+    and is synced at most every ``flush_interval`` seconds, so an
+    interrupted recording is still readable up to its last sync. Call
+    :meth:`close` to finish the file.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str = REPLAY,
+        speed: float = 0.0,
+        redact: Iterable[str] = (),
+        sleep: Callable[[float], None] = time.sleep,
+        flush_interval: float = 1.0,
+    ) -> None:
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected {RECORD!r} or {REPLAY!r}.")
+        self.path = Path(path).expanduser()
+        self.mode = mode
+        self.speed = speed
+        self.redact = [value for value in redact if value]
+        self.sleep = sleep
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._interactions: dict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        self._last: dict[str, dict[str, Any]] = {}
+        self._file = None
+        self._flushed = time.monotonic()
+        if mode == REPLAY:
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(self.path, "wt", encoding="utf-8")
+
+    @staticmethod
+    def key(method: str, url: str, params: Any = None, data: Any = None) -> str:
+        return _canonical([method.upper(), url, params or {}, data])
+
+    def _load(self) -> None:
+        count = 0
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    if line.strip():
+                        interaction = json.loads(line)
+                        self._interactions[interaction["key"]].append(interaction)
+                        count += 1
+            except (EOFError, json.JSONDecodeError):
+                logger.warning(f"Cassette: {self.path} ends early (recording interrupted?); using the {count} complete interactions.")
+        logger.debug(f"Cassette: loaded {count} interactions from {self.path}.")
+
+    def _scrub(self, text: str) -> str:
+        for secret in self.redact:
+            text = text.replace(secret, REDACTED)
+        return text
+
+    def _record(self, key: str, method: str, url: str, response: httpx.Response, elapsed: float) -> None:
+        interaction = {
+            "key": key,
+            "method": method,
+            "url": url,
+            "status": response.status_code,
+            "content_type": response.headers.get("content-type", "application/json"),
+            "body": response.text,
+            "elapsed": round(elapsed, 6),
+        }
+        line = self._scrub(json.dumps(interaction, separators=(",", ":")))
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError(f"Cassette {self.path} is closed.")
+            self._file.write(line + "\n")
+            if time.monotonic() - self._flushed >= self.flush_interval:
+                self._file.flush()
+                self._flushed = time.monotonic()
+
+    def close(self) -> None:
+        """Finish the recording; replay cassettes need no closing."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _replay(self, key: str, method: str, url: str, params: Any) -> httpx.Response:
+        with self._lock:
+            queue = self._interactions.get(key)
+            if queue:
+                interaction = queue.popleft()
+                self._last[key] = interaction
+            elif key in self._last:
+                interaction = self._last[key]
+            else:
+                raise CassetteMiss(f"No recorded interaction for {method} {url} {params or ''}")
+        if self.speed:
+            self.sleep(interaction["elapsed"] * self.speed)
+        response = httpx.Response(
+            interaction["status"],
+            headers={"content-type": interaction["content_type"]},
+            content=interaction["body"].encode(),
+            request=httpx.Request(method, url, params=params),
+        )
+        return response
+
+    def wrap(self, method: str, url: str, params: Any, data: Any, send: Callable[[], httpx.Response]) -> Callable[[], httpx.Response]:
+        """Return a ``send`` that records or replays this request."""
+        key = self._scrub(self.key(method, url, params, data))
+        if self.mode == REPLAY:
+            return lambda: self._replay(key, method, url, params)
+
+        def record() -> httpx.Response:
+            start = time.monotonic()
+            try:
+                response = send()
+            except httpx.HTTPStatusError as e:
+                self._record(key, method, url, e.response, time.monotonic() - start)
+                raise
+            self._record(key, method, url, response, time.monotonic() - start)
+            return response
+
+        return record
+
+
+def run_calls(app, calls: list[tuple[str, dict[str, Any]]], workers: int = 1, repeat: int = 1) -> dict[str, Any]:
+    """
+    Run tool calls (name, kwargs) against ``app`` and measure throughput and
+    per-call latency. Intended for replay-mode regression tests.
+    """
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def call(item: tuple[str, dict[str, Any]]) -> None:
+        name, kwargs = item
+        start = time.monotonic()
+        getattr(app, name)(**kwargs)
+        with lock:
+            latencies.append(time.monotonic() - start)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(call, calls * repeat))
+    elapsed = time.monotonic() - started
+    latencies.sort()
+    return {
+        "calls": len(latencies),
+        "seconds": elapsed,
+        "calls_per_second": len(latencies) / elapsed if elapsed else float("inf"),
+        "latency_p50": latencies[len(latencies) // 2] if latencies else 0.0,
+        "latency_p95": latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+        "latency_max": latencies[-1] if latencies else 0.0,
+    }
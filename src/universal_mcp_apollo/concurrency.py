@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import Counter
+from typing import Any, Optional
+
+DEFAULT_FAMILY = "default"
+
+
+class AdaptiveLimiter:
+    """
+    Adaptive cap on requests in flight (AIMD with a latency gradient).
+
+    Every healthy response grows the limit by ``1 / limit``, i.e. by about
+    one request per round trip. A 429, a 5xx or a transport error cuts it by
+    ``backoff``. So does smoothed latency rising above ``latency_tolerance``
+    times the best latency seen recently. Latency is tracked per endpoint
+    family, since a 2 s bulk match is healthy where a 2 s lookup is not.
+    Cuts happen at most once per ``cooldown`` seconds, so one burst of
+    errors counts as one signal.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        cooldown: float = 1.0,
+        baseline_window: int = 500,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.cooldown = cooldown
+        self.baseline_window = baseline_window
+        self._limit = float(initial)
+        self._latency: dict[str, float] = {}
+        self._baseline: dict[str, float] = {}
+        self._samples: Counter[str] = Counter()
+        self._last_decrease = 0.0
+        self._decreases = 0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    def __call__(self) -> int:
+        return self.limit
+
+    def _decrease(self, factor: float) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._decreases += 1
+        self._limit = max(float(self.min_limit), self._limit * factor)
+
+    def record(self, latency: float, status: Optional[int] = None, error: bool = False, family: str = DEFAULT_FAMILY) -> None:
+        """Feed back the outcome of one request to an endpoint of ``family``."""
+        with self._lock:
+            if error or status == 429 or (status is not None and status >= 500):
+                self._decrease(self.backoff)
+                return
+            self._samples[family] += 1
+            previous = self._latency.get(family)
+            smoothed = latency if previous is None else self.smoothing * latency + (1 - self.smoothing) * previous
+            self._latency[family] = smoothed
+            # Let the baseline drift up slowly so a permanently slower API
+            # is not mistaken for overload forever.
+            baseline = self._baseline.get(family)
+            if baseline is None or latency < baseline:
+                baseline = latency
+            elif self._samples[family] % self.baseline_window == 0:
+                baseline = smoothed
+            self._baseline[family] = baseline
+            if smoothed > baseline * self.latency_tolerance:
+                self._decrease(0.9)
+            else:
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "latency_seconds": {
+                    family: {"ewma": self._latency[family], "baseline": self._baseline[family]} for family in sorted(self._latency)
+                },
+                "decreases": self._decreases,
+            }
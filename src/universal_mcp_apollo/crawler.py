@@ -0,0 +1,235 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.jobs import DEFAULT_JOURNAL_PATH
+from universal_mcp_apollo.scheduler import BULK, priority
+
+DEFAULT_STORE_PATH = DEFAULT_JOURNAL_PATH.parent / "job_postings.sqlite3"
+
+# Fields that make up a posting's content; volatile ones such as
+# "last_seen_at" are left out so they do not look like changes.
+FINGERPRINT_FIELDS = ("id", "title", "url", "city", "state", "country", "posted_at")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS organizations (
+    organization_id TEXT PRIMARY KEY,
+    head_fingerprint TEXT NOT NULL,
+    total INTEGER,
+    crawled_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    organization_id TEXT NOT NULL,
+    posting_id TEXT NOT NULL,
+    first_seen_at REAL NOT NULL,
+    PRIMARY KEY (organization_id, posting_id)
+);
+"""
+
+
+def fingerprint(postings: list[dict[str, Any]]) -> str:
+    """Content fingerprint of a page of postings, in order."""
+    digest = hashlib.sha256()
+    for posting in postings:
+        digest.update(json.dumps([posting.get(f) for f in FINGERPRINT_FIELDS], default=str).encode())
+    return digest.hexdigest()
+
+
+class PostingStore:
+    """SQLite record of each organization's first-page fingerprint, posting count and known posting IDs."""
+
+    def __init__(self, path: str | Path = DEFAULT_STORE_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def state(self, organization_id: str) -> Optional[tuple[str, Optional[int], set[str]]]:
+        """(head fingerprint, total, known posting IDs), or None for an organization never crawled."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT head_fingerprint, total FROM organizations WHERE organization_id = ?", (organization_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            ids = {r[0] for r in self._conn.execute("SELECT posting_id FROM postings WHERE organization_id = ?", (organization_id,))}
+        return row[0], row[1], ids
+
+    def save(self, organization_id: str, head_fingerprint: str, total: Optional[int], added: Iterable[str], removed: Iterable[str]) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO organizations VALUES (?, ?, ?, ?)", (organization_id, head_fingerprint, total, now)
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO postings VALUES (?, ?, ?)", [(organization_id, pid, now) for pid in added]
+            )
+            self._conn.executemany(
+                "DELETE FROM postings WHERE organization_id = ? AND posting_id = ?", [(organization_id, pid) for pid in removed]
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class OrganizationChanges:
+    organization_id: str
+    added: list[dict[str, Any]] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    pages: int = 0
+    unchanged: bool = False
+    baseline: bool = False
+
+
+class PostingCrawler:
+    """
+    Incremental job-postings crawl over many organizations.
+
+    Per organization the first page is fetched and compared with the stored
+    fingerprint and total; if both match nothing changed and the crawl moves
+    on after one request. Otherwise pages are read until the first known
+    posting (postings come newest first). If the known count plus the new
+    postings adds up to the reported total, nothing was removed and paging
+    stops there; only when it does not are the remaining pages read to find
+    the removed postings.
+    """
+
+    def __init__(self, app, store: PostingStore, per_page: int = 100, workers: int = 8) -> None:
+        self.app = app
+        self.store = store
+        self.per_page = per_page
+        self.workers = workers
+
+    def _page(self, organization_id: str, page: int) -> tuple[list[dict[str, Any]], Optional[int], int]:
+        payload = self.app.organization_jobs_postings(organization_id=organization_id, page=page, per_page=self.per_page) or {}
+        pagination = payload.get("pagination") or {}
+        total = pagination.get("total_entries")
+        total_pages = int(pagination.get("total_pages") or page)
+        return payload.get("organization_job_postings") or [], (int(total) if total is not None else None), total_pages
+
+    def crawl_one(self, organization_id: str) -> OrganizationChanges:
+        changes = OrganizationChanges(organization_id)
+        state = self.store.state(organization_id)
+        known = state[2] if state else set()
+        changes.baseline = state is None
+
+        postings, total, total_pages = self._page(organization_id, 1)
+        changes.pages = 1
+        head = fingerprint(postings)
+        if state is not None and state[0] == head and state[1] == total:
+            changes.unchanged = True
+            return changes
+
+        seen: set[str] = set()
+        reached_known = False
+        page = 1
+        while True:
+            for posting in postings:
+                posting_id = str(posting.get("id"))
+                if posting_id in known:
+                    reached_known = True
+                elif posting_id not in seen:
+                    changes.added.append(posting)
+                seen.add(posting_id)
+            complete = total is not None and len(known) + len(changes.added) == total
+            if page >= total_pages or not postings or (reached_known and complete):
+                break
+            page += 1
+            postings, _, total_pages = self._page(organization_id, page)
+            changes.pages += 1
+
+        if page >= total_pages or not postings:
+            # Read to the end, so anything known but not seen is gone.
+            changes.removed = sorted(known - seen)
+        self.store.save(organization_id, head, total, (str(p.get("id")) for p in changes.added), changes.removed)
+        return changes
+
+    def crawl(self, organization_ids: Iterable[str], on_changes=None) -> dict[str, Any]:
+        """
+        Crawl ``organization_ids`` concurrently at bulk priority. ``on_changes``
+        is called with each :class:`OrganizationChanges` as it completes.
+        """
+        stats = {"organizations": 0, "unchanged": 0, "changed": 0, "baseline": 0, "added": 0, "removed": 0, "pages": 0, "failed": 0}
+        errors: list[dict[str, str]] = []
+        lock = threading.Lock()
+        started = time.monotonic()
+
+        def run(organization_id: str) -> None:
+            try:
+                with priority(BULK):
+                    changes = self.crawl_one(organization_id)
+            except Exception as e:
+                with lock:
+                    stats["failed"] += 1
+                    if len(errors) < 100:
+                        errors.append({"organization_id": organization_id, "error": str(e)})
+                return
+            with lock:
+                stats["organizations"] += 1
+                stats["pages"] += changes.pages
+                stats["added"] += len(changes.added)
+                stats["removed"] += len(changes.removed)
+                if changes.baseline:
+                    stats["baseline"] += 1
+                elif changes.unchanged or not (changes.added or changes.removed):
+                    stats["unchanged"] += 1
+                else:
+                    stats["changed"] += 1
+                if on_changes is not None:
+                    on_changes(changes)
+
+        pending: set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="apollo-postings") as pool:
+            for organization_id in dict.fromkeys(organization_ids):
+                if len(pending) >= self.workers * 2:
+                    _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                # In a copy of the caller's context, so the crawl is profiled with the tool call.
+                pending.add(pool.submit(copy_context().run, run, organization_id))
+            wait(pending)
+        stats["seconds"] = round(time.monotonic() - started, 3)
+        logger.info(f"PostingCrawler: {stats}")
+        return {**stats, "errors": errors}
+
+
+def crawl_postings(app, store: PostingStore, organization_ids: list[str], path: Optional[str | Path] = None, per_page: int = 100, workers: int = 8) -> dict[str, Any]:
+    """
+    Crawl and report changes: one event per added or removed posting, as
+    NDJSON lines in ``path`` or inline. The first crawl of an organization
+    records a baseline; its postings are counted but not emitted.
+    """
+    events: list[dict[str, Any]] = []
+    out = open(Path(path).expanduser(), "w", encoding="utf-8") if path else None
+
+    def emit(changes: OrganizationChanges) -> None:
+        if changes.baseline:
+            return
+        batch = [{"organization_id": changes.organization_id, "change": "added", "posting": p} for p in changes.added]
+        batch += [{"organization_id": changes.organization_id, "change": "removed", "posting_id": pid} for pid in changes.removed]
+        if out is not None:
+            out.writelines(json.dumps(e, separators=(",", ":")) + "\n" for e in batch)
+        else:
+            events.extend(batch)
+
+    try:
+        summary = PostingCrawler(app, store, per_page=per_page, workers=workers).crawl(organization_ids, on_changes=emit)
+    finally:
+        if out is not None:
+            out.close()
+    if out is not None:
+        return {**summary, "path": str(path)}
+    return {**summary, "changes": events}
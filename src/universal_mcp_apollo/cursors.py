@@ -0,0 +1,151 @@
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+DEFAULT_CHUNK_BYTES = 256 * 1024
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+@dataclass
+class _Entry:
+    chunks: list[str]
+    key: Optional[str]
+    total_records: int
+    size: int
+    expires: float
+
+
+class ResultStore:
+    """
+    Bounded, TTL-evicted store of oversized tool results, split into chunks
+    of at most ``chunk_bytes`` of JSON.
+
+    When a result's largest top-level list (``people``, ``contacts``,
+    ``opportunities``...) is what makes it big, that list is split on record
+    boundaries, so every chunk is valid JSON a client can use on its own;
+    anything else is split as raw JSON text. The first chunk is returned in
+    place of the result together with a ``result_cursor``; the rest are
+    fetched by token. Entries expire ``ttl`` seconds after their last use and
+    the least recently used are evicted beyond ``max_entries`` or
+    ``max_bytes``.
+    """
+
+    def __init__(self, chunk_bytes: int = DEFAULT_CHUNK_BYTES, ttl: float = 600.0, max_entries: int = 64, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.chunk_bytes = chunk_bytes
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _split_records(self, records: list[Any], first_limit: int) -> list[str]:
+        chunks, current, size = [], [], 2
+        for record in records:
+            text = _dumps(record)
+            limit = first_limit if not chunks else self.chunk_bytes
+            if current and size + len(text) + 1 > limit:
+                chunks.append("[" + ",".join(current) + "]")
+                current, size = [], 2
+            current.append(text)
+            size += len(text) + 1
+        chunks.append("[" + ",".join(current) + "]")
+        return chunks
+
+    def _evict_locked(self, now: float) -> None:
+        for token in [t for t, e in self._entries.items() if e.expires <= now]:
+            self._bytes -= self._entries.pop(token).size
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+
+    def _cursor(self, token: str, entry: _Entry, chunk: int) -> dict[str, Any]:
+        return {
+            "token": token,
+            "chunk": chunk,
+            "chunks": len(entry.chunks),
+            "next_chunk": chunk + 1 if chunk + 1 < len(entry.chunks) else None,
+            "key": entry.key,
+            "total_records": entry.total_records,
+            "expires_in_seconds": self.ttl,
+        }
+
+    def _page(self, token: str, entry: _Entry, chunk: int, head: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        if entry.key is None:
+            return {"data": entry.chunks[chunk], "result_cursor": self._cursor(token, entry, chunk)}
+        return {**(head or {}), entry.key: json.loads(entry.chunks[chunk]), "result_cursor": self._cursor(token, entry, chunk)}
+
+    def _split(self, result: Any, text: str) -> tuple[Optional[dict[str, Any]], _Entry]:
+        head, key, total = None, None, 0
+        lists = {k: v for k, v in result.items() if isinstance(v, list)} if isinstance(result, dict) else {}
+        if lists:
+            key = max(lists, key=lambda k: len(_dumps(lists[k])))
+            head = {k: v for k, v in result.items() if k != key}
+            if len(_dumps(head)) > self.chunk_bytes // 2:
+                key, head = None, None
+        if key is not None:
+            total = len(result[key])
+            # The first chunk travels with the rest of the result, so give it less room.
+            chunks = self._split_records(result[key], self.chunk_bytes - len(_dumps(head)))
+        else:
+            chunks = [text[i:i + self.chunk_bytes] for i in range(0, len(text), self.chunk_bytes)]
+        return head, _Entry(chunks, key, total, sum(map(len, chunks)), 0.0)
+
+    def adopt(self, token: str, entry: _Entry) -> None:
+        """Serve the chunks of ``entry`` under ``token``, e.g. ones split by :meth:`encode` in another process."""
+        now = time.monotonic()
+        entry.expires = now + self.ttl
+        with self._lock:
+            self._entries[token] = entry
+            self._bytes += entry.size
+            self._evict_locked(now)
+
+    def paginate(self, result: Any) -> Any:
+        """Return ``result`` unchanged if it fits in one chunk, else its first chunk and a cursor."""
+        text = _dumps(result)
+        if len(text) <= self.chunk_bytes:
+            return result
+        head, entry = self._split(result, text)
+        token = secrets.token_urlsafe(16)
+        self.adopt(token, entry)
+        return self._page(token, entry, 0, head)
+
+    def encode(self, result: Any) -> tuple[str, Optional[tuple[str, _Entry]]]:
+        """
+        JSON text of ``result`` or, if it is oversized, of its first chunk and
+        cursor, plus the ``(token, entry)`` the serving process must
+        :meth:`adopt` for the remaining chunks. Nothing is stored here.
+        """
+        text = _dumps(result)
+        if len(text) <= self.chunk_bytes:
+            return text, None
+        head, entry = self._split(result, text)
+        token = secrets.token_urlsafe(16)
+        return _dumps(self._page(token, entry, 0, head)), (token, entry)
+
+    def fetch(self, token: str, chunk: int) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            self._evict_locked(now)
+            entry = self._entries.get(token)
+            if entry is None:
+                raise ValueError(f"Unknown or expired result cursor {token!r}; run the original tool again.")
+            if not 0 <= chunk < len(entry.chunks):
+                raise ValueError(f"Chunk {chunk} out of range; the result has {len(entry.chunks)} chunks.")
+            entry.expires = now + self.ttl
+            self._entries.move_to_end(token)
+        return self._page(token, entry, chunk)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "chunk_bytes": self.chunk_bytes}
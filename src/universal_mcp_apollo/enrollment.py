@@ -0,0 +1,195 @@
+import csv
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.jobs import JOB_KINDS
+from universal_mcp_apollo.planner import PersonIndex
+from universal_mcp_apollo.scheduler import BULK, priority
+
+CHUNK_SIZE = JOB_KINDS["add_contacts_to_sequence"].chunk_size
+
+ADDED = "added"
+FILTERED = "filtered"
+REJECTED = "rejected"
+FAILED = "failed"
+
+ACTIVE_STATUSES = ("active", "paused")
+FINISHED_STATUSES = ("finished",)
+# Email statuses Apollo will not sequence without sequence_unverified_email. Others, such as
+# "guessed", "extrapolated" or "likely_to_engage", are left for Apollo to judge.
+UNDELIVERABLE_STATUSES = ("unverified", "unavailable", "bounced", "invalid")
+
+FLAGS = (
+    "sequence_no_email",
+    "sequence_unverified_email",
+    "sequence_job_change",
+    "sequence_active_in_other_campaigns",
+    "sequence_finished_in_other_campaigns",
+)
+
+
+@dataclass
+class Enrollment:
+    """Contacts to add to one sequence from one mailbox, with the flags sent to Apollo."""
+
+    sequence_id: str
+    contact_ids: list[str]
+    send_email_from_email_account_id: str
+    flags: dict[str, bool] = field(default_factory=dict)
+    user_id: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, spec: dict[str, Any]) -> "Enrollment":
+        missing = [k for k in ("sequence_id", "contact_ids", "send_email_from_email_account_id") if not spec.get(k)]
+        if missing:
+            raise ValueError(f"Enrollment is missing {missing}.")
+        unknown = set(spec) - {"sequence_id", "contact_ids", "send_email_from_email_account_id", "user_id", *FLAGS}
+        if unknown:
+            raise ValueError(f"Unknown enrollment fields: {sorted(unknown)}")
+        return cls(
+            sequence_id=spec["sequence_id"],
+            contact_ids=list(spec["contact_ids"]),
+            send_email_from_email_account_id=spec["send_email_from_email_account_id"],
+            flags={k: bool(spec[k]) for k in FLAGS if spec.get(k) is not None},
+            user_id=spec.get("user_id"),
+        )
+
+
+def preflight(contact: Optional[dict[str, Any]], enrollment: Enrollment) -> Optional[str]:
+    """
+    Reason Apollo would skip ``contact`` for ``enrollment``, judged from the
+    cached record, or None if it should be sent. Contacts not in the cache
+    are always sent and left for Apollo to judge.
+    """
+    if contact is None:
+        return None
+    flags = enrollment.flags
+    for status in contact.get("contact_campaign_statuses") or []:
+        if status.get("emailer_campaign_id") == enrollment.sequence_id and status.get("status") in ACTIVE_STATUSES:
+            return "already_in_sequence"
+    if not contact.get("email"):
+        return None if flags.get("sequence_no_email") else "no_email"
+    if contact.get("email_status") in UNDELIVERABLE_STATUSES and not flags.get("sequence_unverified_email"):
+        return f"email_{contact['email_status']}"
+    others = [s for s in contact.get("contact_campaign_statuses") or [] if s.get("emailer_campaign_id") != enrollment.sequence_id]
+    if not flags.get("sequence_active_in_other_campaigns") and any(s.get("status") in ACTIVE_STATUSES for s in others):
+        return "active_in_other_campaign"
+    if not flags.get("sequence_finished_in_other_campaigns") and any(s.get("status") in FINISHED_STATUSES for s in others):
+        return "finished_in_other_campaign"
+    return None
+
+
+def _skipped(response: dict[str, Any]) -> dict[str, str]:
+    """Contact IDs Apollo reports as skipped, with reasons when given."""
+    skipped = response.get("skipped_contact_ids") or {}
+    if isinstance(skipped, list):
+        return {str(cid): "skipped" for cid in skipped}
+    return {str(cid): str(reason) for cid, reason in skipped.items()}
+
+
+class EnrollmentEngine:
+    """
+    Batch enrollment into sequences.
+
+    Each contact is first checked against the cached contact record (email
+    presence and status, campaigns it is already in) under the enrollment's
+    flags, and contacts Apollo would skip are dropped locally instead of
+    being sent. The rest are chunked to the endpoint's limit and dispatched
+    concurrently, with chunks of different sequences and mailboxes
+    interleaved so one large enrollment does not hold up the others.
+    Every contact ends with one outcome row.
+    """
+
+    def __init__(self, app, index: Optional[PersonIndex] = None, workers: int = 8) -> None:
+        self.app = app
+        self.index = index if index is not None else app.enrichment_planner.index
+        self.workers = workers
+
+    def _mark_enrolled(self, contact_id: str, sequence_id: str) -> None:
+        existing = self.index.get("id", contact_id)
+        if existing is None:
+            return
+        statuses = [s for s in existing.get("contact_campaign_statuses") or [] if s.get("emailer_campaign_id") != sequence_id]
+        statuses.append({"emailer_campaign_id": sequence_id, "status": "active"})
+        self.index.add({"id": contact_id, "contact_campaign_statuses": statuses})
+
+    def plan(self, enrollments: list[Enrollment], check: bool = True) -> tuple[list[dict[str, Any]], list[tuple[Enrollment, list[str]]]]:
+        """Outcome rows for contacts filtered locally, and the chunks left to send."""
+        rows: list[dict[str, Any]] = []
+        chunks_by_enrollment = []
+        for enrollment in enrollments:
+            send = []
+            for contact_id in dict.fromkeys(enrollment.contact_ids):
+                reason = preflight(self.index.get("id", contact_id), enrollment) if check else None
+                if reason:
+                    rows.append({"contact_id": contact_id, "sequence_id": enrollment.sequence_id, "outcome": FILTERED, "reason": reason})
+                else:
+                    send.append(contact_id)
+            chunks_by_enrollment.append([(enrollment, send[i:i + CHUNK_SIZE]) for i in range(0, len(send), CHUNK_SIZE)])
+        # Round-robin across enrollments so every sequence and mailbox makes progress.
+        chunks = [c for group in itertools.zip_longest(*chunks_by_enrollment) for c in group if c is not None]
+        return rows, chunks
+
+    def _send(self, chunk: tuple[Enrollment, list[str]]) -> list[dict[str, Any]]:
+        enrollment, contact_ids = chunk
+        try:
+            with priority(BULK):
+                response = self.app.add_contacts_to_sequence(
+                    sequence_id=enrollment.sequence_id,
+                    emailer_campaign_id=enrollment.sequence_id,
+                    contact_ids_=contact_ids,
+                    send_email_from_email_account_id=enrollment.send_email_from_email_account_id,
+                    user_id=enrollment.user_id,
+                    **enrollment.flags,
+                ) or {}
+        except Exception as e:
+            logger.warning(f"EnrollmentEngine: chunk of {len(contact_ids)} for sequence {enrollment.sequence_id} failed: {e}")
+            return [{"contact_id": c, "sequence_id": enrollment.sequence_id, "outcome": FAILED, "reason": str(e)} for c in contact_ids]
+        skipped = _skipped(response)
+        rows = []
+        for contact_id in contact_ids:
+            if contact_id in skipped:
+                rows.append({"contact_id": contact_id, "sequence_id": enrollment.sequence_id, "outcome": REJECTED, "reason": skipped[contact_id]})
+            else:
+                self._mark_enrolled(contact_id, enrollment.sequence_id)
+                rows.append({"contact_id": contact_id, "sequence_id": enrollment.sequence_id, "outcome": ADDED, "reason": None})
+        return rows
+
+    def run(self, enrollments: list[Enrollment], check: bool = True) -> dict[str, Any]:
+        started = time.monotonic()
+        rows, chunks = self.plan(enrollments, check=check)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="apollo-enroll") as pool:
+            # Each call runs in a copy of the caller's context, so it is profiled with the tool call.
+            for future in [pool.submit(copy_context().run, self._send, chunk) for chunk in chunks]:
+                rows.extend(future.result())
+        counts = {outcome: 0 for outcome in (ADDED, FILTERED, REJECTED, FAILED)}
+        for row in rows:
+            counts[row["outcome"]] += 1
+        summary = {
+            "contacts": len(rows),
+            **counts,
+            "api_calls": len(chunks),
+            "seconds": round(time.monotonic() - started, 3),
+        }
+        logger.info(f"EnrollmentEngine: {summary}")
+        return {**summary, "outcomes": rows}
+
+
+def enroll(app, enrollments: list[dict[str, Any]], path: Optional[str | Path] = None, check: bool = True, workers: int = 8) -> dict[str, Any]:
+    """Run :class:`EnrollmentEngine` and return the outcome table inline or as a CSV file."""
+    result = EnrollmentEngine(app, workers=workers).run([Enrollment.from_dict(e) for e in enrollments], check=check)
+    if path is None:
+        return result
+    outcomes = result.pop("outcomes")
+    with open(Path(path).expanduser(), "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=("contact_id", "sequence_id", "outcome", "reason"))
+        writer.writeheader()
+        writer.writerows(outcomes)
+    return {**result, "path": str(path)}
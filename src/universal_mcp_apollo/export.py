@@ -0,0 +1,300 @@
+import csv
+import json
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.scheduler import BULK, priority
+
+# search tool -> keys of the record lists in its response
+SEARCH_TOOLS: dict[str, tuple[str, ...]] = {
+    "people_search": ("people", "contacts"),
+    "organization_search": ("organizations", "accounts"),
+    "search_for_contacts": ("contacts",),
+    "search_for_accounts": ("accounts",),
+    "list_all_deals": ("opportunities",),
+    "search_tasks": ("tasks",),
+    "search_for_sequences": ("emailer_campaigns",),
+}
+
+FORMATS = ("ndjson", "csv", "parquet", "arrow")
+
+_DONE = object()
+
+
+def iter_pages(
+    app,
+    tool: str,
+    filters: Optional[dict[str, Any]] = None,
+    per_page: int = 100,
+    max_pages: Optional[int] = None,
+    prefetch: int = 1,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Yield the records of each result page of a search tool.
+
+    Pages are fetched on a background thread at bulk priority, at most
+    ``prefetch`` pages ahead of the consumer; a slow consumer blocks the
+    fetcher, so memory stays bounded by the page size.
+    """
+    if tool not in SEARCH_TOOLS:
+        raise ValueError(f"Unsupported search tool {tool!r}; expected one of {sorted(SEARCH_TOOLS)}.")
+    keys = SEARCH_TOOLS[tool]
+    pages: queue.Queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def fetch() -> None:
+        try:
+            with priority(BULK):
+                page = 1
+                while not stop.is_set() and (max_pages is None or page <= max_pages):
+                    payload = getattr(app, tool)(page=page, per_page=per_page, **(filters or {})) or {}
+                    records = [r for key in keys for r in payload.get(key) or []]
+                    total_pages = int((payload.get("pagination") or {}).get("total_pages") or page)
+                    if records:
+                        pages.put(records)
+                    if not records or page >= total_pages:
+                        break
+                    page += 1
+        except Exception as e:
+            pages.put(e)
+        finally:
+            pages.put(_DONE)
+
+    fetcher = threading.Thread(target=fetch, name=f"apollo-export-{tool}", daemon=True)
+    fetcher.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        while fetcher.is_alive():
+            try:
+                pages.get_nowait()
+            except queue.Empty:
+                fetcher.join(timeout=0.1)
+
+
+def flatten(record: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """Flatten nested dicts into dotted keys; lists become JSON strings."""
+    flat: dict[str, Any] = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, list):
+            flat[name] = json.dumps(value, separators=(",", ":"))
+        else:
+            flat[name] = value
+    return flat
+
+
+class NdjsonWriter:
+    def __init__(self, path: Path, **_: Any) -> None:
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        self._file.writelines(json.dumps(r, separators=(",", ":")) + "\n" for r in records)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CsvWriter:
+    """
+    CSV with nested fields flattened to dotted column names. Columns are fixed
+    by ``columns`` or by the first page; fields first seen later are dropped
+    and counted in ``dropped_fields``.
+    """
+
+    def __init__(self, path: Path, columns: Optional[list[str]] = None, **_: Any) -> None:
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self.columns = columns
+        self.dropped_fields: set[str] = set()
+        self._writer: Optional[csv.DictWriter] = None
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        rows = [flatten(r) for r in records]
+        if self._writer is None:
+            if self.columns is None:
+                self.columns = list(dict.fromkeys(k for row in rows for k in row))
+            self._writer = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+            self._writer.writeheader()
+        known = set(self.columns)
+        for row in rows:
+            self.dropped_fields.update(k for k in row if k not in known)
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        if self.dropped_fields:
+            logger.warning(f"CsvWriter: dropped fields not present in the first page: {sorted(self.dropped_fields)}")
+        self._file.close()
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+class ArrowWriter:
+    """
+    Columnar Parquet or Arrow IPC output written in bounded row groups.
+
+    Columns are fixed by ``columns`` or by the first row group, as for CSV;
+    fields first seen later are dropped and counted in ``dropped_fields``.
+    Column types are inferred from the first row group. Columns that are
+    entirely null or of mixed type there are strings, and later values of
+    any type are written to them as text. A value that does not fit a
+    column's inferred type is written as null and its column counted in
+    ``coerced_fields``, so a late type change never aborts the export.
+    """
+
+    def __init__(self, path: Path, format: str = "parquet", row_group_size: int = 10_000, columns: Optional[list[str]] = None, **_: Any) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet/Arrow export requires pyarrow: pip install 'universal-mcp-apollo[parquet]'"
+            ) from e
+        self._pa = pa
+        self._pq = pq
+        self.path = path
+        self.format = format
+        self.row_group_size = row_group_size
+        self.columns = columns
+        self.dropped_fields: set[str] = set()
+        self.coerced_fields: set[str] = set()
+        self._buffer: list[dict[str, Any]] = []
+        self._schema = None
+        self._writer = None
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        self._buffer.extend(flatten(r) for r in records)
+        while len(self._buffer) >= self.row_group_size:
+            rows, self._buffer = self._buffer[:self.row_group_size], self._buffer[self.row_group_size:]
+            self._flush(rows)
+
+    def _infer(self, values: list[Any]):
+        pa = self._pa
+        try:
+            inferred = pa.array(values).type
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.string()
+        return pa.string() if pa.types.is_null(inferred) else inferred
+
+    def _column(self, name: str, values: list[Any], type_):
+        pa = self._pa
+        if pa.types.is_string(type_):
+            return pa.array([_text(v) for v in values], type=type_)
+        try:
+            return pa.array(values, type=type_)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            pass
+        self.coerced_fields.add(name)
+        fitted = []
+        for value in values:
+            try:
+                fitted.append(pa.scalar(value, type=type_))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                fitted.append(pa.scalar(None, type=type_))
+        return pa.array(fitted, type=type_)
+
+    def _flush(self, rows: list[dict[str, Any]]) -> None:
+        pa = self._pa
+        if self._schema is None:
+            if self.columns is None:
+                self.columns = list(dict.fromkeys(k for row in rows for k in row))
+            self._schema = pa.schema([pa.field(name, self._infer([row.get(name) for row in rows])) for name in self.columns])
+            if self.format == "parquet":
+                self._writer = self._pq.ParquetWriter(self.path, self._schema)
+            else:
+                self._writer = pa.ipc.new_file(str(self.path), self._schema)
+        known = set(self.columns)
+        for row in rows:
+            self.dropped_fields.update(k for k in row if k not in known)
+        arrays = [self._column(f.name, [row.get(f.name) for row in rows], f.type) for f in self._schema]
+        table = pa.Table.from_arrays(arrays, schema=self._schema)
+        if self.format == "parquet":
+            self._writer.write_table(table)
+        else:
+            self._writer.write_table(table, max_chunksize=self.row_group_size)
+
+    def close(self) -> None:
+        if self._buffer:
+            self._flush(self._buffer)
+            self._buffer = []
+        if self.dropped_fields:
+            logger.warning(f"ArrowWriter: dropped fields not present in the first row group: {sorted(self.dropped_fields)}")
+        if self.coerced_fields:
+            logger.warning(f"ArrowWriter: wrote null for values not matching the inferred type of {sorted(self.coerced_fields)}")
+        if self._writer is not None:
+            self._writer.close()
+
+
+def export_search(
+    app,
+    tool: str,
+    path: str | Path,
+    format: str = "ndjson",
+    filters: Optional[dict[str, Any]] = None,
+    per_page: int = 100,
+    max_pages: Optional[int] = None,
+    columns: Optional[list[str]] = None,
+    row_group_size: int = 10_000,
+) -> dict[str, Any]:
+    """
+    Stream every page of a search tool into a file as the pages arrive.
+
+    Returns:
+        dict[str, Any]: The output path, format, record and page counts,
+        file size and elapsed seconds, plus ``warnings`` when fields were
+        dropped or values nulled to fit the columns.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported format {format!r}; expected one of {FORMATS}.")
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if format in ("parquet", "arrow"):
+        writer = ArrowWriter(path, format=format, row_group_size=row_group_size, columns=columns)
+    elif format == "csv":
+        writer = CsvWriter(path, columns=columns)
+    else:
+        writer = NdjsonWriter(path)
+
+    start = time.monotonic()
+    records = pages = 0
+    try:
+        for page in iter_pages(app, tool, filters=filters, per_page=per_page, max_pages=max_pages):
+            writer.write(page)
+            records += len(page)
+            pages += 1
+    finally:
+        writer.close()
+    stats = {
+        "path": str(path),
+        "format": format,
+        "records": records,
+        "pages": pages,
+        "bytes": path.stat().st_size if path.exists() else 0,
+        "seconds": round(time.monotonic() - start, 3),
+    }
+    warnings = []
+    if getattr(writer, "dropped_fields", None):
+        warnings.append(f"dropped fields first seen after the columns were fixed: {sorted(writer.dropped_fields)}")
+    if getattr(writer, "coerced_fields", None):
+        warnings.append(f"wrote null for values not matching the column type of: {sorted(writer.coerced_fields)}")
+    if warnings:
+        stats["warnings"] = warnings
+    logger.info(f"export_search: {tool} -> {stats}")
+    return stats
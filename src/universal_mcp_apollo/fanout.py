@@ -0,0 +1,288 @@
+import queue
+import threading
+import time
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.export import NdjsonWriter, iter_pages
+from universal_mcp_apollo.planner import BULK_MATCH_LIMIT
+
+_DONE = object()
+_POLL = 0.1
+
+
+@dataclass
+class Stage:
+    """
+    One step of a :class:`StagedPipeline`. ``fn`` receives a batch of up to
+    ``batch_size`` items and returns (or yields) the items it produces, which
+    are passed to every stage in ``to``, or to the pipeline output if ``to``
+    is empty. A batch is cut short after ``max_wait`` seconds so a slow
+    upstream never leaves items stranded.
+    """
+
+    name: str
+    fn: Callable[[list[Any]], Iterable[Any]]
+    workers: int = 1
+    batch_size: int = 1
+    max_wait: float = 0.2
+    to: tuple[str, ...] = ()
+    queue_size: Optional[int] = None
+    received: int = 0
+    produced: int = 0
+    batches: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "received": self.received,
+            "produced": self.produced,
+            "batches": self.batches,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+        }
+
+
+class StagedPipeline:
+    """
+    Runs stages on their own thread pools, connected by bounded queues.
+
+    A full queue blocks its producers, so a fast stage never runs more than
+    a couple of batches ahead of a slow one and memory stays bounded, while
+    every stage works at the same time: total wall time approaches that of
+    the slowest stage instead of the sum of all of them. Stages form a DAG;
+    the first stage is fed the ``seed`` items. A failed batch is logged and
+    counted, and the rest of the run continues.
+    """
+
+    def __init__(self, stages: list[Stage]) -> None:
+        self.stages = {stage.name: stage for stage in stages}
+        self.first = stages[0]
+        self._queues = {
+            stage.name: queue.Queue(maxsize=stage.queue_size or max(2, stage.workers * stage.batch_size * 2))
+            for stage in stages
+        }
+        self._output: queue.Queue = queue.Queue(maxsize=64)
+        self._upstream = {stage.name: 0 for stage in stages}
+        for stage in stages:
+            for target in stage.to:
+                self._upstream[target] += 1
+        self._sinks = sum(1 for stage in stages if not stage.to)
+        self._running = {stage.name: stage.workers for stage in stages}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def _put(self, q: queue.Queue, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=_POLL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _next_batch(self, stage: Stage) -> Optional[list[Any]]:
+        """Up to ``batch_size`` items; None once the stage's input is closed and drained."""
+        q = self._queues[stage.name]
+        batch: list[Any] = []
+        deadline = None
+        while len(batch) < stage.batch_size and not self._stop.is_set():
+            timeout = _POLL if deadline is None else max(0.0, min(_POLL, deadline - time.monotonic()))
+            try:
+                item = q.get(timeout=timeout)
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                continue
+            if item is _DONE:
+                # Leave the marker for this stage's other workers.
+                q.put(item)
+                break
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + stage.max_wait
+        return batch or None
+
+    def _close(self, name: str) -> None:
+        """One upstream of ``name`` finished; close its input when all have."""
+        with self._lock:
+            self._upstream[name] -= 1
+            closed = self._upstream[name] <= 0
+        if closed:
+            self._put(self._queues[name], _DONE)
+
+    def _worker(self, stage: Stage) -> None:
+        try:
+            while not self._stop.is_set():
+                batch = self._next_batch(stage)
+                if batch is None:
+                    break
+                start = time.monotonic()
+                produced = 0
+                targets = [self._queues[t] for t in stage.to] or [self._output]
+                items: Iterator[Any] = iter(())
+                try:
+                    items = iter(stage.fn(batch))
+                    for item in items:
+                        produced += 1
+                        if not all(self._put(target, item) for target in targets):
+                            break
+                except Exception as e:
+                    with stage._lock:
+                        stage.errors += 1
+                    logger.warning(f"StagedPipeline: stage {stage.name} failed on a batch of {len(batch)}: {e}")
+                finally:
+                    close = getattr(items, "close", None)
+                    if close is not None:
+                        close()
+                with stage._lock:
+                    stage.received += len(batch)
+                    stage.produced += produced
+                    stage.batches += 1
+                    stage.busy_seconds += time.monotonic() - start
+        finally:
+            with self._lock:
+                self._running[stage.name] -= 1
+                last = self._running[stage.name] == 0
+            if last:
+                for target in stage.to:
+                    self._close(target)
+                if not stage.to:
+                    self._put(self._output, _DONE)
+
+    def run(self, seed: Iterable[Any]) -> Iterator[Any]:
+        """Start every stage, feed ``seed`` to the first one and yield the output items."""
+        context = copy_context()
+        for stage in self.stages.values():
+            for i in range(stage.workers):
+                # Each worker runs in a copy of the caller's context so its priority applies.
+                thread = threading.Thread(
+                    target=context.copy().run, args=(self._worker, stage), name=f"apollo-{stage.name}-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        for item in seed:
+            self._put(self._queues[self.first.name], item)
+        self._upstream[self.first.name] = 1
+        self._close(self.first.name)
+        sinks = self._sinks
+        try:
+            while sinks:
+                item = self._output.get()
+                if item is _DONE:
+                    sinks -= 1
+                else:
+                    yield item
+        finally:
+            self._stop.set()
+            for thread in self._threads:
+                thread.join()
+
+    def metrics(self) -> dict[str, Any]:
+        return {name: stage.metrics() for name, stage in self.stages.items()}
+
+
+def organization_people_pipeline(
+    app,
+    people_filters: Optional[dict[str, Any]] = None,
+    max_organization_pages: Optional[int] = 1,
+    organizations_per_search: int = 10,
+    people_pages: Optional[int] = 1,
+    enrich: bool = True,
+    include_job_postings: bool = False,
+    reveal_personal_emails: Optional[bool] = None,
+    search_workers: int = 4,
+    enrich_workers: int = 4,
+) -> StagedPipeline:
+    """
+    organization_search -> people_search (``organizations_per_search`` org
+    IDs per call) -> bulk_people_enrichment through the enrichment planner,
+    plus job postings per organization when ``include_job_postings`` is set.
+
+    The pipeline is seeded with ``organization_search`` filter sets. Outputs
+    are ``{"type": "person", "enriched": ..., "person": ...}`` and
+    ``{"type": "job_postings", "organization_id": ..., "job_postings": [...]}``.
+    """
+
+    def organizations(seed: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for filters in seed:
+            for page in iter_pages(app, "organization_search", filters, max_pages=max_organization_pages):
+                yield from page
+
+    def people(orgs: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        ids = [org["id"] for org in orgs if org.get("id")]
+        if ids:
+            filters = {**(people_filters or {}), "organization_ids_": ids}
+            for page in iter_pages(app, "people_search", filters, max_pages=people_pages):
+                yield from page
+
+    def enrichment(found: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        result = app.enrichment_planner.enrich([{"id": person["id"]} for person in found], reveal_personal_emails=reveal_personal_emails)
+        for person, match in zip(found, result["matches"]):
+            yield {"type": "person", "enriched": match is not None, "person": match or person}
+
+    def as_output(found: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for person in found:
+            yield {"type": "person", "enriched": False, "person": person}
+
+    def job_postings(orgs: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for org in orgs:
+            response = app.organization_jobs_postings(organization_id=org["id"]) or {}
+            yield {"type": "job_postings", "organization_id": org["id"], "job_postings": response.get("organization_job_postings") or []}
+
+    search_targets = ("people", "job_postings") if include_job_postings else ("people",)
+    stages = [
+        Stage("organizations", organizations, to=search_targets, queue_size=1),
+        Stage("people", people, workers=search_workers, batch_size=organizations_per_search, to=("enrichment",)),
+        Stage(
+            "enrichment",
+            enrichment if enrich else as_output,
+            workers=enrich_workers if enrich else 1,
+            batch_size=BULK_MATCH_LIMIT,
+        ),
+    ]
+    if include_job_postings:
+        stages.append(Stage("job_postings", job_postings, workers=search_workers))
+    return StagedPipeline(stages)
+
+
+def fan_out(app, path: Optional[str | Path] = None, max_people: Optional[int] = None, organization_filters: Optional[dict[str, Any]] = None, **options: Any) -> dict[str, Any]:
+    """Run :func:`organization_people_pipeline` and collect or stream its output."""
+    pipeline = organization_people_pipeline(app, **options)
+    started = time.monotonic()
+    stream = pipeline.run([organization_filters or {}])
+    people: list[dict[str, Any]] = []
+    postings: list[dict[str, Any]] = []
+    count = 0
+    writer = NdjsonWriter(Path(path).expanduser()) if path else None
+    try:
+        for item in stream:
+            if item["type"] == "person":
+                count += 1
+            if writer is not None:
+                writer.write([item])
+            elif item["type"] == "person":
+                people.append(item)
+            else:
+                postings.append(item)
+            if max_people is not None and count >= max_people:
+                break
+    finally:
+        stream.close()
+        if writer is not None:
+            writer.close()
+    result: dict[str, Any] = {"people_count": count, "seconds": round(time.monotonic() - started, 3), "stages": pipeline.metrics()}
+    if writer is not None:
+        result["path"] = str(path)
+    else:
+        result["people"] = people
+        result["job_postings"] = postings
+    return result
@@ -0,0 +1,173 @@
+import csv
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.importer import read_records
+from universal_mcp_apollo.normalize import canonical_email, is_valid_email
+
+ALGORITHMS = ("md5", "sha256")
+CHUNK_SIZE = 20_000
+# Inputs up to this many addresses are hashed in-process.
+POOL_THRESHOLD = 1_000_000
+
+
+def hash_email(email: Any, algorithm: str = "sha256") -> Optional[str]:
+    """Hex digest of the canonical form of ``email``, or None if it is not a valid address."""
+    email = canonical_email(email)
+    if not is_valid_email(email):
+        return None
+    return hashlib.new(algorithm, email.encode()).hexdigest()
+
+
+def _hash_chunk(args: tuple[list[Any], str]) -> list[Optional[str]]:
+    emails, algorithm = args
+    return [hash_email(email, algorithm) for email in emails]
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    items = iter(items)
+    while chunk := list(itertools.islice(items, size)):
+        yield chunk
+
+
+def _hash_in_pool(chunks: Iterator[list[Any]], algorithm: str, processes: int) -> Iterator[Optional[str]]:
+    # At most two chunks per process are in flight, so the input is never held whole.
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_hash_chunk, (chunk, algorithm)))
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def iter_hashes(emails: Iterable[Any], algorithm: str = "sha256", processes: Optional[int] = None, chunk_size: int = CHUNK_SIZE, pool_threshold: int = POOL_THRESHOLD) -> Iterator[Optional[str]]:
+    """
+    Canonicalize and hash a stream of email addresses, in input order,
+    reading ``emails`` one chunk at a time.
+
+    Hashing runs in-process unless more than one process is available (one
+    per core by default) and the input exceeds ``pool_threshold`` addresses;
+    below that, starting a process pool costs more than it saves.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unsupported algorithm {algorithm!r}; expected one of {ALGORITHMS}.")
+    processes = processes or os.cpu_count() or 1
+    chunks = _chunks(emails, chunk_size)
+
+    def generate() -> Iterator[Optional[str]]:
+        head: list[list[Any]] = []
+        if processes > 1:
+            seen = 0
+            for chunk in chunks:
+                head.append(chunk)
+                seen += len(chunk)
+                if seen > pool_threshold:
+                    yield from _hash_in_pool(itertools.chain(head, chunks), algorithm, processes)
+                    return
+        for chunk in itertools.chain(head, chunks):
+            yield from _hash_chunk((chunk, algorithm))
+
+    return generate()
+
+
+def hash_emails(emails: Iterable[Any], algorithm: str = "sha256", processes: Optional[int] = None, chunk_size: int = CHUNK_SIZE, pool_threshold: int = POOL_THRESHOLD) -> list[Optional[str]]:
+    """Canonicalize and hash a column of email addresses; see :func:`iter_hashes`."""
+    return list(iter_hashes(emails, algorithm, processes=processes, chunk_size=chunk_size, pool_threshold=pool_threshold))
+
+
+class HashedEmailTable:
+    """
+    Local reverse lookup from hashed email to the input rows it came from, so
+    matches returned for a ``hashed_email`` can be mapped back to the rows.
+    """
+
+    def __init__(self, algorithm: str = "sha256") -> None:
+        self.algorithm = algorithm
+        self._rows: dict[str, list[int]] = {}
+        self.invalid_rows: list[int] = []
+
+    @classmethod
+    def build(cls, emails: Iterable[Any], algorithm: str = "sha256", processes: Optional[int] = None) -> "HashedEmailTable":
+        table = cls(algorithm)
+        for row, digest in enumerate(iter_hashes(emails, algorithm, processes=processes)):
+            table.add(row, digest)
+        return table
+
+    @classmethod
+    def from_file(cls, path: str | Path, column: str = "email", algorithm: str = "sha256", processes: Optional[int] = None) -> "HashedEmailTable":
+        # Malformed lines keep their row, as invalid emails.
+        return cls.build((record.get(column) if isinstance(record, dict) else None for record in read_records(path)), algorithm, processes)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, row: int, digest: Optional[str]) -> None:
+        if digest is None:
+            self.invalid_rows.append(row)
+        else:
+            self._rows.setdefault(digest, []).append(row)
+
+    def rows_for(self, digest: str) -> list[int]:
+        return self._rows.get(digest, [])
+
+    def details(self) -> list[dict[str, str]]:
+        """One ``bulk_people_enrichment`` detail per distinct hash."""
+        return [{"hashed_email": digest} for digest in self._rows]
+
+    def map_matches(self, details: list[dict[str, str]], matches: list[Optional[dict[str, Any]]]) -> dict[int, Optional[dict[str, Any]]]:
+        """Spread matches (aligned with ``details``) onto every original row."""
+        by_row: dict[int, Optional[dict[str, Any]]] = {}
+        for detail, match in zip(details, matches):
+            for row in self.rows_for(detail["hashed_email"]):
+                by_row[row] = match
+        return by_row
+
+    def save(self, path: str | Path) -> None:
+        with open(Path(path).expanduser(), "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("row", f"{self.algorithm}_email"))
+            for digest, rows in self._rows.items():
+                writer.writerows((row, digest) for row in rows)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "HashedEmailTable":
+        with open(Path(path).expanduser(), encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            table = cls(header[1].removesuffix("_email"))
+            for row, digest in reader:
+                table.add(int(row), digest)
+        return table
+
+
+def enrich_hashed_file(planner, path: str | Path, output_path: str | Path, column: str = "email", algorithm: str = "sha256", processes: Optional[int] = None) -> dict[str, Any]:
+    """
+    Hash an email column, enrich the distinct hashes through the enrichment
+    planner (so known people are not paid for twice) and write one NDJSON
+    line per input row with its match. Raw addresses never leave the host.
+    """
+    table = HashedEmailTable.from_file(path, column=column, algorithm=algorithm, processes=processes)
+    details = table.details()
+    result = planner.enrich(details)
+    by_row = table.map_matches(details, result["matches"])
+    output_path = Path(output_path).expanduser()
+    table.save(output_path.with_suffix(".lookup.csv"))
+    rows = max([*by_row, *table.invalid_rows], default=-1) + 1
+    with open(output_path, "w", encoding="utf-8") as f:
+        for row in range(rows):
+            match = by_row.get(row)
+            f.write(json.dumps({"row": row, "matched": match is not None, "match": match}, separators=(",", ":")) + "\n")
+    report = {**result["report"], "rows": rows, "invalid_emails": len(table.invalid_rows), "output_path": str(output_path)}
+    logger.info(f"enrich_hashed_file: {report}")
+    return report
@@ -0,0 +1,239 @@
+import csv
+import hashlib
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.normalize import is_valid_domain, is_valid_email, normalize_columns
+from universal_mcp_apollo.scheduler import BULK, priority
+
+CONTACT_FIELDS = (
+    "first_name", "last_name", "organization_name", "title", "account_id", "email",
+    "website_url", "label_names", "contact_stage_id", "present_raw_address",
+    "direct_phone", "corporate_phone", "mobile_phone", "home_phone", "other_phone",
+)
+ACCOUNT_FIELDS = ("name", "domain", "owner_id", "account_stage_id", "phone", "raw_address")
+
+MAX_ERRORS_KEPT = 100
+
+
+@dataclass(frozen=True)
+class MalformedRecord:
+    """Stands in for an NDJSON line that is not a JSON object, so it is counted rather than ending the stream."""
+
+    line: int
+    reason: str
+
+
+def read_records(path: str | Path, format: Optional[str] = None) -> Iterator[dict[str, Any] | MalformedRecord]:
+    """
+    Stream rows from a CSV or NDJSON file without loading it whole. NDJSON
+    lines that do not parse to an object are yielded as
+    :class:`MalformedRecord`.
+    """
+    path = Path(path).expanduser()
+    format = format or ("csv" if path.suffix.lower() == ".csv" else "ndjson")
+    with open(path, encoding="utf-8", newline="") as f:
+        if format == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield MalformedRecord(line_number, f"line {line_number}: not valid JSON ({e.msg})")
+                    continue
+                if isinstance(record, dict):
+                    yield record
+                else:
+                    yield MalformedRecord(line_number, f"line {line_number}: expected a JSON object, got {type(record).__name__}")
+
+
+def batched(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _contact_errors(row: dict[str, Any]) -> Optional[str]:
+    if row.get("email") and not is_valid_email(row["email"]):
+        return f"invalid email {row['email']!r}"
+    if not row.get("email") and not (row.get("first_name") and row.get("last_name")):
+        return "needs an email or a first and last name"
+    return None
+
+
+def _account_errors(row: dict[str, Any]) -> Optional[str]:
+    if row.get("domain") and not is_valid_domain(row["domain"]):
+        return f"invalid domain {row['domain']!r}"
+    if not row.get("domain") and not row.get("name"):
+        return "needs a name or a domain"
+    return None
+
+
+def _contact_key(row: dict[str, Any]) -> str:
+    if row.get("email"):
+        return f"email:{row['email']}"
+    names = (row.get("first_name"), row.get("last_name"), row.get("organization_name"))
+    return "name:" + "|".join(str(v or "").casefold() for v in names)
+
+
+def _account_key(row: dict[str, Any]) -> str:
+    return f"domain:{row['domain']}" if row.get("domain") else f"name:{str(row.get('name')).casefold()}"
+
+
+@dataclass(frozen=True)
+class ImportTarget:
+    fields: tuple[str, ...]
+    validate: Callable[[dict[str, Any]], Optional[str]]
+    key: Callable[[dict[str, Any]], str]
+    create: Callable[[Any, dict[str, Any]], Any]
+
+
+def _create_contact(app, row: dict[str, Any]) -> Any:
+    labels = row.pop("label_names", None)
+    if isinstance(labels, str):
+        labels = [label.strip() for label in labels.split(";") if label.strip()]
+    return app.create_a_contact(label_names_=labels or None, **row)
+
+
+TARGETS: dict[str, ImportTarget] = {
+    "contacts": ImportTarget(CONTACT_FIELDS, _contact_errors, _contact_key, _create_contact),
+    "accounts": ImportTarget(ACCOUNT_FIELDS, _account_errors, _account_key, lambda app, row: app.create_an_account(**row)),
+}
+
+
+@dataclass
+class ImportStats:
+    read: int = 0
+    invalid: int = 0
+    duplicates: int = 0
+    created: int = 0
+    failed: int = 0
+    started: float = field(default_factory=time.monotonic)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    def error(self, row_number: int, reason: str) -> None:
+        if len(self.errors) < MAX_ERRORS_KEPT:
+            self.errors.append({"row": row_number, "error": reason})
+
+    def snapshot(self) -> dict[str, Any]:
+        elapsed = time.monotonic() - self.started
+        return {
+            "read": self.read,
+            "invalid": self.invalid,
+            "duplicates": self.duplicates,
+            "created": self.created,
+            "failed": self.failed,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(self.read / elapsed, 1) if elapsed else 0.0,
+            "created_per_second": round(self.created / elapsed, 1) if elapsed else 0.0,
+        }
+
+
+class ImportPipeline:
+    """
+    Streaming import of CSV/NDJSON rows into Apollo contacts or accounts.
+
+    read -> normalize/validate (a batch at a time, column by column) ->
+    dedup -> concurrent create. Only one batch plus the writes in flight are
+    held in memory; the dedup set keeps an 8-byte digest per unique row.
+    """
+
+    def __init__(
+        self,
+        app,
+        target: str = "contacts",
+        batch_size: int = 500,
+        workers: int = 8,
+        progress_interval: float = 5.0,
+        on_progress: Optional[Callable[[dict[str, Any]], None]] = None,
+    ) -> None:
+        if target not in TARGETS:
+            raise ValueError(f"Unknown import target {target!r}; expected one of {sorted(TARGETS)}.")
+        self.app = app
+        self.target = TARGETS[target]
+        self.batch_size = batch_size
+        self.workers = workers
+        self.progress_interval = progress_interval
+        self.on_progress = on_progress
+        self.stats = ImportStats()
+        self._seen: set[bytes] = set()
+        self._lock = threading.Lock()
+        self._last_report = 0.0
+
+    def _prepare(self, batch: list[tuple[int, Any]]) -> list[tuple[int, dict[str, Any]]]:
+        malformed = [(row_number, raw) for row_number, raw in batch if not isinstance(raw, dict)]
+        for row_number, raw in malformed:
+            self.stats.invalid += 1
+            self.stats.error(row_number, raw.reason if isinstance(raw, MalformedRecord) else f"expected an object, got {type(raw).__name__}")
+        if malformed:
+            batch = [(row_number, raw) for row_number, raw in batch if isinstance(raw, dict)]
+        rows = [{k: v for k, v in raw.items() if k in self.target.fields and v not in (None, "")} for _, raw in batch]
+        normalize_columns(rows)
+        ready = []
+        for (row_number, _), row in zip(batch, rows):
+            row = {k: v for k, v in row.items() if v is not None}
+            reason = self.target.validate(row)
+            if reason:
+                self.stats.invalid += 1
+                self.stats.error(row_number, reason)
+                continue
+            digest = hashlib.blake2b(self.target.key(row).encode(), digest_size=8).digest()
+            if digest in self._seen:
+                self.stats.duplicates += 1
+                continue
+            self._seen.add(digest)
+            ready.append((row_number, row))
+        return ready
+
+    def _write(self, row_number: int, row: dict[str, Any]) -> None:
+        try:
+            with priority(BULK):
+                self.target.create(self.app, row)
+        except Exception as e:
+            with self._lock:
+                self.stats.failed += 1
+                self.stats.error(row_number, str(e))
+        else:
+            with self._lock:
+                self.stats.created += 1
+        self._report()
+
+    def _report(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_report < self.progress_interval:
+            return
+        self._last_report = now
+        snapshot = self.stats.snapshot()
+        logger.info(f"ImportPipeline: {snapshot}")
+        if self.on_progress is not None:
+            self.on_progress(snapshot)
+
+    def run(self, records: Iterable[dict[str, Any]]) -> dict[str, Any]:
+        """Import ``records`` and return the final statistics and first errors."""
+        pending: set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="apollo-import") as pool:
+            for batch in batched(enumerate(records, start=1), self.batch_size):
+                self.stats.read += len(batch)
+                for row_number, row in self._prepare(batch):
+                    if len(pending) >= self.workers * 2:
+                        _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    # In a copy of the caller's context, so the write is profiled with the tool call.
+                    pending.add(pool.submit(copy_context().run, self._write, row_number, row))
+            wait(pending)
+        self._report(force=True)
+        return {**self.stats.snapshot(), "errors": self.stats.errors}
+
+    def run_file(self, path: str | Path, format: Optional[str] = None) -> dict[str, Any]:
+        return self.run(read_records(path, format=format))
@@ -0,0 +1,312 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import httpx
+from loguru import logger
+
+from universal_mcp_apollo.scheduler import BULK, priority
+
+PENDING = "pending"
+DISPATCHED = "dispatched"
+DONE = "done"
+FAILED = "failed"
+UNKNOWN = "unknown"
+
+DEFAULT_JOURNAL_PATH = Path.home() / ".universal_mcp_apollo" / "jobs.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    options TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total_items INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    items TEXT NOT NULL,
+    state TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+
+@dataclass(frozen=True)
+class JobKind:
+    """How to split a job into chunks and send one chunk to Apollo."""
+
+    chunk_size: int
+    idempotent: bool
+    call: Callable[[Any, dict[str, Any], list[Any]], Any]
+
+
+JOB_KINDS: dict[str, JobKind] = {
+    "bulk_people_enrichment": JobKind(
+        10, False, lambda app, options, items: app.bulk_people_enrichment(details=items, **options)
+    ),
+    "bulk_organization_enrichment": JobKind(
+        10, False, lambda app, options, items: app.bulk_organization_enrichment(domains_=items, **options)
+    ),
+    "add_contacts_to_sequence": JobKind(
+        100, False, lambda app, options, items: app.add_contacts_to_sequence(contact_ids_=items, **options)
+    ),
+    "update_contact_stage": JobKind(
+        100, True, lambda app, options, items: app.update_contact_stage(contact_ids_=items, **options)
+    ),
+    "update_contact_ownership": JobKind(
+        100, True, lambda app, options, items: app.update_contact_ownership(contact_ids_=items, **options)
+    ),
+}
+
+
+class JobJournal:
+    """
+    SQLite journal of bulk jobs and the state of each of their chunks.
+
+    A chunk is marked ``dispatched`` and committed *before* its request is
+    sent, so after a crash the journal tells us which chunks might already
+    have reached Apollo.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_JOURNAL_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def create_job(self, kind: str, options: dict[str, Any], chunks: list[list[Any]]) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(options), PENDING, sum(map(len, chunks)), now, now),
+            )
+            self._conn.executemany(
+                "INSERT INTO chunks VALUES (?, ?, ?, ?, NULL, NULL, ?)",
+                [(job_id, seq, json.dumps(items), PENDING, now) for seq, items in enumerate(chunks)],
+            )
+        return job_id
+
+    def job(self, job_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, kind, options, status, total_items, created_at, updated_at FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("id", "kind", "options", "status", "total_items", "created_at", "updated_at")
+        job = dict(zip(keys, row))
+        job["options"] = json.loads(job["options"])
+        return job
+
+    def job_ids(self, statuses: Optional[tuple[str, ...]] = None) -> list[str]:
+        with self._lock:
+            if statuses is None:
+                rows = self._conn.execute("SELECT id FROM jobs ORDER BY created_at").fetchall()
+            else:
+                marks = ",".join("?" * len(statuses))
+                rows = self._conn.execute(
+                    f"SELECT id FROM jobs WHERE status IN ({marks}) ORDER BY created_at", statuses
+                ).fetchall()
+        return [row[0] for row in rows]
+
+    def set_job_status(self, job_id: str, status: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?", (status, time.time(), job_id)
+            )
+
+    def chunks(self, job_id: str, states: tuple[str, ...]) -> list[tuple[int, list[Any]]]:
+        marks = ",".join("?" * len(states))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT seq, items FROM chunks WHERE job_id = ? AND state IN ({marks}) ORDER BY seq",
+                (job_id, *states),
+            ).fetchall()
+        return [(seq, json.loads(items)) for seq, items in rows]
+
+    def mark(self, job_id: str, seq: int, state: str, result: Any = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE chunks SET state = ?, result = ?, error = ?, updated_at = ? WHERE job_id = ? AND seq = ?",
+                (state, None if result is None else json.dumps(result), error, time.time(), job_id, seq),
+            )
+
+    def reset(self, job_id: str, from_states: tuple[str, ...], to_state: str) -> int:
+        marks = ",".join("?" * len(from_states))
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE chunks SET state = ?, updated_at = ? WHERE job_id = ? AND state IN ({marks})",
+                (to_state, time.time(), job_id, *from_states),
+            )
+        return cursor.rowcount
+
+    def results(self, job_id: str) -> list[Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT result FROM chunks WHERE job_id = ? AND state = ? ORDER BY seq", (job_id, DONE)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows if row[0] is not None]
+
+    def progress(self, job_id: str) -> Optional[dict[str, Any]]:
+        job = self.job(job_id)
+        if job is None:
+            return None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*), SUM(json_array_length(items)) FROM chunks WHERE job_id = ? GROUP BY state",
+                (job_id,),
+            ).fetchall()
+        chunks = {state: 0 for state in (PENDING, DISPATCHED, DONE, FAILED, UNKNOWN)}
+        items = dict(chunks)
+        for state, count, item_count in rows:
+            chunks[state] = count
+            items[state] = item_count or 0
+        job.pop("options")
+        job["chunks"] = chunks
+        job["items"] = items
+        job["percent_complete"] = round(100.0 * items[DONE] / job["total_items"], 1) if job["total_items"] else 100.0
+        return job
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _rejected(error: Exception) -> bool:
+    """True if Apollo answered ``error`` with a 4xx, i.e. definitely did not act on the request."""
+    return isinstance(error, httpx.HTTPStatusError) and 400 <= error.response.status_code < 500
+
+
+class JobRunner:
+    """
+    Runs bulk jobs chunk by chunk against an ``ApolloApp``, journaling each
+    chunk so a restarted process resumes where the previous one stopped.
+
+    Non-idempotent calls are dispatched at most once: a chunk found in the
+    ``dispatched`` state on resume may or may not have reached Apollo, so it
+    is parked as ``unknown`` instead of being sent again. The same goes for
+    a chunk whose call ends in a timeout, dropped connection, 5xx or any
+    other error short of a 4xx rejection; only rejected chunks are
+    ``failed`` and retried by default.
+    """
+
+    def __init__(self, app, journal: JobJournal, workers: int = 4) -> None:
+        self.app = app
+        self.journal = journal
+        self.workers = workers
+        self._threads: dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, items: list[Any], background: bool = True, **options) -> str:
+        """
+        Journal a new job and start running it.
+
+        Raises:
+            ValueError: If ``kind`` is not a supported job kind.
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind {kind!r}; expected one of {sorted(JOB_KINDS)}.")
+        size = JOB_KINDS[kind].chunk_size
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        job_id = self.journal.create_job(kind, options, chunks)
+        logger.info(f"JobRunner: created {kind} job {job_id} with {len(chunks)} chunks.")
+        if background:
+            self.start(job_id)
+        else:
+            self.run(job_id)
+        return job_id
+
+    def start(self, job_id: str) -> None:
+        with self._lock:
+            thread = self._threads.get(job_id)
+            if thread is not None and thread.is_alive():
+                return
+            thread = threading.Thread(target=self.run, args=(job_id,), name=f"apollo-job-{job_id}", daemon=True)
+            self._threads[job_id] = thread
+            thread.start()
+
+    def active(self) -> int:
+        """Number of jobs running on background threads."""
+        with self._lock:
+            return sum(thread.is_alive() for thread in self._threads.values())
+
+    def run(self, job_id: str) -> None:
+        """Dispatch every pending chunk of the job, blocking until done."""
+        job = self.journal.job(job_id)
+        if job is None:
+            raise ValueError(f"Unknown job {job_id!r}.")
+        kind = JOB_KINDS[job["kind"]]
+        self.journal.set_job_status(job_id, "running")
+
+        def dispatch(chunk: tuple[int, list[Any]]) -> None:
+            seq, items = chunk
+            self.journal.mark(job_id, seq, DISPATCHED)
+            try:
+                with priority(BULK):
+                    result = kind.call(self.app, job["options"], items)
+            except Exception as e:
+                state = FAILED if kind.idempotent or _rejected(e) else UNKNOWN
+                logger.warning(f"JobRunner: job {job_id} chunk {seq} {'failed' if state == FAILED else 'may or may not have been applied'}: {e}")
+                self.journal.mark(job_id, seq, state, error=str(e))
+            else:
+                self.journal.mark(job_id, seq, DONE, result=result)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"apollo-job-{job_id[:8]}") as pool:
+            list(pool.map(dispatch, self.journal.chunks(job_id, (PENDING,))))
+        progress = self.journal.progress(job_id)
+        status = "completed" if progress["chunks"][DONE] == sum(progress["chunks"].values()) else "needs_attention"
+        self.journal.set_job_status(job_id, status)
+        logger.info(f"JobRunner: job {job_id} finished with status {status}.")
+
+    def resume(self) -> list[str]:
+        """Restart every job left unfinished by a previous process."""
+        job_ids = self.journal.job_ids(("pending", "running"))
+        for job_id in job_ids:
+            kind = JOB_KINDS[self.journal.job(job_id)["kind"]]
+            in_doubt = self.journal.reset(job_id, (DISPATCHED,), PENDING if kind.idempotent else UNKNOWN)
+            if in_doubt:
+                logger.warning(
+                    f"JobRunner: job {job_id} had {in_doubt} chunk(s) in flight at shutdown; "
+                    + ("retrying them." if kind.idempotent else "marked unknown, not resent.")
+                )
+            self.start(job_id)
+        return job_ids
+
+    def retry(self, job_id: str, include_unknown: bool = False) -> None:
+        """
+        Re-queue failed chunks and run the job again. Chunks in the
+        ``unknown`` state are only re-sent with ``include_unknown=True``, after
+        checking in Apollo that they were not applied.
+
+        Raises:
+            ValueError: If there is no such job.
+        """
+        if self.journal.job(job_id) is None:
+            raise ValueError(f"Unknown job {job_id!r}.")
+        states = (FAILED, UNKNOWN) if include_unknown else (FAILED,)
+        self.journal.reset(job_id, states, PENDING)
+        self.start(job_id)
+
+    def progress(self, job_id: Optional[str] = None) -> list[dict[str, Any]]:
+        job_ids = [job_id] if job_id else self.journal.job_ids()
+        return [p for p in (self.journal.progress(j) for j in job_ids) if p is not None]
@@ -0,0 +1,206 @@
+import hashlib
+import inspect
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.export import SEARCH_TOOLS, NdjsonWriter
+
+_DONE = object()
+
+
+def expand_grid(grid: dict[str, list[Any]], base: Optional[dict[str, Any]] = None) -> Iterator[dict[str, Any]]:
+    """
+    Lazily expand a grid of alternatives into one filter set per combination.
+
+    ``{"person_titles_": ["cto", "vp engineering"], "person_locations_": ["Berlin", "Paris"]}``
+    yields four filter sets. For array parameters (names ending in ``_``) a
+    scalar alternative is wrapped in a list. ``base`` is merged into every set.
+    Combinations are produced one at a time, so a large grid is never held in
+    memory.
+    """
+    names = list(grid)
+    axes = [
+        [[v] if name.endswith("_") and not isinstance(v, list) else v for v in grid[name]]
+        for name in names
+    ]
+    for combination in itertools.product(*axes):
+        yield {**(base or {}), **dict(zip(names, combination))}
+
+
+def id_key(value: Any) -> int:
+    """
+    Compact integer key for a record ID. Apollo IDs are 24 hex digits and map
+    to their exact value; anything else maps to a 64-bit digest.
+    """
+    text = str(value)
+    if len(text) <= 32:
+        try:
+            return int(text, 16)
+        except ValueError:
+            pass
+    return -int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big") - 1
+
+
+@dataclass
+class QueryStats:
+    filters: dict[str, Any]
+    records: int = 0
+    new: int = 0
+    pages: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class MultiSearch:
+    """
+    Runs several filter sets of a search tool concurrently and streams the
+    union of their results, deduplicated by record ID.
+
+    Only a set of integer IDs and one page per running query are held in
+    memory. Each yielded record carries ``matched_query``, the index of the
+    first filter set that returned it; a later hit by another filter set
+    counts towards that set's ``records`` but not its ``new``.
+    """
+
+    app: Any
+    tool: str = "people_search"
+    per_page: int = 100
+    max_pages: Optional[int] = 1
+    workers: int = 4
+    stats: list[QueryStats] = field(default_factory=list)
+    duplicates: int = 0
+
+    def __post_init__(self) -> None:
+        if self.tool not in SEARCH_TOOLS:
+            raise ValueError(f"Unsupported search tool {self.tool!r}; expected one of {sorted(SEARCH_TOOLS)}.")
+        self._keys = SEARCH_TOOLS[self.tool]
+        self._parameters = set(inspect.signature(getattr(self.app, self.tool)).parameters) - {"page", "per_page"}
+        self._seen: set[int] = set()
+        self._stop = threading.Event()
+
+    def _check(self, filters: dict[str, Any]) -> dict[str, Any]:
+        unknown = set(filters) - self._parameters
+        if unknown:
+            raise ValueError(f"Unknown {self.tool} parameters: {sorted(unknown)}")
+        return filters
+
+    def _run_query(self, index: int, filters: dict[str, Any], results: queue.Queue) -> None:
+        try:
+            page = 1
+            while not self._stop.is_set() and (self.max_pages is None or page <= self.max_pages):
+                payload = getattr(self.app, self.tool)(page=page, per_page=self.per_page, **filters) or {}
+                records = [r for key in self._keys for r in payload.get(key) or []]
+                results.put((index, records))
+                total_pages = int((payload.get("pagination") or {}).get("total_pages") or page)
+                if not records or page >= total_pages:
+                    break
+                page += 1
+        except Exception as e:
+            results.put((index, e))
+        finally:
+            results.put((index, _DONE))
+
+    def run(self, queries: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Yield the deduplicated union of the results of ``queries``."""
+        queries = enumerate(queries)
+        results: queue.Queue = queue.Queue(maxsize=self.workers * 2)
+        running = 0
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"apollo-{self.tool}") as pool:
+
+            def submit() -> bool:
+                nonlocal running
+                item = next(queries, None)
+                if item is None:
+                    return False
+                index, filters = item
+                self.stats.append(QueryStats(self._check(filters)))
+                # Run under a copy of the caller's context so its priority applies.
+                pool.submit(copy_context().run, self._run_query, index, filters, results)
+                running += 1
+                return True
+
+            try:
+                while running < self.workers and submit():
+                    pass
+                while running:
+                    index, item = results.get()
+                    stats = self.stats[index]
+                    if item is _DONE:
+                        running -= 1
+                        submit()
+                    elif isinstance(item, Exception):
+                        stats.error = str(item)
+                        logger.warning(f"MultiSearch: query {index} failed: {item}")
+                    else:
+                        stats.pages += 1
+                        stats.records += len(item)
+                        for record in item:
+                            record_id = record.get("id")
+                            if record_id is not None:
+                                key = id_key(record_id)
+                                if key in self._seen:
+                                    self.duplicates += 1
+                                    continue
+                                self._seen.add(key)
+                            stats.new += 1
+                            yield {**record, "matched_query": index}
+            finally:
+                self._stop.set()
+                while running:
+                    if results.get()[1] is _DONE:
+                        running -= 1
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "queries": len(self.stats),
+            "unique_records": sum(s.new for s in self.stats),
+            "duplicates": self.duplicates,
+            "per_query": [s.__dict__ for s in self.stats],
+        }
+
+
+def multi_search(
+    app,
+    queries: Optional[list[dict[str, Any]]] = None,
+    grid: Optional[dict[str, list[Any]]] = None,
+    filters: Optional[dict[str, Any]] = None,
+    tool: str = "people_search",
+    per_page: int = 100,
+    max_pages: Optional[int] = 1,
+    max_results: Optional[int] = None,
+    path: Optional[str | Path] = None,
+    workers: int = 4,
+) -> dict[str, Any]:
+    """
+    Run explicit filter sets and/or a grid of alternatives and collect the
+    deduplicated union, either in the result or streamed to an NDJSON file.
+    """
+    if not queries and not grid:
+        raise ValueError("Provide 'queries', 'grid' or both.")
+    sets = itertools.chain(
+        ({**(filters or {}), **q} for q in queries or []),
+        expand_grid(grid, filters) if grid else (),
+    )
+    search = MultiSearch(app, tool=tool, per_page=per_page, max_pages=max_pages, workers=workers)
+    stream = search.run(sets)
+    records = itertools.islice(stream, max_results) if max_results is not None else stream
+    try:
+        if path is None:
+            return {"records": list(records), **search.summary()}
+        writer = NdjsonWriter(Path(path).expanduser())
+        try:
+            for record in records:
+                writer.write([record])
+        finally:
+            writer.close()
+        return {"path": str(path), **search.summary()}
+    finally:
+        stream.close()
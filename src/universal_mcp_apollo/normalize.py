@@ -0,0 +1,305 @@
+import re
+from typing import Any, Callable, Optional
+
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[a-z]{2,}$")
+_DOMAIN = re.compile(r"^(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,}$")
+_PHONE_EXTENSION = re.compile(r"\s*(?:ext\.?|x|#)\s*\d+\s*$", re.IGNORECASE)
+_NON_DIGITS = re.compile(r"\D")
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def canonical_email(value: Any) -> Optional[str]:
+    """Lower-cased, trimmed email address (``mailto:`` and angle brackets removed)."""
+    text = _text(value)
+    if text is None:
+        return None
+    text = text.removeprefix("mailto:").strip("<> ").lower()
+    return text or None
+
+
+def is_valid_email(value: Optional[str]) -> bool:
+    return bool(value) and bool(_EMAIL.match(value))
+
+
+def canonical_domain(value: Any) -> Optional[str]:
+    """
+    Bare host name from a domain, URL or email address, e.g.
+    ``"https://www.Acme.com/about"`` and ``"jo@acme.com"`` both give ``"acme.com"``.
+    """
+    text = _text(value)
+    if text is None:
+        return None
+    text = text.lower()
+    if "@" in text and "/" not in text:
+        text = text.rsplit("@", 1)[1]
+    text = text.split("://", 1)[-1]
+    text = re.split(r"[/?#]", text, maxsplit=1)[0]
+    text = text.split(":", 1)[0].strip(". ")
+    text = text.removeprefix("www.")
+    return text or None
+
+
+def is_valid_domain(value: Optional[str]) -> bool:
+    return bool(value) and bool(_DOMAIN.match(value))
+
+
+def canonical_phone(value: Any) -> Optional[str]:
+    """Digits of a phone number, keeping a leading ``+`` and dropping extensions."""
+    text = _text(value)
+    if text is None:
+        return None
+    text = _PHONE_EXTENSION.sub("", text)
+    digits = _NON_DIGITS.sub("", text)
+    if not digits:
+        return None
+    if text.startswith("+"):
+        return f"+{digits}"
+    if text.startswith("00"):
+        return f"+{digits[2:]}"
+    return digits
+
+
+CANONICALIZERS: dict[str, Callable[[Any], Optional[str]]] = {
+    "email": canonical_email,
+    "domain": canonical_domain,
+    "phone": canonical_phone,
+    "direct_phone": canonical_phone,
+    "corporate_phone": canonical_phone,
+    "mobile_phone": canonical_phone,
+    "home_phone": canonical_phone,
+    "other_phone": canonical_phone,
+}
+
+
+def normalize_columns(rows: list[dict[str, Any]], canonicalizers: Optional[dict[str, Callable[[Any], Any]]] = None) -> list[dict[str, Any]]:
+    """
+    Canonicalize a batch of rows column by column, in place.
+
+    Each canonicalizer is applied with ``map`` over the whole column at once,
+    which keeps the per-value overhead to a single function call.
+    """
+    canonicalizers = CANONICALIZERS if canonicalizers is None else canonicalizers
+    if not rows:
+        return rows
+    present = {key for row in rows for key in row}
+    for field, canonicalize in canonicalizers.items():
+        if field not in present:
+            continue
+        column = map(canonicalize, (row.get(field) for row in rows))
+        for row, value in zip(rows, column):
+            if field in row:
+                row[field] = value
+    return rows
+
+
+_LEGAL_SUFFIXES = frozenset(
+    "inc incorporated llc llp ltd limited corp corporation co company gmbh ag sa sas srl bv nv plc pty pte oy ab as".split()
+)
+_NAME_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def canonical_linkedin(value: Any) -> Optional[str]:
+    """LinkedIn profile URL reduced to ``linkedin.com/in/<slug>`` form."""
+    text = _text(value)
+    if text is None:
+        return None
+    text = text.lower().split("?", 1)[0].split("#", 1)[0].rstrip("/")
+    text = text.split("://", 1)[-1]
+    for prefix in ("www.", "m."):
+        text = text.removeprefix(prefix)
+    if "." in text.split("/", 1)[0] and text.split("/", 1)[0].endswith("linkedin.com"):
+        text = "linkedin.com" + text[text.index("/"):] if "/" in text else "linkedin.com"
+    return text or None
+
+
+def canonical_company_name(value: Any) -> Optional[str]:
+    """Company name folded for matching, e.g. ``"The ACME, Inc."`` gives ``"acme"``."""
+    text = _text(value)
+    if text is None:
+        return None
+    tokens = _NAME_PUNCTUATION.sub(" ", text.casefold()).split()
+    if tokens and tokens[0] == "the":
+        tokens = tokens[1:]
+    while len(tokens) > 1 and tokens[-1] in _LEGAL_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens) or None
+
+
+def _person_keys(row: dict[str, Any]) -> list[str]:
+    keys = []
+    if row.get("id"):
+        keys.append(f"id:{row['id']}")
+    email = canonical_email(row.get("email"))
+    if email:
+        keys.append(f"email:{email}")
+    if row.get("hashed_email"):
+        keys.append(f"hash:{str(row['hashed_email']).strip().lower()}")
+    linkedin = canonical_linkedin(row.get("linkedin_url"))
+    if linkedin:
+        keys.append(f"li:{linkedin}")
+    name = row.get("name") or " ".join(p for p in (row.get("first_name"), row.get("last_name")) if p)
+    company = canonical_domain(row.get("domain")) or canonical_company_name(row.get("organization_name"))
+    # Two people can share a name at one company, so this weak key only joins rows without an email.
+    if name and company and not email:
+        keys.append(f"person:{' '.join(str(name).casefold().split())}@{company}")
+    return keys
+
+
+def _person_identity(row: dict[str, Any]) -> dict[str, str]:
+    identity = {}
+    if row.get("id"):
+        identity["id"] = str(row["id"])
+    email = canonical_email(row.get("email"))
+    if email:
+        identity["email"] = email
+    if row.get("hashed_email"):
+        identity["hashed_email"] = str(row["hashed_email"]).strip().lower()
+    linkedin = canonical_linkedin(row.get("linkedin_url"))
+    if linkedin:
+        identity["linkedin_url"] = linkedin
+    return identity
+
+
+def _organization_keys(row: dict[str, Any]) -> list[str]:
+    keys = []
+    domain = canonical_domain(row.get("domain") or row.get("website_url"))
+    if domain:
+        keys.append(f"domain:{domain}")
+    name = canonical_company_name(row.get("name") or row.get("organization_name"))
+    if name:
+        keys.append(f"name:{name}")
+        keys.append(f"name:{name.replace(' ', '')}")
+    return keys
+
+
+def _organization_identity(row: dict[str, Any]) -> dict[str, str]:
+    domain = canonical_domain(row.get("domain") or row.get("website_url"))
+    return {"domain": domain} if domain else {}
+
+
+KEY_FUNCTIONS: dict[str, Callable[[dict[str, Any]], list[str]]] = {
+    "people": _person_keys,
+    "organizations": _organization_keys,
+}
+
+# Strong identifiers: rows (or groups) holding different values for one of
+# these are different people or companies, whatever weaker keys they share.
+IDENTITY_FUNCTIONS: dict[str, Callable[[dict[str, Any]], dict[str, str]]] = {
+    "people": _person_identity,
+    "organizations": _organization_identity,
+}
+
+
+class DedupResult:
+    """
+    Outcome of :func:`dedup`: ``group_of[i]`` is the group of input row ``i``
+    and ``members[g]`` lists the input rows folded into group ``g``.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]], group_of: list[int], members: list[list[int]]) -> None:
+        self.rows = rows
+        self.group_of = group_of
+        self.members = members
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    @property
+    def unique_rows(self) -> list[dict[str, Any]]:
+        """One row per group, filling each field from the first row that has it."""
+        merged = []
+        for indices in self.members:
+            row: dict[str, Any] = {}
+            for i in indices:
+                for key, value in self.rows[i].items():
+                    if value not in (None, "") and key not in row:
+                        row[key] = value
+            merged.append(row)
+        return merged
+
+    def fold_back(self, group_results: list[Any]) -> list[Any]:
+        """Map one result per group back onto every original row."""
+        return [group_results[g] for g in self.group_of]
+
+
+def _find(parent: list[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union(parent: list[int], identities: list[dict[str, str]], i: int, j: int) -> None:
+    """Join the groups of rows ``i`` and ``j`` unless their identifiers conflict."""
+    a, b = _find(parent, i), _find(parent, j)
+    if a == b:
+        return
+    ours, theirs = identities[a], identities[b]
+    if any(theirs.get(field, value) != value for field, value in ours.items()):
+        return
+    root, child = min(a, b), max(a, b)
+    parent[child] = root
+    identities[root] = {**ours, **theirs}
+
+
+def dedup(rows: list[dict[str, Any]], kind: str = "people", fuzzy: bool = False, threshold: float = 0.92) -> DedupResult:
+    """
+    Group rows that refer to the same person or organization.
+
+    Every row is reduced to canonical match keys (email, LinkedIn URL, domain,
+    folded company name, ...). Rows sharing any key are joined with a
+    union-find over a hash index of first-seen keys, which is linear in the
+    number of rows. Rows never join when a strong identifier (ID, email,
+    hashed email, LinkedIn URL; domain for organizations) differs, so a weak
+    key such as a shared name cannot fold two people or companies together.
+    With ``fuzzy=True`` organization names are additionally compared within
+    small blocks of names sharing a prefix.
+    """
+    key_function = KEY_FUNCTIONS[kind]
+    parent = list(range(len(rows)))
+    identities = list(map(IDENTITY_FUNCTIONS[kind], rows))
+    first_seen: dict[str, int] = {}
+    for i, keys in enumerate(map(key_function, rows)):
+        for key in keys:
+            j = first_seen.setdefault(key, i)
+            if j != i:
+                _union(parent, identities, i, j)
+
+    if fuzzy and kind == "organizations":
+        _fuzzy_join(first_seen, parent, identities, threshold)
+
+    group_of = [0] * len(rows)
+    members: list[list[int]] = []
+    group_ids: dict[int, int] = {}
+    for i in range(len(rows)):
+        root = _find(parent, i)
+        if root not in group_ids:
+            group_ids[root] = len(members)
+            members.append([])
+        group_of[i] = group_ids[root]
+        members[group_ids[root]].append(i)
+    return DedupResult(rows, group_of, members)
+
+
+def _fuzzy_join(first_seen: dict[str, int], parent: list[int], identities: list[dict[str, str]], threshold: float, max_block: int = 50) -> None:
+    from difflib import SequenceMatcher
+
+    blocks: dict[str, list[tuple[str, int]]] = {}
+    for key, i in first_seen.items():
+        if key.startswith("name:") and len(key) > 8:
+            blocks.setdefault(key[5:9], []).append((key[5:], i))
+    for block in blocks.values():
+        if len(block) < 2 or len(block) > max_block:
+            continue
+        for x, (name_a, i) in enumerate(block):
+            matcher = SequenceMatcher(None, b=name_a)
+            for name_b, j in block[x + 1:]:
+                matcher.set_seq1(name_b)
+                if matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold:
+                    _union(parent, identities, i, j)
@@ -0,0 +1,368 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.normalize import (
+    canonical_domain,
+    canonical_email,
+    canonical_linkedin,
+    dedup,
+    is_valid_domain,
+)
+from universal_mcp_apollo.scheduler import BULK, priority
+
+BULK_MATCH_LIMIT = 10
+BULK_ORGANIZATION_LIMIT = 10
+
+
+def _email_key(email: Optional[str]) -> Optional[str]:
+    email = canonical_email(email)
+    return email if email and "@" in email else None
+
+
+_linkedin_key = canonical_linkedin
+
+
+def _detail_keys(detail: dict[str, Any]) -> list[tuple[str, str]]:
+    """Identity keys of an enrichment input, strongest first."""
+    keys = []
+    if detail.get("id"):
+        keys.append(("id", detail["id"]))
+    email = _email_key(detail.get("email"))
+    if email:
+        keys.append(("email", email))
+    if detail.get("hashed_email"):
+        keys.append(("hashed_email", detail["hashed_email"].strip().lower()))
+    linkedin = _linkedin_key(detail.get("linkedin_url"))
+    if linkedin:
+        keys.append(("linkedin_url", linkedin))
+    return keys
+
+
+def _record_keys(record: dict[str, Any]) -> list[tuple[str, str]]:
+    keys = []
+    for id_field in ("id", "person_id"):
+        if record.get(id_field):
+            keys.append(("id", record[id_field]))
+    email = _email_key(record.get("email"))
+    if email:
+        keys.append(("email", email))
+        keys.append(("hashed_email", hashlib.md5(email.encode()).hexdigest()))
+        keys.append(("hashed_email", hashlib.sha256(email.encode()).hexdigest()))
+    linkedin = _linkedin_key(record.get("linkedin_url"))
+    if linkedin:
+        keys.append(("linkedin_url", linkedin))
+    return keys
+
+
+def _contradicts(detail: dict[str, Any], record: dict[str, Any]) -> bool:
+    """True if ``record`` has an identifier of a kind ``detail`` gives, but never the same value."""
+    record_keys = _record_keys(record)
+    for kind, value in _detail_keys(detail):
+        values = {v for k, v in record_keys if k == kind}
+        if values and value not in values:
+            return True
+    return False
+
+
+def _align_matches(details: list[dict[str, Any]], matches: list[Optional[dict[str, Any]]]) -> list[Optional[dict[str, Any]]]:
+    """
+    Pair each request of a bulk_match call with its match.
+
+    Apollo answers in request order with null where nothing matched, so a
+    response of the right length is paired by position, except where the
+    match at a position contradicts the request's identifiers. Those
+    requests, and all requests of a short or long response, are paired by
+    shared identifier instead, or get None: a request never receives
+    another person's record.
+    """
+    by_key: dict[tuple[str, str], dict[str, Any]] = {}
+    for match in matches:
+        for key in _record_keys(match) if match else ():
+            by_key.setdefault(key, match)
+    positional = len(matches) == len(details)
+    if not positional:
+        logger.warning(f"EnrichmentPlanner: bulk_match returned {len(matches)} matches for {len(details)} requests; pairing by identifier.")
+    aligned = []
+    for position, detail in enumerate(details):
+        match = matches[position] if positional else None
+        if match is None or _contradicts(detail, match):
+            match = next((by_key[key] for key in _detail_keys(detail) if key in by_key), None)
+        aligned.append(match)
+    return aligned
+
+
+class PersonIndex:
+    """
+    Local index of people and contacts already held, reachable by Apollo
+    ``id``, email, MD5/SHA-256 hashed email or LinkedIn URL in O(1).
+    """
+
+    def __init__(self) -> None:
+        self._records: dict[tuple[str, str], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len({id(record) for record in self._records.values()})
+
+    def add(self, record: Optional[dict[str, Any]]) -> None:
+        if not record:
+            return
+        keys = _record_keys(record)
+        with self._lock:
+            for key in keys:
+                existing = self._records.get(key)
+                self._records[key] = {**existing, **record} if existing else record
+
+    def add_many(self, records: Iterable[Optional[dict[str, Any]]]) -> None:
+        for record in records:
+            self.add(record)
+
+    def get(self, kind: str, value: str) -> Optional[dict[str, Any]]:
+        return self._records.get((kind, value))
+
+    def lookup(self, detail: dict[str, Any]) -> Optional[dict[str, Any]]:
+        for key in _detail_keys(detail):
+            record = self.get(*key)
+            if record is not None:
+                return record
+        return None
+
+
+class PersistentPersonIndex(PersonIndex):
+    """
+    ``PersonIndex`` that writes every record through to SQLite and falls back
+    to it on a miss, so processes opening the same ``path`` reuse the people
+    any of them has enriched (and paid credits for), and a restart starts
+    warm. Each process still answers repeat lookups from its own memory.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS people (kind TEXT NOT NULL, value TEXT NOT NULL, record TEXT NOT NULL, PRIMARY KEY (kind, value))"
+        )
+        self._db_lock = threading.Lock()
+
+    def get(self, kind: str, value: str) -> Optional[dict[str, Any]]:
+        record = self._records.get((kind, value))
+        if record is None:
+            with self._db_lock:
+                row = self._conn.execute("SELECT record FROM people WHERE kind = ? AND value = ?", (kind, value)).fetchone()
+            if row is not None:
+                record = json.loads(row[0])
+                with self._lock:
+                    record = self._records.setdefault((kind, value), record)
+        return record
+
+    def add(self, record: Optional[dict[str, Any]]) -> None:
+        self.add_many([record])
+
+    def add_many(self, records: Iterable[Optional[dict[str, Any]]]) -> None:
+        changed: set[tuple[str, str]] = set()
+        for record in records:
+            if not record:
+                continue
+            keys = _record_keys(record)
+            for key in keys:
+                # Pull in what other processes stored so the merge below keeps it.
+                self.get(*key)
+            super().add(record)
+            changed.update(keys)
+        if not changed:
+            return
+        rows = [(kind, value, json.dumps(self._records[(kind, value)], default=str)) for kind, value in changed]
+        with self._db_lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("INSERT OR REPLACE INTO people VALUES (?, ?, ?)", rows)
+
+    def close(self) -> None:
+        with self._db_lock:
+            self._conn.close()
+
+
+def _is_complete(record: dict[str, Any], reveal_personal_emails: Optional[bool], reveal_phone_number: Optional[bool]) -> bool:
+    if not record.get("email"):
+        return False
+    if reveal_personal_emails and not record.get("personal_emails"):
+        return False
+    if reveal_phone_number and not record.get("phone_numbers"):
+        return False
+    return True
+
+
+@dataclass
+class EnrichmentPlan:
+    """Which inputs can be answered locally and which must go to Apollo."""
+
+    known: dict[int, dict[str, Any]] = field(default_factory=dict)
+    # one merged request per group of inputs that refer to the same person
+    requests: list[dict[str, Any]] = field(default_factory=list)
+    # positions of every input row folded into the matching request
+    unknown: list[list[int]] = field(default_factory=list)
+
+    @property
+    def to_send(self) -> int:
+        return len(self.requests)
+
+
+class EnrichmentPlanner:
+    """
+    Planning stage in front of ``bulk_people_enrichment``.
+
+    Inputs that match a record we already hold with enough data are answered
+    from the local index; duplicate inputs are sent once; only the rest is
+    sent to Apollo, in batches of ten at bulk priority, so large runs never
+    hold up interactive lookups. Results are merged back in input order and
+    added to the index for next time.
+    """
+
+    def __init__(self, app, index: Optional[PersonIndex] = None) -> None:
+        self.app = app
+        self.index = index if index is not None else PersonIndex()
+        self.totals: Counter[str] = Counter()
+
+    def sync_contacts(self, max_pages: Optional[int] = None, per_page: int = 100) -> int:
+        """Load the team's contacts into the index. Returns the number loaded."""
+        loaded = 0
+        page = 1
+        while max_pages is None or page <= max_pages:
+            payload = self.app.search_for_contacts(page=page, per_page=per_page) or {}
+            contacts = payload.get("contacts") or []
+            self.index.add_many(contacts)
+            loaded += len(contacts)
+            total_pages = int((payload.get("pagination") or {}).get("total_pages") or 1)
+            if not contacts or page >= total_pages:
+                break
+            page += 1
+        logger.info(f"EnrichmentPlanner: synced {loaded} contacts.")
+        return loaded
+
+    def plan(self, details: list[dict[str, Any]], reveal_personal_emails: Optional[bool] = None, reveal_phone_number: Optional[bool] = None) -> EnrichmentPlan:
+        plan = EnrichmentPlan()
+        misses = []
+        for position, detail in enumerate(details):
+            record = self.index.lookup(detail)
+            if record is not None and _is_complete(record, reveal_personal_emails, reveal_phone_number):
+                plan.known[position] = record
+            else:
+                misses.append(position)
+        groups = dedup([details[position] for position in misses], kind="people")
+        plan.requests = groups.unique_rows
+        plan.unknown = [[misses[i] for i in members] for members in groups.members]
+        return plan
+
+    def enrich(
+        self,
+        details: list[dict[str, Any]],
+        reveal_personal_emails: Optional[bool] = None,
+        reveal_phone_number: Optional[bool] = None,
+        webhook_url: Optional[str] = None,
+    ) -> dict[str, Any]:
+        plan = self.plan(details, reveal_personal_emails, reveal_phone_number)
+        matches: list[Optional[dict[str, Any]]] = [None] * len(details)
+        for position, record in plan.known.items():
+            matches[position] = record
+
+        api_calls = 0
+        credits_consumed = 0
+        for start in range(0, plan.to_send, BULK_MATCH_LIMIT):
+            batch = plan.unknown[start:start + BULK_MATCH_LIMIT]
+            requests = plan.requests[start:start + BULK_MATCH_LIMIT]
+            with priority(BULK):
+                response = self.app.bulk_people_enrichment(
+                    reveal_personal_emails=reveal_personal_emails,
+                    reveal_phone_number=reveal_phone_number,
+                    webhook_url=webhook_url,
+                    details=requests,
+                ) or {}
+            api_calls += 1
+            credits_consumed += int(response.get("credits_consumed") or 0)
+            for positions, match in zip(batch, _align_matches(requests, response.get("matches") or [])):
+                self.index.add(match)
+                for position in positions:
+                    matches[position] = match
+
+        report = {
+            "requested": len(details),
+            "from_cache": len(plan.known),
+            "duplicates_folded": len(details) - len(plan.known) - plan.to_send,
+            "sent_to_api": plan.to_send,
+            "api_calls": api_calls,
+            "credits_consumed": credits_consumed,
+            "credits_saved": len(details) - plan.to_send,
+        }
+        self.totals.update(report)
+        logger.info(f"EnrichmentPlanner: {report}")
+        return {"matches": matches, "report": report}
+
+
+def _align_organizations(domains: list[str], organizations: list[Optional[dict[str, Any]]]) -> list[Optional[dict[str, Any]]]:
+    """
+    Pair each domain of a bulk organization enrichment call with its result.
+
+    A response of the right length is paired by position, since Apollo may
+    answer with the organization's own primary domain rather than the one
+    requested (redirects, ``www`` or regional domains). Otherwise results
+    are paired by domain, and requests without a result get None.
+    """
+    if len(organizations) == len(domains):
+        return list(organizations)
+    logger.warning(f"enrich_organizations: got {len(organizations)} organizations for {len(domains)} domains; pairing by domain.")
+    by_domain: dict[str, dict[str, Any]] = {}
+    for organization in organizations:
+        for field in ("primary_domain", "website_url"):
+            domain = canonical_domain((organization or {}).get(field))
+            if domain:
+                by_domain.setdefault(domain, organization)
+    return [by_domain.get(domain) for domain in domains]
+
+
+def enrich_organizations(app, inputs: list[str], fuzzy: bool = True) -> dict[str, Any]:
+    """
+    Enrich companies given as domains, URLs or names, paying once per company.
+
+    Inputs are canonicalized and deduplicated (``"www.Acme.com/"`` and
+    ``"acme.com"`` fold together, as do ``"ACME Inc"`` and ``"Acme, Inc."``),
+    each distinct domain is sent to ``bulk_organization_enrichment`` once
+    at bulk priority, and the result is mapped back onto every input. Different domains are
+    never folded together, and names, which give no domain, cannot be
+    enriched and come back as null.
+    """
+    rows = [{"domain": value} if is_valid_domain(canonical_domain(value)) else {"name": value} for value in inputs]
+    groups = dedup(rows, kind="organizations", fuzzy=fuzzy)
+    group_domains = [canonical_domain(row.get("domain")) for row in groups.unique_rows]
+    domains = list(dict.fromkeys(d for d in group_domains if d))
+
+    found: dict[str, Optional[dict[str, Any]]] = {}
+    api_calls = 0
+    for start in range(0, len(domains), BULK_ORGANIZATION_LIMIT):
+        batch = domains[start:start + BULK_ORGANIZATION_LIMIT]
+        with priority(BULK):
+            response = app.bulk_organization_enrichment(domains_=batch) or {}
+        api_calls += 1
+        found.update(zip(batch, _align_organizations(batch, response.get("organizations") or [])))
+    results = groups.fold_back([found.get(domain) if domain else None for domain in group_domains])
+    report = {
+        "requested": len(inputs),
+        "unique_organizations": len(groups),
+        "without_domain": sum(1 for d in group_domains if not d),
+        "sent_to_api": len(domains),
+        "api_calls": api_calls,
+        # Name-only inputs are never sent, so they save nothing.
+        "credits_saved": sum(1 for row in rows if "domain" in row) - len(domains),
+    }
+    logger.info(f"enrich_organizations: {report}")
+    return {"organizations": results, "report": report}
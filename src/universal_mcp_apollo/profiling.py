@@ -0,0 +1,216 @@
+import json
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from loguru import logger
+
+PHASES = ("headers", "queueing", "http", "decode", "serialize")
+
+# Longest repr kept per argument in a captured call.
+MAX_ARGUMENT_CHARS = 200
+
+# Profile of the tool call running in this context, if the profiler is on.
+current_call: ContextVar[Optional["CallProfile"]] = ContextVar("apollo_call_profile", default=None)
+
+
+def _short(value: Any) -> Any:
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    text = value if isinstance(value, str) else repr(value)
+    return text if len(text) <= MAX_ARGUMENT_CHARS else text[:MAX_ARGUMENT_CHARS] + f"... ({len(text)} chars)"
+
+
+@dataclass
+class CallProfile:
+    """
+    Timings of one tool call. Every call records each request's status and
+    size; only sampled calls record phases and per-request timings. Phase
+    times are summed over the call's requests, so requests sent in parallel
+    can add up to more than the call's wall time.
+    """
+
+    tool: str
+    arguments: dict[str, Any]
+    sampled: bool
+    started_at: float = field(default_factory=time.time)
+    seconds: float = 0.0
+    phases: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    requests: list[dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, phase: str, seconds: float) -> None:
+        if self.sampled:
+            with self._lock:
+                self.phases[phase] += seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.sampled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def watch(self, method: str, url: str, response: Any, queued: float, http: float) -> None:
+        """
+        Record one request's status and size. Sampled calls also keep its
+        timings and time the decoding of its body when the tool calls
+        ``response.json()``.
+        """
+        request = {"method": method, "url": url, "status": response.status_code, "bytes": len(response.content)}
+        with self._lock:
+            self.requests.append(request)
+        if not self.sampled:
+            return
+        request.update(queueing=round(queued, 6), http=round(http, 6), decode=None)
+        decode = response.json
+
+        def timed_json(**kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return decode(**kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                request["decode"] = round(elapsed, 6)
+                self.add("decode", elapsed)
+
+        response.json = timed_json
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            phases = {name: round(seconds, 6) for name, seconds in self.phases.items()}
+            requests = list(self.requests)
+        if self.sampled:
+            phases["other"] = round(max(0.0, self.seconds - sum(phases.values())), 6)
+        return {
+            "tool": self.tool,
+            "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            "seconds": round(self.seconds, 6),
+            "sampled": self.sampled,
+            "phases": phases if self.sampled else None,
+            "requests": requests,
+            "arguments": self.arguments,
+            "error": self.error,
+        }
+
+
+@dataclass
+class _ToolStats:
+    calls: int = 0
+    sampled: int = 0
+    slow: int = 0
+    errors: int = 0
+    phase_totals: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    durations: deque = field(default_factory=lambda: deque(maxlen=1000))
+
+
+class Profiler:
+    """
+    Opt-in, sampling profiler for tool calls.
+
+    Every call is timed end to end and keeps each request's status and
+    size, which costs two clock reads per call and a small dict per request.
+    A ``sample_rate`` fraction of calls is profiled in full: time spent
+    building headers, queueing for a scheduler slot, on HTTP, decoding JSON
+    and serializing the result, per call and per request. Calls
+    slower than ``slow_seconds`` are captured with their arguments into a
+    ring buffer of the last ``capacity`` (with phases if they were sampled;
+    a ``sample_rate`` of 1 profiles every slow call in full), and appended
+    to ``dump_path`` as NDJSON when one is given.
+    """
+
+    def __init__(self, sample_rate: float = 0.0, slow_seconds: float = 5.0, capacity: int = 100, dump_path: Optional[str | Path] = None) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1.")
+        self.sample_rate = sample_rate
+        self.slow_seconds = slow_seconds
+        self.dump_path = Path(dump_path).expanduser() if dump_path else None
+        self.slow_calls: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._stats: dict[str, _ToolStats] = defaultdict(_ToolStats)
+        self._lock = threading.Lock()
+        # Serializes appends to ``dump_path`` without holding up ``_lock``.
+        self._dump_lock = threading.Lock()
+
+    @contextmanager
+    def call(self, tool: str, args: tuple = (), kwargs: Optional[dict[str, Any]] = None) -> Iterator[CallProfile]:
+        arguments = {**{f"arg{i}": _short(a) for i, a in enumerate(args)}, **{k: _short(v) for k, v in (kwargs or {}).items()}}
+        profile = CallProfile(tool, arguments, sampled=random.random() < self.sample_rate)
+        token = current_call.set(profile)
+        start = time.perf_counter()
+        try:
+            yield profile
+        except Exception as e:
+            profile.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            profile.seconds = time.perf_counter() - start
+            current_call.reset(token)
+            self._record(profile)
+
+    def _record(self, profile: CallProfile) -> None:
+        slow = profile.seconds >= self.slow_seconds
+        with self._lock:
+            stats = self._stats[profile.tool]
+            stats.calls += 1
+            stats.errors += profile.error is not None
+            stats.slow += slow
+            stats.durations.append(profile.seconds)
+            if profile.sampled:
+                stats.sampled += 1
+                for name, seconds in profile.phases.items():
+                    stats.phase_totals[name] += seconds
+        if not slow:
+            return
+        captured = profile.to_dict()
+        logger.warning(f"Profiler: slow call {profile.tool} took {profile.seconds:.3f}s (phases: {captured['phases']}).")
+        with self._lock:
+            self.slow_calls.append(captured)
+        if self.dump_path is not None:
+            line = json.dumps(captured, default=str) + "\n"
+            with self._dump_lock, open(self.dump_path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def captured(self, tool: Optional[str] = None, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """Captured slow calls, newest first."""
+        with self._lock:
+            calls = [c for c in reversed(self.slow_calls) if tool is None or c["tool"] == tool]
+        return calls[:limit] if limit else calls
+
+    def dump(self, path: str | Path, tool: Optional[str] = None) -> int:
+        """Write the captured slow calls to ``path`` as NDJSON. Returns the number written."""
+        calls = self.captured(tool)
+        with open(Path(path).expanduser(), "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(c, default=str) + "\n" for c in calls)
+        return len(calls)
+
+    def metrics(self) -> dict[str, Any]:
+        """Per tool: calls, sampled, slow and failed counts, latency and mean time per phase of sampled calls."""
+        with self._lock:
+            tools = {}
+            for name, stats in self._stats.items():
+                durations = sorted(stats.durations)
+                tools[name] = {
+                    "calls": stats.calls,
+                    "sampled": stats.sampled,
+                    "slow": stats.slow,
+                    "errors": stats.errors,
+                    "seconds_avg": sum(durations) / len(durations) if durations else 0.0,
+                    "seconds_p95": durations[int(len(durations) * 0.95)] if durations else 0.0,
+                    "seconds_max": durations[-1] if durations else 0.0,
+                    "phase_seconds_avg": {
+                        phase: total / stats.sampled for phase, total in stats.phase_totals.items()
+                    } if stats.sampled else None,
+                }
+        return {"sample_rate": self.sample_rate, "slow_seconds": self.slow_seconds, "captured": len(self.slow_calls), "tools": tools}
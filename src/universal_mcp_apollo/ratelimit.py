@@ -0,0 +1,165 @@
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket expressed in requests per minute.
+
+    ``capacity`` bounds the burst size and defaults to one minute's worth of
+    tokens, matching how Apollo reports its per-minute limits.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None) -> None:
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive.")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` if they are available right now."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        Block until ``tokens`` are available and take them.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        Raises:
+            TimeoutError: If the tokens could not be taken within ``timeout``.
+        """
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return time.monotonic() - start
+                delay = (tokens - self._tokens) / self.rate
+            if timeout is not None and time.monotonic() - start + delay > timeout:
+                raise TimeoutError("Timed out waiting for rate-limit tokens.")
+            time.sleep(delay)
+
+    def delay(self, tokens: float = 1.0) -> float:
+        """Seconds until ``tokens`` will be available, or 0 if they already are."""
+        with self._lock:
+            self._refill()
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class FileTokenBucket:
+    """
+    Token bucket shared by every process that opens the same ``path``.
+
+    The bucket's state (tokens left and when they were last counted) is a
+    16-byte record in the file, read, refilled and written back under an
+    exclusive ``flock``, so worker processes draw from one per-minute budget
+    instead of each spending the full rate. Refills use wall-clock time,
+    the only clock the processes share. Same interface as
+    :class:`TokenBucket`.
+    """
+
+    _STATE = struct.Struct("dd")
+
+    def __init__(self, path: str | Path, rate_per_minute: float, capacity: Optional[float] = None) -> None:
+        try:
+            import fcntl
+        except ImportError as e:
+            raise ImportError("A shared rate-limit budget needs POSIX file locks (fcntl).") from e
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive.")
+        self._fcntl = fcntl
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        # flock is held per open file, which this process's threads share.
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _state(self) -> Iterator[list[float]]:
+        with self._lock:
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                raw = os.pread(self._fd, self._STATE.size, 0)
+                if len(raw) == self._STATE.size:
+                    tokens, updated = self._STATE.unpack(raw)
+                    tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+                else:
+                    tokens = self.capacity
+                state = [tokens]
+                yield state
+                os.pwrite(self._fd, self._STATE.pack(state[0], now), 0)
+            finally:
+                self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` if they are available right now."""
+        with self._state() as state:
+            if state[0] >= tokens:
+                state[0] -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        Block until ``tokens`` are available and take them.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        Raises:
+            TimeoutError: If the tokens could not be taken within ``timeout``.
+        """
+        start = time.monotonic()
+        while True:
+            with self._state() as state:
+                if state[0] >= tokens:
+                    state[0] -= tokens
+                    return time.monotonic() - start
+                delay = (tokens - state[0]) / self.rate
+            if timeout is not None and time.monotonic() - start + delay > timeout:
+                raise TimeoutError("Timed out waiting for rate-limit tokens.")
+            time.sleep(delay)
+
+    def delay(self, tokens: float = 1.0) -> float:
+        """Seconds until ``tokens`` will be available, or 0 if they already are."""
+        with self._state() as state:
+            return max(0.0, (tokens - state[0]) / self.rate)
+
+    @property
+    def available(self) -> float:
+        with self._state() as state:
+            return state[0]
+
+    def close(self) -> None:
+        with self._lock:
+            os.close(self._fd)
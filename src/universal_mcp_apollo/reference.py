@@ -0,0 +1,196 @@
+import re
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.scheduler import BACKGROUND, priority
+
+_OBJECT_ID = re.compile(r"^[0-9a-f]{24}$")
+
+
+def _normalize(value: str) -> str:
+    return " ".join(str(value).split()).casefold()
+
+
+def looks_like_id(value: Any) -> bool:
+    """Return True if ``value`` has the shape of an Apollo object ID."""
+    return isinstance(value, str) and bool(_OBJECT_ID.match(value))
+
+
+def _records(payload: Any, key: str) -> list[dict[str, Any]]:
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        return payload.get(key) or []
+    return []
+
+
+def _load_contact_stages(app) -> list[dict[str, Any]]:
+    return _records(app.list_contact_stages(), "contact_stages")
+
+
+def _load_account_stages(app) -> list[dict[str, Any]]:
+    return _records(app.list_account_stages(), "account_stages")
+
+
+def _load_deal_stages(app) -> list[dict[str, Any]]:
+    return _records(app.list_deal_stages(), "opportunity_stages")
+
+
+def _load_email_accounts(app) -> list[dict[str, Any]]:
+    return _records(app.get_a_list_of_email_accounts(), "email_accounts")
+
+
+def _load_users(app) -> list[dict[str, Any]]:
+    users: list[dict[str, Any]] = []
+    page = 1
+    while True:
+        payload = app.get_a_list_of_users(page=page, per_page=100)
+        batch = _records(payload, "users")
+        users.extend(batch)
+        pagination = (payload.get("pagination") or {}) if isinstance(payload, dict) else {}
+        if not batch or page >= int(pagination.get("total_pages") or 1):
+            return users
+        page += 1
+
+
+def _user_names(record: dict[str, Any]) -> list[str]:
+    full_name = " ".join(
+        part for part in (record.get("first_name"), record.get("last_name")) if part
+    )
+    return [record.get("name"), full_name, record.get("email")]
+
+
+# kind -> (loader, fields whose values resolve to the record's id)
+KINDS: dict[str, tuple[Callable[[Any], list[dict[str, Any]]], Callable[[dict[str, Any]], list]]] = {
+    "contact_stage": (_load_contact_stages, lambda r: [r.get("name"), r.get("display_name")]),
+    "account_stage": (_load_account_stages, lambda r: [r.get("name"), r.get("display_name")]),
+    "deal_stage": (_load_deal_stages, lambda r: [r.get("name")]),
+    "user": (_load_users, _user_names),
+    "email_account": (_load_email_accounts, lambda r: [r.get("email")]),
+}
+
+
+class ReferenceRegistry:
+    """
+    In-memory registry of Apollo reference data (stages, users and email
+    accounts) used to turn human-readable names into Apollo IDs. Lists are
+    not held: Apollo takes list names as they are and creates missing ones.
+
+    Each kind is held as a ``name -> id`` dict that is rebuilt off to the side
+    and swapped in atomically, so lookups never block on a refresh. A name
+    not found triggers one reload of its kind, at most once per
+    ``miss_refresh_interval`` seconds, so a stage or user created since the
+    last refresh resolves without waiting for the next one.
+    """
+
+    def __init__(self, app, refresh_interval: float = 300.0, miss_refresh_interval: float = 30.0) -> None:
+        self.app = app
+        self.refresh_interval = refresh_interval
+        self.miss_refresh_interval = miss_refresh_interval
+        self._names: dict[str, dict[str, str]] = {}
+        self._ids: dict[str, set[str]] = {}
+        self._loaded_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self, kind: str) -> None:
+        """Reload a single kind of reference data from Apollo."""
+        loader, name_fields = KINDS[kind]
+        names: dict[str, str] = {}
+        ids: set[str] = set()
+        for record in loader(self.app):
+            record_id = record.get("id")
+            if not record_id:
+                continue
+            ids.add(record_id)
+            for name in name_fields(record):
+                if name:
+                    names.setdefault(_normalize(name), record_id)
+        self._names[kind] = names
+        self._ids[kind] = ids
+        self._loaded_at[kind] = time.monotonic()
+        logger.debug(f"ReferenceRegistry: loaded {len(ids)} {kind} records.")
+
+    def warm(self) -> None:
+        """Load every kind of reference data, logging (not raising) failures."""
+        for kind in KINDS:
+            try:
+                self.refresh(kind)
+            except Exception as e:
+                logger.warning(f"ReferenceRegistry: failed to load {kind}: {e}")
+
+    def start(self) -> None:
+        """Warm the registry and keep refreshing it on a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="apollo-reference-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        # Periodic refreshes yield to tool calls and bulk jobs.
+        with priority(BACKGROUND):
+            while True:
+                self.warm()
+                if self._stop.wait(self.refresh_interval):
+                    return
+
+    def names(self, kind: str) -> list[str]:
+        return sorted(self._names.get(kind, {}))
+
+    def resolve(self, kind: str, value: Optional[str]) -> Optional[str]:
+        """
+        Resolve ``value`` to an Apollo ID for the given kind.
+
+        IDs are passed through untouched; names are matched case-insensitively.
+        A kind that has never been loaded is loaded on first use, and reloaded
+        on a name miss (rate-limited). If loading fails the value is passed
+        through and Apollo is left to validate it.
+
+        Raises:
+            ValueError: If the kind is loaded and ``value`` matches neither an
+                ID nor a name, even after a reload.
+        """
+        if value is None:
+            return None
+        if value in self._ids.get(kind, ()):
+            return value
+        if looks_like_id(value):
+            return value
+        if kind not in self._names:
+            with self._lock:
+                if kind not in self._names:
+                    try:
+                        self.refresh(kind)
+                    except Exception as e:
+                        logger.warning(f"ReferenceRegistry: failed to load {kind}: {e}")
+                        return value
+        resolved = self._names[kind].get(_normalize(value))
+        if resolved is None:
+            with self._lock:
+                resolved = self._names[kind].get(_normalize(value))
+                if resolved is None and time.monotonic() - self._loaded_at.get(kind, 0.0) >= self.miss_refresh_interval:
+                    try:
+                        self.refresh(kind)
+                    except Exception as e:
+                        logger.warning(f"ReferenceRegistry: failed to reload {kind}: {e}")
+                        return value
+                    resolved = self._names[kind].get(_normalize(value))
+        if resolved is not None:
+            return resolved
+        known = ", ".join(self.names(kind)[:20])
+        raise ValueError(
+            f"Unknown {kind.replace('_', ' ')} {value!r}; expected an Apollo ID or one of: {known}"
+        )
@@ -0,0 +1,151 @@
+import itertools
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+from universal_mcp_apollo.ratelimit import TokenBucket
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, BULK, BACKGROUND)
+
+_current_priority: ContextVar[str] = ContextVar("apollo_request_priority", default=INTERACTIVE)
+
+
+def current_priority() -> str:
+    return _current_priority.get()
+
+
+@contextmanager
+def priority(level: str) -> Iterator[None]:
+    """Run the enclosed requests at the given priority class."""
+    if level not in PRIORITIES:
+        raise ValueError(f"Unknown priority {level!r}; expected one of {PRIORITIES}.")
+    token = _current_priority.set(level)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class PriorityScheduler:
+    """
+    Admits requests into the HTTP layer in priority order.
+
+    Capacity is the rate-limit ``bucket`` (if any) and an optional cap on
+    requests in flight. Whenever capacity frees up, the oldest waiter of the
+    highest priority class goes next, unless a lower class has received less
+    than its ``min_share`` of the last ``window`` admissions while waiting,
+    in which case the most starved class goes first.
+    """
+
+    def __init__(
+        self,
+        bucket: Optional[TokenBucket] = None,
+        max_inflight: Optional[int] = None,
+        min_share: Optional[dict[str, float]] = None,
+        window: int = 100,
+    ) -> None:
+        self.bucket = bucket
+        self.max_inflight: Optional[Callable[[], int] | int] = max_inflight
+        self.min_share = min_share if min_share is not None else {BULK: 0.2, BACKGROUND: 0.05}
+        self._cond = threading.Condition()
+        self._queues: dict[str, deque[int]] = {level: deque() for level in PRIORITIES}
+        self._tickets = itertools.count()
+        self._recent: deque[str] = deque(maxlen=window)
+        self._inflight = 0
+        self._admitted: Counter[str] = Counter()
+        self._wait_total: Counter[str] = Counter()
+        self._wait_max: Counter[str] = Counter()
+        self._wait_samples: dict[str, deque[float]] = {level: deque(maxlen=1000) for level in PRIORITIES}
+
+    def _inflight_limit(self) -> Optional[int]:
+        limit = self.max_inflight
+        return limit() if callable(limit) else limit
+
+    def _next_class(self) -> Optional[str]:
+        waiting = [level for level in PRIORITIES if self._queues[level]]
+        if not waiting:
+            return None
+        if self._recent:
+            counts = Counter(self._recent)
+            starved = [
+                (counts[level] / len(self._recent) / share, level)
+                for level, share in self.min_share.items()
+                if share > 0 and level in waiting and counts[level] / len(self._recent) < share
+            ]
+            if starved:
+                return min(starved)[1]
+        return waiting[0]
+
+    def acquire(self, level: str = INTERACTIVE) -> float:
+        """
+        Block until a request of class ``level`` may be sent.
+
+        Returns:
+            float: Seconds spent queued.
+        """
+        start = time.monotonic()
+        with self._cond:
+            ticket = next(self._tickets)
+            queue = self._queues[level]
+            queue.append(ticket)
+            try:
+                while True:
+                    is_next = self._next_class() == level and queue[0] == ticket
+                    limit = self._inflight_limit()
+                    if is_next and (limit is None or self._inflight < limit):
+                        if self.bucket is None or self.bucket.try_acquire():
+                            break
+                        self._cond.wait(timeout=self.bucket.delay())
+                    else:
+                        self._cond.wait()
+            finally:
+                queue.remove(ticket)
+            self._inflight += 1
+            self._recent.append(level)
+            waited = time.monotonic() - start
+            self._admitted[level] += 1
+            self._wait_total[level] += waited
+            self._wait_max[level] = max(self._wait_max[level], waited)
+            self._wait_samples[level].append(waited)
+            self._cond.notify_all()
+        return waited
+
+    def release(self) -> None:
+        with self._cond:
+            self._inflight -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, level: Optional[str] = None) -> Iterator[float]:
+        waited = self.acquire(level or current_priority())
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth and admission wait-time statistics per priority class."""
+        with self._cond:
+            classes = {}
+            for level in PRIORITIES:
+                samples = sorted(self._wait_samples[level])
+                admitted = self._admitted[level]
+                classes[level] = {
+                    "queue_depth": len(self._queues[level]),
+                    "admitted": admitted,
+                    "wait_seconds_avg": self._wait_total[level] / admitted if admitted else 0.0,
+                    "wait_seconds_p95": samples[int(len(samples) * 0.95)] if samples else 0.0,
+                    "wait_seconds_max": self._wait_max[level],
+                }
+            return {
+                "inflight": self._inflight,
+                "inflight_limit": self._inflight_limit(),
+                "tokens_available": self.bucket.available if self.bucket is not None else None,
+                "classes": classes,
+            }
@@ -1,19 +1,110 @@
+import os
+import threading
+from pathlib import Path
 
 from universal_mcp.servers import SingleMCPServer
 from universal_mcp.integrations import ApiKeyIntegration
 from universal_mcp.stores import EnvironmentStore
 
 from universal_mcp_apollo.app import ApolloApp
+from universal_mcp_apollo.cassette import REPLAY, Cassette
+from universal_mcp_apollo.jobs import DEFAULT_JOURNAL_PATH
+from universal_mcp_apollo.profiling import Profiler
+from universal_mcp_apollo.tenants import MultiTenantApolloApp, TenantMiddleware, TenantPool
+from universal_mcp_apollo.workers import PooledApolloApp, WorkerPool
 
-env_store = EnvironmentStore()
-integration_instance = ApiKeyIntegration(name="APOLLO_API_KEY", store=env_store)
-app_instance = ApolloApp(integration=integration_instance)
 
-mcp = SingleMCPServer(
-    app_instance=app_instance,
-)
+def _env_float(name: str) -> float | None:
+    value = os.getenv(name)
+    return float(value) if value else None
 
-if __name__ == "__main__":
-    mcp.run()
+
+def _profiler() -> Profiler | None:
+    sample_rate = _env_float("APOLLO_PROFILE_SAMPLE_RATE")
+    slow_seconds = _env_float("APOLLO_SLOW_CALL_SECONDS")
+    if sample_rate is None and slow_seconds is None:
+        return None
+    return Profiler(
+        sample_rate=sample_rate or 0.0,
+        slow_seconds=slow_seconds if slow_seconds is not None else 5.0,
+        capacity=int(os.getenv("APOLLO_SLOW_CALL_BUFFER", "100")),
+        dump_path=os.getenv("APOLLO_PROFILE_DUMP"),
+    )
+
+
+multi_tenant = os.getenv("APOLLO_MULTI_TENANT", "").lower() in ("1", "true", "yes")
+
+
+def create_app() -> ApolloApp:
+    """Build the app the server exposes, configured from the environment."""
+    rate_limit_per_minute = _env_float("APOLLO_RATE_LIMIT_PER_MINUTE")
+    workers = int(os.getenv("APOLLO_WORKERS", "0"))
+    if multi_tenant:
+        return MultiTenantApolloApp(
+            pool=TenantPool(
+                max_tenants=int(os.getenv("APOLLO_MAX_TENANTS", "256")),
+                idle_timeout=float(os.getenv("APOLLO_TENANT_IDLE_SECONDS", "900")),
+                rate_limit_per_minute=rate_limit_per_minute,
+                max_concurrent=int(os.getenv("APOLLO_MAX_CONCURRENT_CALLS", "16")),
+            )
+        )
+    job_journal_path = os.getenv("APOLLO_JOB_JOURNAL")
+    options = dict(
+        reference_refresh_interval=float(os.getenv("APOLLO_REFERENCE_REFRESH_SECONDS", "300")),
+        rate_limit_per_minute=rate_limit_per_minute,
+        job_journal_path=job_journal_path,
+        result_chunk_bytes=int(os.getenv("APOLLO_RESULT_CHUNK_BYTES", "0")) or None,
+        data_dir=os.getenv("APOLLO_DATA_DIR"),
+        # Worker processes must share one enrichment cache and one rate budget;
+        # a single process needs neither file.
+        cache_path=os.getenv("APOLLO_CACHE_PATH")
+        or (str(Path(job_journal_path or DEFAULT_JOURNAL_PATH).parent / "people.sqlite3") if workers else None),
+        rate_limit_path=os.getenv("APOLLO_RATE_LIMIT_PATH")
+        or (str(Path(job_journal_path or DEFAULT_JOURNAL_PATH).parent / "rate_limit.bucket") if workers else None),
+    )
+    env_store = EnvironmentStore()
+    integration_instance = ApiKeyIntegration(name="APOLLO_API_KEY", store=env_store)
+    if workers:
+        return PooledApolloApp(
+            pool=WorkerPool(workers, options, max_tasks_per_child=int(os.getenv("APOLLO_WORKER_MAX_TASKS", "1000")) or None),
+            integration=integration_instance,
+            **options,
+        )
+    cassette_path = os.getenv("APOLLO_CASSETTE")
+    return ApolloApp(
+        integration=integration_instance,
+        cassette=Cassette(
+            cassette_path,
+            mode=os.getenv("APOLLO_CASSETTE_MODE", REPLAY),
+            speed=float(os.getenv("APOLLO_CASSETTE_SPEED", "1.0")),
+            redact=[os.getenv("APOLLO_API_KEY", "")],
+        ) if cassette_path else None,
+        profiler=_profiler(),
+        **options,
+    )
 
 
+def main() -> None:
+    if multi_tenant:
+        import uvicorn
+
+        app_instance.pool.start()
+        uvicorn.run(TenantMiddleware(mcp.sse_app()), host=mcp.settings.host, port=mcp.settings.port)
+    else:
+        threading.Thread(target=app_instance.warm_up, name="apollo-warm-up", daemon=True).start()
+        app_instance.reference.start()
+        app_instance.jobs.resume()
+        mcp.run()
+
+
+# Worker processes are spawned, and re-import this module as ``__mp_main__``
+# when it is run as a script. Only the parent builds the app, so workers never
+# open the cassette or journal, or start another pool of their own.
+if __name__ != "__mp_main__":
+    app_instance = create_app()
+    mcp = SingleMCPServer(
+        app_instance=app_instance,
+    )
+
+if __name__ == "__main__":
+    main()
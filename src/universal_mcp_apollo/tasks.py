@@ -0,0 +1,197 @@
+import csv
+import string
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+from universal_mcp_apollo.planner import PersonIndex
+from universal_mcp_apollo.scheduler import BULK, priority
+
+# Contacts sent per /tasks/bulk_create call.
+CHUNK_SIZE = 100
+
+CREATED = "created"
+# Sent and accepted, but the response did not list the tasks to confirm it.
+UNCONFIRMED = "unconfirmed"
+DUPLICATE = "duplicate"
+INVALID = "invalid"
+FAILED = "failed"
+
+# Attributes create_task applies to every contact of one call.
+SHARED_FIELDS = ("user_id", "priority", "due_at", "type", "status", "note")
+SPEC_FIELDS = (*SHARED_FIELDS, "contact_id", "contact_ids")
+
+
+class _Blank(dict):
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+def render(note: Optional[str], contact: Optional[dict[str, Any]]) -> Optional[str]:
+    """
+    Fill ``{field}`` placeholders in ``note`` from the contact record, e.g.
+    ``"Call {first_name} about {organization_name}"``. Fields the record
+    lacks (or a contact not in the cache) render as empty strings.
+    """
+    if not note or "{" not in note:
+        return note
+    fields = _Blank({k: v for k, v in (contact or {}).items() if isinstance(v, (str, int, float))})
+    try:
+        return string.Formatter().vformat(note, (), fields)
+    except (ValueError, IndexError):
+        # Stray braces rather than a template: send the note as written.
+        return note
+
+
+@dataclass(frozen=True)
+class TaskGroup:
+    """Contacts that share every ``create_task`` attribute, so one bulk call creates all their tasks."""
+
+    user_id: str
+    priority: str
+    due_at: str
+    type: str
+    status: str
+    note: Optional[str]
+    # Rendered from a templated note for one contact; not part of the group's identity.
+    personalized: bool = field(default=False, compare=False)
+
+    def arguments(self, contact_ids: list[str]) -> dict[str, Any]:
+        return {**{k: v for k, v in self.__dict__.items() if k != "personalized"}, "contact_ids_": contact_ids}
+
+
+def _created(response: Any) -> Optional[dict[str, Optional[str]]]:
+    """Task ID per contact ID from a bulk_create response, or None if it does not list the tasks."""
+    tasks = response.get("tasks") if isinstance(response, dict) else None
+    if not isinstance(tasks, list):
+        return None
+    return {str(t["contact_id"]): t.get("id") for t in tasks if isinstance(t, dict) and t.get("contact_id")}
+
+
+class TaskBatchEngine:
+    """
+    Creates many, varied tasks in the fewest ``create_task`` calls.
+
+    Each task spec (optionally filled in from a shared ``template``, with
+    the note rendered per contact from the cached contact record) is
+    checked with ``create_task``'s own validator and grouped by the
+    attributes the bulk endpoint shares across its contacts. Every group is
+    one call, or several when it has more than :data:`CHUNK_SIZE` contacts,
+    and the calls run concurrently at bulk priority. Every contact of every
+    spec ends with one outcome row.
+
+    The bulk endpoint takes one note for all its contacts, so a note with
+    ``{field}`` placeholders costs one call per contact (unless contacts
+    render to the same text); the summary reports these calls as
+    ``personalized_calls``.
+    """
+
+    def __init__(self, app, index: Optional[PersonIndex] = None, workers: int = 8) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1 (got {workers}).")
+        self.app = app
+        self.index = index if index is not None else app.enrichment_planner.index
+        self.workers = workers
+
+    def plan(self, specs: list[dict[str, Any]], template: Optional[dict[str, Any]] = None) -> tuple[list[dict[str, Any]], list[tuple[TaskGroup, list[tuple[int, str]]]]]:
+        """Outcome rows for specs rejected locally, and the (group, [(spec, contact ID)]) chunks to send."""
+        from universal_mcp_apollo.app import VALIDATORS
+
+        rows: list[dict[str, Any]] = []
+        groups: dict[TaskGroup, dict[str, int]] = defaultdict(dict)
+        for position, spec in enumerate(specs):
+            spec = {**(template or {}), **spec}
+            listed = spec.get("contact_ids") or []
+            contact_ids = (list(listed) if isinstance(listed, list) else []) + ([spec["contact_id"]] if spec.get("contact_id") else [])
+            unknown = set(spec) - set(SPEC_FIELDS)
+            shared = {k: spec.get(k) for k in SHARED_FIELDS}
+            if unknown:
+                errors = [f"unknown task fields {sorted(unknown)}"]
+            elif not isinstance(listed, list):
+                errors = [f"contact_ids must be a list of IDs (got {listed!r})"]
+            elif not contact_ids:
+                errors = ["no contact_id or contact_ids"]
+            else:
+                errors = VALIDATORS["create_task"].errors((), {**shared, "contact_ids_": contact_ids})
+            if not errors:
+                try:
+                    shared["user_id"] = self.app.reference.resolve("user", shared["user_id"])
+                except ValueError as e:
+                    errors = [str(e)]
+            if errors:
+                rows += [{"spec": position, "contact_id": c, "outcome": INVALID, "task_id": None, "error": "; ".join(errors)} for c in contact_ids or [None]]
+                continue
+            for contact_id in dict.fromkeys(contact_ids):
+                note = render(shared["note"], self.index.get("id", contact_id))
+                group = TaskGroup(**{**shared, "note": note}, personalized=note != shared["note"])
+                if contact_id in groups[group]:
+                    rows.append({"spec": position, "contact_id": contact_id, "outcome": DUPLICATE, "task_id": None, "error": None})
+                else:
+                    groups[group][contact_id] = position
+        chunks = []
+        for group, members in groups.items():
+            pairs = [(position, contact_id) for contact_id, position in members.items()]
+            chunks += [(group, pairs[i:i + CHUNK_SIZE]) for i in range(0, len(pairs), CHUNK_SIZE)]
+        return rows, chunks
+
+    def _send(self, chunk: tuple[TaskGroup, list[tuple[int, str]]]) -> list[dict[str, Any]]:
+        group, pairs = chunk
+        try:
+            with priority(BULK):
+                response = self.app.create_task(**group.arguments([contact_id for _, contact_id in pairs]))
+        except Exception as e:
+            logger.warning(f"TaskBatchEngine: call for {len(pairs)} {group.type} task(s) failed: {e}")
+            return [{"spec": p, "contact_id": c, "outcome": FAILED, "task_id": None, "error": str(e)} for p, c in pairs]
+        created = _created(response)
+        if created is None:
+            return [{"spec": p, "contact_id": c, "outcome": UNCONFIRMED, "task_id": None, "error": "the response does not list the created tasks"} for p, c in pairs]
+        rows = []
+        for position, contact_id in pairs:
+            if contact_id not in created:
+                rows.append({"spec": position, "contact_id": contact_id, "outcome": FAILED, "task_id": None, "error": "not in the response"})
+            else:
+                rows.append({"spec": position, "contact_id": contact_id, "outcome": CREATED, "task_id": created[contact_id], "error": None})
+        return rows
+
+    def run(self, specs: list[dict[str, Any]], template: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        started = time.monotonic()
+        rows, chunks = self.plan(specs, template)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="apollo-tasks") as pool:
+            # Each call runs in a copy of the caller's context, so it is profiled with the tool call.
+            for future in [pool.submit(copy_context().run, self._send, chunk) for chunk in chunks]:
+                rows.extend(future.result())
+        counts = {outcome: 0 for outcome in (CREATED, UNCONFIRMED, DUPLICATE, INVALID, FAILED)}
+        by_contact: dict[str, list[Optional[str]]] = defaultdict(list)
+        for row in rows:
+            counts[row["outcome"]] += 1
+            if row["outcome"] == CREATED:
+                by_contact[row["contact_id"]].append(row["task_id"])
+        summary = {
+            "tasks": len(rows),
+            **counts,
+            "groups": len({group for group, _ in chunks}),
+            "api_calls": len(chunks),
+            "personalized_calls": sum(1 for group, _ in chunks if group.personalized),
+            "seconds": round(time.monotonic() - started, 3),
+        }
+        logger.info(f"TaskBatchEngine: {summary}")
+        return {**summary, "by_contact": dict(by_contact), "outcomes": sorted(rows, key=lambda r: r["spec"])}
+
+
+def create_tasks(app, specs: list[dict[str, Any]], template: Optional[dict[str, Any]] = None, path: Optional[str | Path] = None, workers: int = 8) -> dict[str, Any]:
+    """Run :class:`TaskBatchEngine` and return the outcomes inline or as a CSV file."""
+    result = TaskBatchEngine(app, workers=workers).run(specs, template)
+    if path is None:
+        return result
+    outcomes = result.pop("outcomes")
+    with open(Path(path).expanduser(), "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=("spec", "contact_id", "outcome", "task_id", "error"))
+        writer.writeheader()
+        writer.writerows(outcomes)
+    return {**result, "path": str(path)}
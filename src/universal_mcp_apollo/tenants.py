@@ -0,0 +1,333 @@
+import functools
+import hashlib
+import itertools
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+import anyio
+from loguru import logger
+from universal_mcp.integrations import Integration
+
+from universal_mcp_apollo.app import ApolloApp
+from universal_mcp_apollo.jobs import DEFAULT_JOURNAL_PATH
+
+# API key of the tenant the current request belongs to, set by TenantMiddleware.
+current_api_key: ContextVar[Optional[str]] = ContextVar("apollo_api_key", default=None)
+
+# Tools that only work on server files, and server-wide admin tools: never offered to tenants.
+HIDDEN_TOOLS = frozenset({
+    "enrich_hashed_email_file",
+    "export_search_results",
+    "import_records",
+    "get_request_scheduler_metrics",
+    "get_slow_tool_calls",
+})
+
+
+def tenant_id(api_key: str) -> str:
+    """Stable, log-safe identifier for an API key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+class TenantIntegration(Integration):
+    """Integration holding a single tenant's Apollo API key in memory."""
+
+    def __init__(self, api_key: str) -> None:
+        super().__init__(name="APOLLO_API_KEY")
+        self._api_key = api_key
+
+    def authorize(self) -> str:
+        return "Pass the Apollo API key in the X-Apollo-Api-Key request header."
+
+    def get_credentials(self) -> dict[str, Any]:
+        return {"api_key": self._api_key}
+
+    def set_credentials(self, credentials: dict[str, Any]) -> None:
+        self._api_key = credentials["api_key"]
+
+
+class FairGate:
+    """
+    Caps total in-flight requests across tenants and hands each free slot to
+    the waiting tenant with the fewest requests in flight (oldest waiter on
+    ties), so one busy tenant cannot starve the others.
+
+    Tenant apps take a slot per HTTP request, after their own scheduler has
+    admitted it: a tenant waiting on its own rate limit holds no slot.
+    """
+
+    def __init__(self, max_concurrent: int = 16) -> None:
+        self.max_concurrent = max_concurrent
+        self._cond = threading.Condition()
+        self._inflight: Counter[str] = Counter()
+        self._total = 0
+        self._waiting: dict[int, str] = {}
+        self._tickets = itertools.count()
+
+    def _next_ticket(self) -> int:
+        return min(self._waiting, key=lambda t: (self._inflight[self._waiting[t]], t))
+
+    def acquire(self, tenant: str) -> None:
+        with self._cond:
+            ticket = next(self._tickets)
+            self._waiting[ticket] = tenant
+            try:
+                while self._total >= self.max_concurrent or self._next_ticket() != ticket:
+                    self._cond.wait()
+            finally:
+                del self._waiting[ticket]
+            self._inflight[tenant] += 1
+            self._total += 1
+            self._cond.notify_all()
+
+    def release(self, tenant: str) -> None:
+        with self._cond:
+            self._inflight[tenant] -= 1
+            if self._inflight[tenant] <= 0:
+                del self._inflight[tenant]
+            self._total -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, tenant: str) -> Iterator[None]:
+        self.acquire(tenant)
+        try:
+            yield
+        finally:
+            self.release(tenant)
+
+
+def _running_jobs(app: ApolloApp) -> int:
+    # ``jobs`` is created on first use; a tenant that never started a job has none.
+    jobs = app.__dict__.get("jobs")
+    return jobs.active() if jobs is not None else 0
+
+
+def _resume_jobs(app: ApolloApp) -> None:
+    # Only tenants that have a journal can have jobs cut off by eviction or a restart.
+    journal = getattr(app, "job_journal_path", None)
+    if journal is None or not Path(journal).exists():
+        return
+    try:
+        resumed = app.jobs.resume()
+    except Exception as e:
+        logger.warning(f"TenantPool: failed to resume jobs: {e}")
+        return
+    if resumed:
+        logger.info(f"TenantPool: resumed {len(resumed)} job(s).")
+
+
+@dataclass
+class Tenant:
+    id: str
+    app: ApolloApp
+    last_used: float = field(default_factory=time.monotonic)
+    inflight: int = 0
+
+
+class TenantPool:
+    """
+    LRU pool of per-tenant ``ApolloApp`` instances.
+
+    Each tenant gets its own app, and with it its own HTTP connection pool,
+    rate-limit bucket and reference-data cache. Idle tenants are evicted
+    once ``idle_timeout`` passes or when the pool grows past ``max_tenants``;
+    tenants with calls in flight or bulk jobs running are never evicted. A
+    tenant's unfinished jobs are resumed when its app is created again. Eviction runs on every
+    checkout and, once :meth:`start` is called, on a background timer.
+    """
+
+    def __init__(
+        self,
+        max_tenants: int = 256,
+        idle_timeout: float = 900.0,
+        rate_limit_per_minute: Optional[float] = None,
+        max_concurrent: int = 16,
+        app_factory: Optional[Callable[[Integration], ApolloApp]] = None,
+    ) -> None:
+        self.max_tenants = max_tenants
+        self.idle_timeout = idle_timeout
+        self.rate_limit_per_minute = rate_limit_per_minute
+        self.app_factory = app_factory or self._default_factory
+        self.gate = FairGate(max_concurrent)
+        self._tenants: OrderedDict[str, Tenant] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _default_factory(self, integration: Integration) -> ApolloApp:
+        key = tenant_id(integration.get_credentials()["api_key"])
+        return ApolloApp(
+            integration=integration,
+            rate_limit_per_minute=self.rate_limit_per_minute,
+            job_journal_path=str(DEFAULT_JOURNAL_PATH.parent / "tenants" / key / DEFAULT_JOURNAL_PATH.name),
+        )
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def _checkout(self, api_key: str) -> Tenant:
+        key = tenant_id(api_key)
+        with self._lock:
+            tenant = self._tenants.get(key)
+            if tenant is None:
+                tenant = Tenant(id=key, app=self.app_factory(TenantIntegration(api_key)))
+                tenant.app.request_gate = functools.partial(self.gate.slot, key)
+                # Tenants get results back in the response, never on the server's disk.
+                tenant.app.data_dir = None
+                # Before anyone else gets the app, so resuming cannot mistake their chunks for stale ones.
+                _resume_jobs(tenant.app)
+                self._tenants[key] = tenant
+                logger.info(f"TenantPool: created tenant {key} ({len(self._tenants)} active).")
+            else:
+                self._tenants.move_to_end(key)
+            tenant.inflight += 1
+            tenant.last_used = time.monotonic()
+            self._evict_locked()
+        return tenant
+
+    def _checkin(self, tenant: Tenant) -> None:
+        with self._lock:
+            tenant.inflight -= 1
+            tenant.last_used = time.monotonic()
+
+    def _evict_locked(self) -> None:
+        now = time.monotonic()
+        for key, tenant in list(self._tenants.items()):
+            over_capacity = len(self._tenants) > self.max_tenants
+            idle = now - tenant.last_used > self.idle_timeout
+            if tenant.inflight or _running_jobs(tenant.app) or not (over_capacity or idle):
+                continue
+            del self._tenants[key]
+            tenant.app.close()
+            logger.info(f"TenantPool: evicted tenant {key}.")
+
+    def evict_idle(self) -> None:
+        with self._lock:
+            self._evict_locked()
+
+    def start(self) -> None:
+        """Evict idle tenants on a background thread, so their clients are closed without further traffic."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="apollo-tenant-eviction", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        interval = min(max(self.idle_timeout / 4, 1.0), 60.0)
+        while not self._stop.wait(interval):
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.warning(f"TenantPool: eviction failed: {e}")
+
+    def close(self) -> None:
+        """Stop the eviction timer and close every tenant's app."""
+        self.stop()
+        with self._lock:
+            tenants, self._tenants = list(self._tenants.values()), OrderedDict()
+        for tenant in tenants:
+            tenant.app.close()
+
+    @contextmanager
+    def session(self, api_key: Optional[str] = None) -> Iterator[ApolloApp]:
+        """
+        Check out the app for ``api_key`` (or the current request's tenant).
+        Its requests take a fair-scheduling slot each while they are sent.
+
+        Raises:
+            PermissionError: If the request carries no tenant API key. The
+                server's own ``APOLLO_API_KEY`` is never used for tenants.
+        """
+        api_key = api_key or current_api_key.get()
+        if not api_key:
+            raise PermissionError("No Apollo API key supplied; send it in the X-Apollo-Api-Key header.")
+        tenant = self._checkout(api_key)
+        try:
+            yield tenant.app
+        finally:
+            self._checkin(tenant)
+
+
+class MultiTenantApolloApp(ApolloApp):
+    """
+    ``ApolloApp`` that serves many API keys from one process.
+
+    The instance itself never talks to Apollo; it only supplies tool
+    signatures and docstrings. Each tool call is routed to the calling
+    tenant's app from the pool and run on a worker thread. Tools reading or
+    writing server files and admin tools are not offered, and the ``path``
+    arguments of the others are refused.
+    """
+
+    def __init__(self, pool: Optional[TenantPool] = None, **kwargs) -> None:
+        super().__init__(integration=None, **kwargs)
+        self.pool = pool or TenantPool()
+
+    def _route(self, tool: Callable[..., Any]) -> Callable[..., Any]:
+        name = tool.__name__
+
+        @functools.wraps(tool)
+        async def routed(*args, **kwargs):
+            api_key = current_api_key.get()
+
+            def call():
+                with self.pool.session(api_key) as app:
+                    return app.invoke_tool(name, *args, **kwargs)
+
+            return await anyio.to_thread.run_sync(call)
+
+        return routed
+
+    def tools(self):
+        return [tool for tool in super().tools() if tool.__name__ not in HIDDEN_TOOLS]
+
+    def list_tools(self):
+        return [self._route(tool) for tool in self.tools()]
+
+    def close(self) -> None:
+        self.pool.close()
+        super().close()
+
+
+class TenantMiddleware:
+    """
+    ASGI middleware that binds each connection to a tenant, taking the API key
+    from the ``X-Apollo-Api-Key`` header or an ``Authorization: Bearer`` header.
+    """
+
+    def __init__(self, app, header: str = "x-apollo-api-key") -> None:
+        self.app = app
+        self.header = header.lower().encode()
+
+    def _api_key(self, scope) -> Optional[str]:
+        headers = dict(scope.get("headers") or [])
+        if self.header in headers:
+            return headers[self.header].decode()
+        authorization = headers.get(b"authorization", b"").decode()
+        if authorization.lower().startswith("bearer "):
+            return authorization[7:].strip()
+        return None
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        token = current_api_key.set(self._api_key(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_api_key.reset(token)
@@ -0,0 +1,160 @@
+import importlib.util
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Mapping, Optional
+
+import httpx
+from loguru import logger
+
+DEFAULT = "default"
+LOOKUP = "lookup"
+SEARCH = "search"
+BULK = "bulk"
+FAMILIES = (DEFAULT, LOOKUP, SEARCH, BULK)
+
+# First matching pattern wins; anything else falls into the default family.
+_FAMILY_PATTERNS: tuple[tuple[re.Pattern, str], ...] = (
+    (re.compile(r"/(people/bulk_match|organizations/bulk_enrich|tasks/bulk_create|accounts/bulk_update)$"), BULK),
+    (re.compile(r"/(contacts/update_stages|contacts/update_owners|accounts/update_owners)$"), BULK),
+    (re.compile(r"/emailer_campaigns/([^/]+/add_contact_ids|remove_or_stop_contact_ids)$"), BULK),
+    (re.compile(r"/(mixed_people|mixed_companies|contacts|accounts|opportunities|tasks|users|emailer_campaigns)/search$"), SEARCH),
+    (re.compile(r"/organizations/[^/]+/job_postings$"), SEARCH),
+    (re.compile(r"/(account_stages|contact_stages|opportunity_stages|email_accounts|labels|typed_custom_fields)$"), LOOKUP),
+)
+
+
+def endpoint_family(url: str) -> str:
+    """Transport family of an Apollo endpoint URL."""
+    path = url.split("?", 1)[0].rstrip("/")
+    for pattern, family in _FAMILY_PATTERNS:
+        if pattern.search(path):
+            return family
+    return DEFAULT
+
+
+@dataclass(frozen=True)
+class TransportProfile:
+    """Connection-pool, timeout and protocol settings for one endpoint family."""
+
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 10.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    http2: bool = False
+    warm_connections: int = 1
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+DEFAULT_PROFILES: dict[str, TransportProfile] = {
+    DEFAULT: TransportProfile(),
+    LOOKUP: TransportProfile(read_timeout=10.0, max_connections=4, max_keepalive_connections=2),
+    SEARCH: TransportProfile(read_timeout=60.0, warm_connections=2),
+    BULK: TransportProfile(read_timeout=180.0, write_timeout=60.0, max_connections=32, max_keepalive_connections=16),
+}
+
+
+def _coerce(value: Any, kind: type) -> Any:
+    if kind is bool and isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return kind(value)
+
+
+def _apply(profile: TransportProfile, overrides: Mapping[str, Any]) -> TransportProfile:
+    types = {f.name: type(getattr(profile, f.name)) for f in fields(profile)}
+    unknown = set(overrides) - set(types)
+    if unknown:
+        raise ValueError(f"Unknown transport settings: {sorted(unknown)}")
+    return replace(profile, **{name: _coerce(value, types[name]) for name, value in overrides.items()})
+
+
+def load_profiles(env: Optional[Mapping[str, str]] = None, config_path: Optional[str | Path] = None) -> dict[str, TransportProfile]:
+    """
+    Build the transport profile of each endpoint family.
+
+    Starts from :data:`DEFAULT_PROFILES`, then applies a JSON config file
+    (``config_path`` or ``APOLLO_TRANSPORT_CONFIG``) shaped like
+    ``{"bulk": {"read_timeout": 300}}``, then individual environment
+    variables named ``APOLLO_TRANSPORT_<FAMILY>_<SETTING>``, e.g.
+    ``APOLLO_TRANSPORT_BULK_READ_TIMEOUT=300`` or ``APOLLO_TRANSPORT_SEARCH_HTTP2=1``.
+    """
+    env = os.environ if env is None else env
+    profiles = dict(DEFAULT_PROFILES)
+    config_path = config_path or env.get("APOLLO_TRANSPORT_CONFIG")
+    if config_path:
+        config = json.loads(Path(config_path).expanduser().read_text())
+        for family, overrides in config.items():
+            if family not in FAMILIES:
+                raise ValueError(f"Unknown endpoint family {family!r}; expected one of {FAMILIES}.")
+            profiles[family] = _apply(profiles[family], overrides)
+    for family in FAMILIES:
+        prefix = f"APOLLO_TRANSPORT_{family.upper()}_"
+        overrides = {key[len(prefix):].lower(): value for key, value in env.items() if key.startswith(prefix)}
+        if overrides:
+            profiles[family] = _apply(profiles[family], overrides)
+    return profiles
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_client(profile: TransportProfile, base_url: str, headers: Mapping[str, str]) -> httpx.Client:
+    http2 = profile.http2
+    if http2 and not http2_available():
+        logger.warning("HTTP/2 requested but the 'h2' package is not installed; falling back to HTTP/1.1.")
+        http2 = False
+    return httpx.Client(
+        base_url=base_url,
+        headers=dict(headers),
+        timeout=profile.timeout(),
+        limits=profile.limits(),
+        http2=http2,
+    )
+
+
+def warm_up(
+    clients: Mapping[str, httpx.Client],
+    profiles: Mapping[str, TransportProfile],
+    url: str,
+    admit: Optional[Callable[[], ContextManager[Any]]] = None,
+) -> None:
+    """
+    Open ``warm_connections`` keep-alive connections per family by sending
+    concurrent HEAD requests, so the first real call skips DNS, TCP and TLS.
+    Each request is sent inside ``admit()`` when given, e.g. a scheduler slot.
+    """
+    jobs = [(family, client) for family, client in clients.items() for _ in range(profiles[family].warm_connections)]
+
+    def ping(job: tuple[str, httpx.Client]) -> None:
+        family, client = job
+        try:
+            with admit() if admit is not None else nullcontext():
+                client.head(url)
+        except httpx.HTTPError as e:
+            logger.warning(f"Transport warm-up for {family} endpoints failed: {e}")
+
+    with ThreadPoolExecutor(max_workers=max(1, len(jobs))) as pool:
+        list(pool.map(ping, jobs))
+    logger.debug(f"Transport warm-up opened {len(jobs)} connection(s).")
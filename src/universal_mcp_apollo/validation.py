@@ -0,0 +1,290 @@
+import inspect
+import types
+import typing
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Optional
+
+from universal_mcp_apollo.analytics import GROUP_KEYS
+from universal_mcp_apollo.export import FORMATS, SEARCH_TOOLS
+from universal_mcp_apollo.hashing import ALGORITHMS
+from universal_mcp_apollo.importer import TARGETS
+from universal_mcp_apollo.jobs import JOB_KINDS
+from universal_mcp_apollo.planner import BULK_MATCH_LIMIT, BULK_ORGANIZATION_LIMIT
+
+MAX_PER_PAGE = 100
+MAX_DOMAINS_PER_SEARCH = 1000
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    A documented constraint on one or more parameters of a tool. ``test``
+    receives the values of ``params`` (None when not given) and returns True
+    when they are acceptable; ``message`` is formatted with the same values.
+    """
+
+    params: tuple[str, ...]
+    test: Callable[..., bool]
+    message: str
+
+
+def one_of(param: str, values: Any) -> Rule:
+    values = tuple(values)
+    return Rule((param,), lambda v: v is None or v in values, f"'{param}' must be one of {', '.join(map(str, values))} (got {{0!r}})")
+
+
+def each_one_of(param: str, values: Any) -> Rule:
+    values = tuple(values)
+    return Rule((param,), lambda v: v is None or all(x in values for x in v), f"'{param}' may only contain {', '.join(map(str, values))} (got {{0!r}})")
+
+
+def _as_int(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value)
+    return None
+
+
+def int_range(param: str, low: int, high: Optional[int] = None) -> Rule:
+    def test(value: Any) -> bool:
+        if value is None:
+            return True
+        number = _as_int(value)
+        return number is not None and number >= low and (high is None or number <= high)
+
+    bounds = f"between {low} and {high}" if high is not None else f"at least {low}"
+    return Rule((param,), test, f"'{param}' must be an integer {bounds} (got {{0!r}})")
+
+
+def max_items(param: str, limit: int) -> Rule:
+    return Rule((param,), lambda v: v is None or len(v) <= limit, f"'{param}' accepts at most {limit} items (got {{n}})")
+
+
+def not_empty(param: str) -> Rule:
+    return Rule((param,), lambda v: v is None or len(v) > 0, f"'{param}' must not be empty")
+
+
+def required_if(param: str, condition: str) -> Rule:
+    return Rule((condition, param), lambda c, v: not c or bool(v), f"'{param}' is required when '{condition}' is true")
+
+
+def equal(param: str, other: str) -> Rule:
+    return Rule((param, other), lambda a, b: a is None or b is None or a == b, f"'{param}' must match '{other}' (got {{0!r}} and {{1!r}})")
+
+
+def iso_datetime(param: str) -> Rule:
+    def test(value: Any) -> bool:
+        try:
+            return value is None or bool(datetime.fromisoformat(value))
+        except (TypeError, ValueError):
+            return False
+
+    return Rule((param,), test, f"'{param}' must be an ISO 8601 date and time such as 2025-02-15T08:10:30Z (got {{0!r}})")
+
+
+def iso_date(param: str) -> Rule:
+    def test(value: Any) -> bool:
+        try:
+            return value is None or bool(date.fromisoformat(value))
+        except (TypeError, ValueError):
+            return False
+
+    return Rule((param,), test, f"'{param}' must be a date in YYYY-MM-DD format (got {{0!r}})")
+
+
+def numeric(param: str) -> Rule:
+    def test(value: Any) -> bool:
+        try:
+            return value is None or float(value) == float(value)
+        except (TypeError, ValueError):
+            return False
+
+    return Rule((param,), test, f"'{param}' must be a number without commas or currency symbols (got {{0!r}})")
+
+
+# Paging limits apply to every tool that has these parameters.
+PAGING_RULES = (int_range("page", 1), int_range("per_page", 1, MAX_PER_PAGE), int_range("max_pages", 1))
+
+# Constraints stated in the tools' docstrings and Apollo's API reference.
+CONSTRAINTS: dict[str, tuple[Rule, ...]] = {
+    "people_enrichment": (required_if("webhook_url", "reveal_phone_number"),),
+    "bulk_people_enrichment": (
+        max_items("details", BULK_MATCH_LIMIT),
+        required_if("webhook_url", "reveal_phone_number"),
+    ),
+    "bulk_organization_enrichment": (not_empty("domains_"), max_items("domains_", BULK_ORGANIZATION_LIMIT)),
+    "people_search": (max_items("q_organization_domains_list_", MAX_DOMAINS_PER_SEARCH),),
+    "search_for_accounts": (one_of("sort_by_field", ("account_last_activity_date", "account_created_at", "account_updated_at")),),
+    "search_for_contacts": (
+        one_of(
+            "sort_by_field",
+            ("contact_last_activity_date", "contact_email_last_opened_at", "contact_email_last_clicked_at", "contact_created_at", "contact_updated_at"),
+        ),
+    ),
+    "update_account_stage": (not_empty("account_ids_"),),
+    "update_account_ownership": (not_empty("account_ids_"),),
+    "update_contact_stage": (not_empty("contact_ids_"),),
+    "update_contact_ownership": (not_empty("contact_ids_"),),
+    "create_deal": (numeric("amount"), iso_date("closed_date")),
+    "list_all_deals": (one_of("sort_by_field", ("amount", "is_closed", "is_won")),),
+    "update_deal": (numeric("amount"), iso_date("closed_date")),
+    "add_contacts_to_sequence": (not_empty("contact_ids_"), equal("emailer_campaign_id", "sequence_id")),
+    "update_contact_status_sequence": (
+        not_empty("emailer_campaign_ids_"),
+        not_empty("contact_ids_"),
+        one_of("mode", ("mark_as_finished", "remove", "stop")),
+    ),
+    "create_task": (
+        not_empty("contact_ids_"),
+        one_of("priority", ("high", "medium", "low")),
+        iso_datetime("due_at"),
+        one_of(
+            "type",
+            (
+                "call",
+                "outreach_manual_email",
+                "linkedin_step_connect",
+                "linkedin_step_message",
+                "linkedin_step_view_profile",
+                "linkedin_step_interact_post",
+                "action_item",
+            ),
+        ),
+        one_of("status", ("scheduled", "completed", "archived")),
+    ),
+    "create_tasks_in_bulk": (not_empty("tasks"), int_range("workers", 1)),
+    "search_tasks": (one_of("sort_by_field", ("task_due_at", "task_priority")),),
+    "enrich_people_with_cache": (required_if("webhook_url", "reveal_phone_number"),),
+    "enrich_hashed_email_file": (one_of("algorithm", ALGORITHMS),),
+    "export_search_results": (one_of("tool", SEARCH_TOOLS), one_of("format", FORMATS)),
+    "import_records": (one_of("target", TARGETS), one_of("format", ("csv", "ndjson")), int_range("workers", 1)),
+    "multi_people_search": (int_range("max_results", 1),),
+    "find_people_at_organizations": (int_range("max_organization_pages", 1), int_range("people_pages", 1), int_range("max_people", 1)),
+    "track_job_postings": (not_empty("organization_ids"), int_range("workers", 1)),
+    "enroll_contacts_in_sequences": (not_empty("enrollments"), int_range("workers", 1)),
+    "analyze_deals": (each_one_of("group_by", GROUP_KEYS), iso_date("closed_from"), iso_date("closed_to")),
+    "start_bulk_job": (one_of("kind", JOB_KINDS), not_empty("items")),
+    "retry_bulk_job": (not_empty("job_id"),),
+    "fetch_result_chunk": (int_range("chunk", 0),),
+    "get_slow_tool_calls": (int_range("limit", 1),),
+}
+
+
+def _expected(annotation: Any) -> tuple[Optional[tuple[type, ...]], Optional[tuple[type, ...]]]:
+    """(accepted types, accepted list item types) for a parameter annotation; None means anything."""
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        members = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(members) == 1:
+            return _expected(members[0])
+        return None, None
+    if annotation is Any or annotation is inspect.Parameter.empty:
+        return None, None
+    if origin is list or annotation is list:
+        args = typing.get_args(annotation)
+        item = _expected(args[0])[0] if args else None
+        return (list, tuple), item
+    if origin is dict or annotation is dict:
+        return (dict,), None
+    if annotation is float:
+        return (int, float), None
+    if isinstance(annotation, type):
+        return (annotation,), None
+    return None, None
+
+
+def _type_name(accepted: tuple[type, ...]) -> str:
+    names = {list: "array", tuple: "array", dict: "object", str: "string", int: "integer", float: "number", bool: "boolean"}
+    return " or ".join(dict.fromkeys(names.get(t, t.__name__) for t in accepted))
+
+
+def _describe(value: Any) -> str:
+    return _type_name((type(value),))
+
+
+class Validator:
+    """
+    Argument checks for one tool, compiled from its signature and
+    :data:`CONSTRAINTS`: required parameters, parameter types (including the
+    item type of arrays) and the documented value rules. Raises ValueError
+    listing every problem at once, before any request is made.
+    """
+
+    __slots__ = ("tool", "names", "required", "types", "rules")
+
+    def __init__(self, tool: str, func: Callable[..., Any], rules: tuple[Rule, ...] = ()) -> None:
+        signature = inspect.signature(func)
+        hints = typing.get_type_hints(func)
+        parameters = [p for p in signature.parameters.values() if p.name != "self" and p.kind is p.POSITIONAL_OR_KEYWORD]
+        self.tool = tool
+        self.names = tuple(p.name for p in parameters)
+        self.required = tuple(p.name for p in parameters if p.default is p.empty)
+        self.types = {}
+        for p in parameters:
+            accepted, item = _expected(hints.get(p.name, p.annotation))
+            if accepted is not None:
+                self.types[p.name] = (accepted, item)
+        for rule in rules:
+            unknown = set(rule.params) - set(self.names)
+            if unknown:
+                raise TypeError(f"Constraint for {tool} names unknown parameters {sorted(unknown)}.")
+        self.rules = tuple(rules)
+
+    def errors(self, args: tuple = (), kwargs: Optional[dict[str, Any]] = None) -> list[str]:
+        kwargs = kwargs or {}
+        errors = []
+        if len(args) > len(self.names):
+            errors.append(f"takes {len(self.names)} arguments but {len(args)} were given")
+        values = dict(zip(self.names, args))
+        for name, value in kwargs.items():
+            if name not in self.names:
+                errors.append(f"unexpected parameter '{name}'")
+            elif name in values:
+                errors.append(f"got multiple values for '{name}'")
+            values[name] = value
+        for name in self.required:
+            if values.get(name) is None:
+                errors.append(f"missing required parameter '{name}'")
+        for name, value in values.items():
+            if value is None or name not in self.types:
+                continue
+            accepted, item = self.types[name]
+            if not isinstance(value, accepted) or (isinstance(value, bool) and bool not in accepted):
+                errors.append(f"'{name}' must be {_type_name(accepted)} (got {_describe(value)})")
+            elif item is not None:
+                for x in value:
+                    if not isinstance(x, item) or (isinstance(x, bool) and bool not in item):
+                        errors.append(f"'{name}' items must be {_type_name(item)} (got {_describe(x)})")
+                        break
+        if errors:
+            return errors
+        for rule in self.rules:
+            params = [values.get(p) for p in rule.params]
+            if not rule.test(*params):
+                errors.append(rule.message.format(*params, n=len(params[0]) if hasattr(params[0], "__len__") else None))
+        return errors
+
+    def __call__(self, args: tuple = (), kwargs: Optional[dict[str, Any]] = None) -> None:
+        errors = self.errors(args, kwargs)
+        if errors:
+            raise ValueError(f"Invalid arguments for {self.tool}: {'; '.join(errors)}.")
+
+
+def compile_validators(cls: type, constraints: Optional[dict[str, tuple[Rule, ...]]] = None) -> dict[str, Validator]:
+    """One :class:`Validator` per tool of ``cls``, with paging limits and ``constraints`` applied."""
+    constraints = CONSTRAINTS if constraints is None else constraints
+    # tools() only looks its methods up by name, so on the class it lists the plain functions.
+    tools = {func.__name__: func for func in cls.tools(cls)}
+    unknown = set(constraints) - set(tools)
+    if unknown:
+        raise TypeError(f"Constraints given for unknown tools {sorted(unknown)}.")
+    validators = {}
+    for name, func in tools.items():
+        parameters = inspect.signature(func).parameters
+        rules = tuple(r for r in PAGING_RULES if r.params[0] in parameters) + constraints.get(name, ())
+        validators[name] = Validator(name, func, rules)
+    return validators
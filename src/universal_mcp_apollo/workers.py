@@ -0,0 +1,215 @@
+import asyncio
+import functools
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from typing import Any, Callable, Optional
+
+import anyio
+from loguru import logger
+from universal_mcp.integrations import ApiKeyIntegration
+from universal_mcp.stores import EnvironmentStore
+
+from universal_mcp_apollo.app import VALIDATORS, ApolloApp
+
+# Tools answered by the server process itself: result cursors live in its
+# store, bulk jobs must outlive any one worker, which may be recycled, and
+# the deal table and the enrichment index that preflight and sync fill are
+# kept in one place rather than once per worker.
+LOCAL_TOOLS = (
+    "fetch_result_chunk",
+    "start_bulk_job",
+    "get_bulk_job_progress",
+    "retry_bulk_job",
+    "get_request_scheduler_metrics",
+    "get_slow_tool_calls",
+    "sync_enrichment_cache",
+    "analyze_deals",
+    "enroll_contacts_in_sequences",
+)
+
+# This worker process's app, built once by ``_init_worker``.
+_app: Optional[ApolloApp] = None
+
+
+def default_app(**options: Any) -> ApolloApp:
+    """
+    Worker app authenticated from ``APOLLO_API_KEY``, with warmed-up
+    connections. Only the server process refreshes reference data on a
+    timer; a worker loads each kind on first use and again on a name miss.
+    """
+    app = ApolloApp(integration=ApiKeyIntegration(name="APOLLO_API_KEY", store=EnvironmentStore()), **options)
+    threading.Thread(target=app.warm_up, name="apollo-warm-up", daemon=True).start()
+    return app
+
+
+def _init_worker(app_factory: Callable[..., ApolloApp], options: dict[str, Any]) -> None:
+    global _app
+    _app = app_factory(**options)
+    # Runs when the worker exits, including when it is recycled.
+    Finalize(_app, _app.close, exitpriority=10)
+    logger.info(f"WorkerPool: worker {os.getpid()} ready.")
+
+
+def _portable(error: Exception) -> Exception:
+    """``error`` if it survives pickling back to the server, else a RuntimeError carrying its message."""
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def _run(name: str, args: tuple, kwargs: dict[str, Any]) -> tuple[str, Optional[tuple]]:
+    """Run one tool call and encode its result to JSON here, in the worker."""
+    try:
+        return _app.results.encode(getattr(_app, name)(*args, **kwargs))
+    except Exception as e:
+        portable = _portable(e)
+        if portable is e:
+            raise
+        raise portable from None
+
+
+class WorkerPool:
+    """
+    Tool calls run on ``workers`` spawned processes, so JSON decoding,
+    response shaping and encoding of large results use every core.
+
+    Each worker builds its own app with ``app_factory(**options)``: its own
+    HTTP connection pools and reference data, and an enrichment index and
+    rate budget shared with the others only when ``options`` point them at
+    the same ``cache_path`` and ``rate_limit_path`` (the server always does).
+    A worker is recycled after ``max_tasks_per_child`` calls: it finishes
+    the call in hand, closes its app and exits, and a fresh process takes
+    its place, so slow leaks or fragmentation cannot build up.
+
+    Raises:
+        ValueError: If ``options`` carry a cassette, which only the server
+            process may open.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        options: Optional[dict[str, Any]] = None,
+        app_factory: Callable[..., ApolloApp] = default_app,
+        max_tasks_per_child: Optional[int] = 1000,
+    ) -> None:
+        if (options or {}).get("cassette") is not None:
+            # Every worker would reopen, and in record mode truncate, the same file.
+            raise ValueError("Cassettes cannot be used with worker processes.")
+        self.workers = workers or os.cpu_count() or 1
+        self.max_tasks_per_child = max_tasks_per_child
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(app_factory, options or {}),
+            max_tasks_per_child=max_tasks_per_child,
+        )
+        self._lock = threading.Lock()
+        self.counts = {"submitted": 0, "completed": 0, "failed": 0}
+        self.busy_seconds = 0.0
+
+    def submit(self, name: str, args: tuple = (), kwargs: Optional[dict[str, Any]] = None) -> Future:
+        """Run tool ``name`` on a worker; the future holds the JSON text and any cursor to adopt."""
+        started = time.monotonic()
+        future = self._executor.submit(_run, name, args, kwargs or {})
+        with self._lock:
+            self.counts["submitted"] += 1
+
+        def done(f: Future) -> None:
+            with self._lock:
+                self.counts["failed" if f.cancelled() or f.exception() else "completed"] += 1
+                self.busy_seconds += time.monotonic() - started
+
+        future.add_done_callback(done)
+        return future
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_tasks_per_child": self.max_tasks_per_child,
+                **self.counts,
+                "in_flight": self.counts["submitted"] - self.counts["completed"] - self.counts["failed"],
+                "busy_seconds": round(self.busy_seconds, 3),
+            }
+
+    def close(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+class PooledApolloApp(ApolloApp):
+    """
+    ``ApolloApp`` that serves tool calls from a :class:`WorkerPool`.
+
+    Arguments are validated here, before anything is sent to a worker. The
+    worker returns the result already encoded as JSON text, which is passed
+    to the client as is; for an oversized result it returns the first chunk
+    and this process adopts the rest, so ``fetch_result_chunk`` is answered
+    locally. :data:`LOCAL_TOOLS` run in this process, on a thread.
+    """
+
+    def __init__(self, pool: WorkerPool, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.pool = pool
+
+    def call(self, name: str, *args, **kwargs) -> Future:
+        """Validate and submit one tool call; the future resolves to the result's JSON text."""
+        VALIDATORS[name](args, kwargs)
+        result: Future = Future()
+
+        def adopt(f: Future) -> None:
+            if f.cancelled() or f.exception() is not None:
+                result.set_exception(f.exception() if not f.cancelled() else RuntimeError("Tool call cancelled."))
+                return
+            text, cursor = f.result()
+            if cursor is not None:
+                self.results.adopt(*cursor)
+            result.set_result(text)
+
+        self.pool.submit(name, args, kwargs).add_done_callback(adopt)
+        return result
+
+    def _route(self, tool: Callable[..., Any]) -> Callable[..., Any]:
+        name = tool.__name__
+        if name in LOCAL_TOOLS:
+
+            @functools.wraps(tool)
+            async def local(*args, **kwargs):
+                return await anyio.to_thread.run_sync(functools.partial(self.invoke_tool, name, *args, **kwargs))
+
+            return local
+
+        @functools.wraps(tool)
+        async def pooled(*args, **kwargs):
+            return await asyncio.wrap_future(self.call(name, *args, **kwargs))
+
+        return pooled
+
+    def list_tools(self):
+        return [self._route(tool) for tool in self.tools()]
+
+    def get_request_scheduler_metrics(self) -> dict[str, Any]:
+        """
+        Reports the server process's request scheduler (used by bulk jobs) and the worker pool: workers, calls submitted, completed, failed and in flight, and total busy time.
+
+        Returns:
+            dict[str, Any]: The scheduler metrics of `get_request_scheduler_metrics` plus a `worker_pool` section.
+
+        Tags:
+            Admin
+        """
+        metrics = super().get_request_scheduler_metrics()
+        metrics["worker_pool"] = self.pool.metrics()
+        return metrics
+
+    def close(self) -> None:
+        self.pool.close()
+        super().close()
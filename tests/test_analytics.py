@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from universal_mcp_apollo.analytics import DealTable, analyze
+
+
+class FakeReference:
+    def resolve(self, kind, value):
+        if value == "Nobody":
+            raise ValueError(f"Unknown {kind} {value!r}")
+        return {"Won": "stage-won", "Ada": "owner-1"}.get(value, value)
+
+
+class FakeApp:
+    def __init__(self, deals):
+        self.deals = deals
+        self.pages = []
+        self.reference = FakeReference()
+
+    def list_all_deals(self, page=None, per_page=None, **kwargs):
+        self.pages.append(page)
+        start = (page - 1) * per_page
+        return {"opportunities": self.deals[start:start + per_page], "pagination": {"total_pages": -(-len(self.deals) // per_page)}}
+
+
+def _deals(n):
+    return [
+        {
+            "id": f"d{i}",
+            "amount": 100 * (i % 5 + 1),
+            "opportunity_stage_id": "stage-won" if i % 3 == 0 else "stage-open",
+            "owner_id": f"owner-{i % 2}",
+            "closed_date": f"2025-{i % 12 + 1:02d}-15" if i % 3 == 0 else None,
+            "is_won": i % 3 == 0,
+            "is_closed": i % 3 == 0,
+        }
+        for i in range(n)
+    ]
+
+
+def test_group_by_and_filters_match_a_plain_computation():
+    deals = _deals(300)
+    table = DealTable()
+    table.refresh(FakeApp(deals), per_page=40)
+    assert len(table) == 300
+
+    groups = table.query(["opportunity_stage_id", "owner_id"])
+    expected = {}
+    for d in deals:
+        key = (d["opportunity_stage_id"], d["owner_id"])
+        expected[key] = expected.get(key, 0) + d["amount"]
+    assert {(g["opportunity_stage_id"], g["owner_id"]): g["amount"] for g in groups} == expected
+
+    q1 = table.query(["closed_quarter"], {"is_won": True, "closed_from": "2025-01-01", "closed_to": "2025-03-31"})
+    assert [g["closed_quarter"] for g in q1] == ["2025-Q1"]
+    assert q1[0]["count"] == sum(1 for d in deals if d["is_won"] and d["closed_date"] and d["closed_date"] <= "2025-03-31")
+
+    with pytest.raises(ValueError):
+        table.query(["bogus"])
+    for bad in ({"closed_from": "Q1 2025"}, {"closed_to": "2025-13-01"}):
+        with pytest.raises(ValueError):
+            table.query(filters=bad)
+
+
+def test_incremental_refresh_upserts_and_drops_missing():
+    deals = _deals(10)
+    app = FakeApp(deals)
+    table = DealTable()
+    table.refresh(app, per_page=4)
+    app.deals = [{**deals[0], "amount": 999}, *deals[1:9]]
+    stats = table.refresh(app, per_page=4)
+    assert stats["changed"] == 1 and stats["removed"] == 1
+    assert len(table) == 9
+    assert table.query()[0]["amount"] == 999 + sum(d["amount"] for d in deals[1:9])
+
+    # Once dropped deals outnumber live ones, their rows are reclaimed.
+    app.deals = deals[1:3]
+    table.refresh(app, per_page=4)
+    assert table.ids == [d["id"] for d in deals[1:3]] and len(table.amount) == 2
+    assert table.query()[0]["count"] == 2
+
+
+def test_analyze_resolves_names_and_reuses_fresh_data():
+    app = FakeApp(_deals(30))
+    table = DealTable()
+    first = analyze(app, table, ["owner_id"], {"opportunity_stage_ids": ["Won"], "owner_ids": ["Ada"]})
+    assert first["refreshed"] and [g["owner_id"] for g in first["groups"]] == ["owner-1"]
+    pages = len(app.pages)
+    second = analyze(app, table, ["is_won"])
+    assert second["refreshed"] is None and len(app.pages) == pages
+    time.sleep(0.01)
+    assert analyze(app, table, max_age=0.001)["refreshed"]
+
+
+def test_analyze_fails_fast_and_refreshes_once_under_concurrency():
+    app = FakeApp(_deals(30))
+    table = DealTable()
+    with pytest.raises(ValueError):
+        analyze(app, table, filters={"owner_ids": ["Nobody"]})
+    with pytest.raises(ValueError):
+        analyze(app, table, ["bogus"])
+    assert app.pages == []
+
+    fetch = app.list_all_deals
+
+    def slow_fetch(**kwargs):
+        time.sleep(0.05)
+        return fetch(**kwargs)
+
+    app.list_all_deals = slow_fetch
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(analyze(app, table))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert app.pages == [1]
+    assert sum(1 for r in results if r["refreshed"]) == 1
+    assert all(r["deals"] == 30 for r in results)
@@ -0,0 +1,129 @@
+import gzip
+import json
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_apollo.app import ApolloApp
+from universal_mcp_apollo.cassette import RECORD, REPLAY, Cassette, CassetteMiss, run_calls
+from universal_mcp_apollo.transport import FAMILIES
+
+API_KEY = "secret-key-123"
+ID = "5f0c1e2d3b4a596877665544"
+
+# One representative call per API tool.
+TOOL_CALLS = [
+    ("people_enrichment", {"email": "ada@example.com"}),
+    ("bulk_people_enrichment", {"details": [{"email": "ada@example.com"}]}),
+    ("organization_enrichment", {"domain": "example.com"}),
+    ("bulk_organization_enrichment", {"domains_": ["example.com", "example.org"]}),
+    ("people_search", {"person_titles_": ["cto"], "per_page": 5}),
+    ("organization_search", {"q_organization_name": "Example"}),
+    ("organization_jobs_postings", {"organization_id": ID}),
+    ("create_an_account", {"name": "Example", "domain": "example.com"}),
+    ("update_an_account", {"account_id": ID, "name": "Example Inc"}),
+    ("search_for_accounts", {"q_organization_name": "Example"}),
+    ("update_account_stage", {"account_ids_": [ID], "account_stage_id": ID}),
+    ("update_account_ownership", {"account_ids_": [ID], "owner_id": ID}),
+    ("list_account_stages", {}),
+    ("create_a_contact", {"first_name": "Ada", "last_name": "Lovelace"}),
+    ("update_a_contact", {"contact_id": ID, "title": "CTO"}),
+    ("search_for_contacts", {"q_keywords": "ada"}),
+    ("update_contact_stage", {"contact_ids_": [ID], "contact_stage_id": ID}),
+    ("update_contact_ownership", {"contact_ids_": [ID], "owner_id": ID}),
+    ("list_contact_stages", {}),
+    ("create_deal", {"name": "Renewal"}),
+    ("list_all_deals", {"per_page": 5}),
+    ("update_deal", {"opportunity_id": ID, "amount": "100"}),
+    ("list_deal_stages", {}),
+    ("add_contacts_to_sequence", {"sequence_id": ID, "emailer_campaign_id": ID, "contact_ids_": [ID], "send_email_from_email_account_id": ID}),
+    ("update_contact_status_sequence", {"emailer_campaign_ids_": [ID], "contact_ids_": [ID], "mode": "remove"}),
+    ("create_task", {"user_id": ID, "contact_ids_": [ID], "priority": "high", "due_at": "2025-01-01T00:00:00Z", "type": "call", "status": "scheduled"}),
+    ("search_tasks", {"per_page": 5}),
+    ("get_a_list_of_users", {}),
+    ("get_a_list_of_email_accounts", {}),
+    ("get_a_list_of_all_liststags", {}),
+    ("get_a_list_of_all_custom_fields", {}),
+    ("view_deal", {"opportunity_id": ID}),
+    ("search_for_sequences", {"q_name": "Onboarding"}),
+]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    time.sleep(0.01)
+    if request.url.path.endswith("/missing"):
+        return httpx.Response(404, json={"error": "not found"})
+    # Echo the key back, as some error payloads do, to exercise redaction.
+    return httpx.Response(200, json={"path": request.url.path, "query": str(request.url.query), "key": request.headers.get("x-api-key")})
+
+
+def _app(cassette: Cassette, handler=_handler) -> ApolloApp:
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"api_key": API_KEY}
+    app = ApolloApp(integration=integration, cassette=cassette, adaptive_concurrency=False)
+    transport = httpx.MockTransport(handler)
+    app._clients = {family: httpx.Client(transport=transport, headers=app._get_headers()) for family in FAMILIES}
+    return app
+
+
+def _offline(request: httpx.Request) -> httpx.Response:
+    raise AssertionError(f"network used during replay: {request.url}")
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    path = tmp_path / "apollo.ndjson.gz"
+    app = _app(Cassette(path, mode=RECORD, redact=[API_KEY]))
+    results = [getattr(app, name)(**kwargs) for name, kwargs in TOOL_CALLS]
+    app.close()
+    return path, results
+
+
+def test_replay_reproduces_every_tool_offline(recorded):
+    path, results = recorded
+    app = _app(Cassette(path, mode=REPLAY), handler=_offline)
+    replayed = [getattr(app, name)(**kwargs) for name, kwargs in TOOL_CALLS]
+    assert [{**r, "key": None} for r in replayed] == [{**r, "key": None} for r in results]
+    assert all(r["key"] == "<REDACTED>" for r in replayed)
+
+
+def test_cassette_is_compact_and_redacted(recorded):
+    path, _ = recorded
+    # A single gzip member, not one per interaction.
+    assert path.read_bytes().count(b"\x1f\x8b\x08") == 1
+    raw = gzip.decompress(path.read_bytes()).decode()
+    assert API_KEY not in raw
+    assert len(raw.splitlines()) == len(TOOL_CALLS)
+    assert all(json.loads(line)["status"] == 200 for line in raw.splitlines())
+    assert "x-api-key" not in raw.lower()
+
+
+def test_error_responses_replay_and_unknown_requests_miss(tmp_path):
+    path = tmp_path / "errors.ndjson.gz"
+    recorder = _app(Cassette(path, mode=RECORD))
+    with pytest.raises(httpx.HTTPStatusError):
+        recorder._get(f"{recorder.base_url}/missing").raise_for_status()
+    recorder.close()
+    app = _app(Cassette(path, mode=REPLAY), handler=_offline)
+    assert app._get(f"{app.base_url}/missing").status_code == 404
+    with pytest.raises(CassetteMiss):
+        app._get(f"{app.base_url}/never-recorded")
+
+
+def test_replay_timing_and_throughput(recorded):
+    path, _ = recorded
+    recorded_latency = sum(
+        json.loads(line)["elapsed"] for line in gzip.decompress(path.read_bytes()).decode().splitlines()
+    )
+    for speed in (1.0, 0.5, 0.0):
+        delays = []
+        app = _app(Cassette(path, mode=REPLAY, speed=speed, sleep=delays.append), handler=_offline)
+        assert run_calls(app, TOOL_CALLS)["calls"] == len(TOOL_CALLS)
+        assert sum(delays) == pytest.approx(recorded_latency * speed)
+
+    original = run_calls(_app(Cassette(path, mode=REPLAY, speed=1.0), handler=_offline), TOOL_CALLS)
+    compressed = run_calls(_app(Cassette(path, mode=REPLAY, speed=0.0), handler=_offline), TOOL_CALLS, workers=4)
+    assert original["seconds"] >= recorded_latency
+    assert compressed["seconds"] < original["seconds"]
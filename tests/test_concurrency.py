@@ -0,0 +1,38 @@
+from universal_mcp_apollo.concurrency import AdaptiveLimiter
+
+
+def test_limit_grows_while_healthy_and_halves_on_429():
+    limiter = AdaptiveLimiter(initial=4, max_limit=16, cooldown=0)
+    for _ in range(200):
+        limiter.record(0.1, status=200)
+    assert limiter.limit == 16
+    limiter.record(0.1, status=429)
+    assert limiter.limit == 8
+    limiter.record(0.1, error=True)
+    assert limiter.limit == 4
+
+
+def test_rising_latency_backs_off():
+    limiter = AdaptiveLimiter(initial=10, cooldown=0, smoothing=1.0)
+    limiter.record(0.1, status=200)
+    before = limiter._limit
+    limiter.record(0.5, status=200)
+    assert limiter._limit < before
+
+
+def test_mixed_endpoint_latencies_do_not_shrink_the_limit():
+    limiter = AdaptiveLimiter(initial=4, max_limit=16, cooldown=0)
+    for i in range(400):
+        if i % 2:
+            limiter.record(2.0, status=200, family="bulk_match")
+        else:
+            limiter.record(0.05, status=200, family="lookup")
+    assert limiter.limit == 16 and limiter.metrics()["decreases"] == 0
+    assert limiter.metrics()["latency_seconds"]["bulk_match"]["baseline"] == 2.0
+
+
+def test_burst_of_errors_counts_once_within_cooldown():
+    limiter = AdaptiveLimiter(initial=16, cooldown=60)
+    for _ in range(5):
+        limiter.record(0.1, status=503)
+    assert limiter.limit == 8
@@ -0,0 +1,58 @@
+from universal_mcp_apollo.crawler import PostingCrawler, PostingStore, crawl_postings
+
+
+class FakeApp:
+    """Postings newest first; ``postings`` maps org ID to a list of posting IDs."""
+
+    def __init__(self, postings):
+        self.postings = postings
+        self.calls = []
+
+    def organization_jobs_postings(self, organization_id, page=None, per_page=None):
+        self.calls.append((organization_id, page))
+        ids = self.postings[organization_id]
+        start = (page - 1) * per_page
+        return {
+            "organization_job_postings": [{"id": i, "title": f"Job {i}"} for i in ids[start:start + per_page]],
+            "pagination": {"total_entries": len(ids), "total_pages": max(1, -(-len(ids) // per_page))},
+        }
+
+
+def test_baseline_then_unchanged_costs_one_request(tmp_path):
+    app = FakeApp({"a": [f"j{i}" for i in range(25, 0, -1)], "b": ["x"]})
+    store = PostingStore(tmp_path / "postings.sqlite3")
+    first = crawl_postings(app, store, ["a", "b"], per_page=10, workers=2)
+    assert first["baseline"] == 2 and first["changes"] == [] and first["pages"] == 4
+
+    app.calls.clear()
+    second = crawl_postings(app, store, ["a", "b"], per_page=10, workers=2)
+    assert second["unchanged"] == 2 and second["changes"] == []
+    assert sorted(app.calls) == [("a", 1), ("b", 1)]
+
+
+def test_new_postings_stop_at_first_known_page(tmp_path):
+    app = FakeApp({"a": [f"j{i}" for i in range(25, 0, -1)]})
+    store = PostingStore(tmp_path / "postings.sqlite3")
+    crawler = PostingCrawler(app, store, per_page=10)
+    crawler.crawl(["a"])
+
+    app.postings["a"] = ["j27", "j26", *app.postings["a"]]
+    app.calls.clear()
+    changes = crawler.crawl_one("a")
+    assert [p["id"] for p in changes.added] == ["j27", "j26"]
+    assert changes.removed == [] and app.calls == [("a", 1)]
+
+
+def test_removed_postings_trigger_full_walk(tmp_path):
+    app = FakeApp({"a": [f"j{i}" for i in range(25, 0, -1)]})
+    store = PostingStore(tmp_path / "postings.sqlite3")
+    crawler = PostingCrawler(app, store, per_page=10)
+    crawler.crawl(["a"])
+
+    app.postings["a"] = ["j26", *[j for j in app.postings["a"] if j not in ("j3", "j2")]]
+    result = crawl_postings(app, store, ["a"], per_page=10)
+    assert result["changed"] == 1
+    assert {(c["change"], c.get("posting", {}).get("id") or c.get("posting_id")) for c in result["changes"]} == {
+        ("added", "j26"), ("removed", "j2"), ("removed", "j3"),
+    }
+    assert store.state("a")[2] == set(app.postings["a"])
@@ -0,0 +1,71 @@
+import inspect
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from universal_mcp_apollo.app import ApolloApp
+from universal_mcp_apollo.cursors import ResultStore
+
+
+def _people(n):
+    return {"people": [{"id": f"{i:024x}", "name": f"Person {i}", "title": "Engineer" * 5} for i in range(n)], "pagination": {"total_entries": n}}
+
+
+def test_small_results_pass_through():
+    store = ResultStore(chunk_bytes=10_000)
+    result = _people(3)
+    assert store.paginate(result) is result and len(store) == 0
+
+
+def test_large_list_is_split_on_record_boundaries():
+    store = ResultStore(chunk_bytes=4_000)
+    result = _people(200)
+    page = store.paginate(result)
+    assert page["pagination"] == result["pagination"]
+    people = list(page["people"])
+    cursor = page["result_cursor"]
+    assert cursor["key"] == "people" and cursor["total_records"] == 200
+    assert len(json.dumps(page, separators=(",", ":"))) <= 4_000 + 300
+    while cursor["next_chunk"] is not None:
+        page = store.fetch(cursor["token"], cursor["next_chunk"])
+        assert len(json.dumps(page["people"], separators=(",", ":"))) <= 4_000
+        people.extend(page["people"])
+        cursor = page["result_cursor"]
+    assert people == result["people"]
+
+
+def test_unstructured_results_split_as_text():
+    store = ResultStore(chunk_bytes=1_000)
+    result = {"blob": "x" * 5_000}
+    page = store.paginate(result)
+    text = page["data"]
+    cursor = page["result_cursor"]
+    while cursor["next_chunk"] is not None:
+        page = store.fetch(cursor["token"], cursor["next_chunk"])
+        text += page["data"]
+        cursor = page["result_cursor"]
+    assert json.loads(text) == result
+
+
+def test_entries_expire_and_are_bounded():
+    store = ResultStore(chunk_bytes=1_000, ttl=0.05, max_entries=2)
+    tokens = [store.paginate(_people(50))["result_cursor"]["token"] for _ in range(3)]
+    assert len(store) == 2
+    with pytest.raises(ValueError):
+        store.fetch(tokens[0], 1)
+    time.sleep(0.06)
+    with pytest.raises(ValueError):
+        store.fetch(tokens[2], 1)
+
+
+def test_exposed_tools_keep_signature_and_chunk_results():
+    app = ApolloApp(integration=MagicMock(), result_chunk_bytes=2_000)
+    tools = {tool.__name__: tool for tool in app.list_tools()}
+    assert inspect.signature(tools["people_search"]) == inspect.signature(app.people_search)
+    assert "fetch_result_chunk" in tools
+    app.people_search = lambda **kwargs: _people(100)
+    first = tools["people_search"](per_page=100)
+    second = tools["fetch_result_chunk"](cursor=first["result_cursor"]["token"], chunk=1)
+    assert second["result_cursor"]["chunk"] == 1 and second["people"]
@@ -0,0 +1,64 @@
+import csv
+
+import pytest
+
+from universal_mcp_apollo.enrollment import Enrollment, EnrollmentEngine, enroll, preflight
+from universal_mcp_apollo.planner import EnrichmentPlanner
+
+
+class FakeApp:
+    def __init__(self):
+        self.enrichment_planner = EnrichmentPlanner(self)
+        self.calls = []
+
+    def add_contacts_to_sequence(self, sequence_id, emailer_campaign_id, contact_ids_, send_email_from_email_account_id, user_id=None, **flags):
+        self.calls.append((sequence_id, list(contact_ids_), flags))
+        if sequence_id == "broken":
+            raise RuntimeError("503")
+        return {"skipped_contact_ids": {c: "contact_in_other_campaigns" for c in contact_ids_ if c.endswith("-x")}}
+
+
+def test_preflight_reasons_follow_flags():
+    enrollment = Enrollment("seq", [], "mailbox")
+    assert preflight(None, enrollment) is None
+    assert preflight({"id": "c"}, enrollment) == "no_email"
+    for status in ("unverified", "unavailable", "bounced", "invalid"):
+        contact = {"id": "c", "email": "a@b.co", "email_status": status}
+        assert preflight(contact, enrollment) == f"email_{status}"
+        assert preflight(contact, Enrollment("seq", [], "mailbox", {"sequence_unverified_email": True})) is None
+    for status in ("verified", "guessed", "extrapolated", "likely_to_engage", None):
+        assert preflight({"id": "c", "email": "a@b.co", "email_status": status}, enrollment) is None
+    busy = {"id": "c", "email": "a@b.co", "email_status": "verified", "contact_campaign_statuses": [{"emailer_campaign_id": "other", "status": "active"}]}
+    assert preflight(busy, enrollment) == "active_in_other_campaign"
+    assert preflight(busy, Enrollment("seq", [], "mailbox", {"sequence_active_in_other_campaigns": True})) is None
+    assert preflight({**busy, "contact_campaign_statuses": [{"emailer_campaign_id": "seq", "status": "active"}]}, enrollment) == "already_in_sequence"
+
+
+def test_engine_filters_chunks_and_reports_every_contact():
+    app = FakeApp()
+    index = app.enrichment_planner.index
+    index.add({"id": "no-email"})
+    index.add({"id": "ok", "email": "ok@example.com", "email_status": "verified"})
+    contacts = ["no-email", "ok", *[f"c{i}" for i in range(149)], "c0", "late-x"]
+    result = EnrollmentEngine(app, workers=4).run([
+        Enrollment("seq-a", contacts, "mailbox-1"),
+        Enrollment("seq-b", ["ok"], "mailbox-2"),
+        Enrollment("broken", ["c1"], "mailbox-3"),
+    ])
+    assert result["filtered"] == 1 and result["rejected"] == 1 and result["failed"] == 1
+    assert result["added"] == 150 + 1
+    assert result["contacts"] == 152 + 1 + 1
+    assert result["api_calls"] == 4
+    assert all(len(ids) <= 100 for _, ids, _ in app.calls)
+    # A successful enrollment is remembered, so re-sending is filtered locally.
+    again = EnrollmentEngine(app).run([Enrollment("seq-b", ["ok"], "mailbox-2")])
+    assert again["outcomes"][0]["reason"] == "already_in_sequence" and again["api_calls"] == 0
+
+
+def test_enroll_writes_csv_and_validates(tmp_path):
+    result = enroll(FakeApp(), [{"sequence_id": "s", "contact_ids": ["a", "b"], "send_email_from_email_account_id": "m", "sequence_no_email": True}], path=tmp_path / "out.csv")
+    with open(tmp_path / "out.csv") as f:
+        assert [r["outcome"] for r in csv.DictReader(f)] == ["added", "added"]
+    assert result["added"] == 2
+    with pytest.raises(ValueError):
+        enroll(FakeApp(), [{"sequence_id": "s", "contact_ids": ["a"]}])
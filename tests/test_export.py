@@ -0,0 +1,71 @@
+import csv
+import json
+
+import pytest
+
+from universal_mcp_apollo.export import export_search, flatten
+
+
+class FakeApp:
+    def people_search(self, page=None, per_page=None, **filters):
+        people = [{"id": f"{page}-{i}", "organization": {"name": "Acme"}, "tags": ["a"]} for i in range(per_page)]
+        return {"people": people, "pagination": {"page": page, "total_pages": 3}}
+
+
+def test_flatten_nested_fields():
+    assert flatten({"a": {"b": {"c": 1}}, "l": [1, 2]}) == {"a.b.c": 1, "l": "[1,2]"}
+
+
+def test_export_ndjson_and_csv(tmp_path):
+    stats = export_search(FakeApp(), "people_search", tmp_path / "out.ndjson", per_page=2)
+    assert stats["records"] == 6 and stats["pages"] == 3
+    lines = (tmp_path / "out.ndjson").read_text().splitlines()
+    assert json.loads(lines[-1])["id"] == "3-1"
+
+    stats = export_search(FakeApp(), "people_search", tmp_path / "out.csv", format="csv", per_page=2, max_pages=2)
+    assert "warnings" not in stats
+    with open(tmp_path / "out.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 4
+    assert rows[0]["organization.name"] == "Acme"
+
+
+class DriftingApp:
+    """Pages whose fields appear late and change type after the first row group."""
+
+    def search_for_contacts(self, page=None, per_page=None, **filters):
+        if page == 1:
+            contacts = [{"id": "a", "score": 1, "owner": None, "mixed": 1}, {"id": "b", "score": 2, "owner": None, "mixed": "x"}]
+        else:
+            contacts = [{"id": "c", "score": "n/a", "owner": {"name": "Ada"}, "mixed": 3.5, "late": True}]
+        return {"contacts": contacts, "pagination": {"page": page, "total_pages": 2}}
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_export_columnar_survives_schema_drift(tmp_path, format):
+    pa = pytest.importorskip("pyarrow")
+    path = tmp_path / f"out.{format}"
+    stats = export_search(DriftingApp(), "search_for_contacts", path, format=format, per_page=2, row_group_size=2)
+    assert stats["records"] == 3
+    assert stats["warnings"] == [
+        "dropped fields first seen after the columns were fixed: ['late', 'owner.name']",
+        "wrote null for values not matching the column type of: ['score']",
+    ]
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+    else:
+        table = pa.ipc.open_file(str(path)).read_all()
+    assert table.column_names == ["id", "score", "owner", "mixed"]
+    rows = table.to_pylist()
+    assert [r["id"] for r in rows] == ["a", "b", "c"]
+    # No room for a late string in an int column; null typed and mixed columns hold text.
+    assert [r["score"] for r in rows] == [1, 2, None]
+    assert [r["mixed"] for r in rows] == ["1", "x", "3.5"]
+    assert rows[2]["owner"] is None
+
+
+def test_export_csv_reports_dropped_fields(tmp_path):
+    stats = export_search(DriftingApp(), "search_for_contacts", tmp_path / "out.csv", format="csv", per_page=2)
+    assert stats["warnings"] == ["dropped fields first seen after the columns were fixed: ['late', 'owner.name']"]
@@ -0,0 +1,65 @@
+import threading
+import time
+
+from universal_mcp_apollo.fanout import Stage, StagedPipeline, fan_out
+from universal_mcp_apollo.planner import EnrichmentPlanner
+
+DELAY = 0.1
+
+
+class FakeApp:
+    def __init__(self):
+        self.enrichment_planner = EnrichmentPlanner(self)
+        self.people_calls = []
+        self.lock = threading.Lock()
+
+    def organization_search(self, page=None, per_page=None, **filters):
+        time.sleep(DELAY)
+        orgs = [{"id": f"org-{page}-{i}"} for i in range(10)]
+        return {"organizations": orgs, "pagination": {"total_pages": 4}}
+
+    def people_search(self, organization_ids_=None, page=None, per_page=None, **filters):
+        time.sleep(DELAY)
+        with self.lock:
+            self.people_calls.append(list(organization_ids_))
+        people = [{"id": f"{org}-p{i}", "organization_id": org} for org in organization_ids_ for i in range(2)]
+        return {"people": people, "pagination": {"total_pages": 1}}
+
+    def bulk_people_enrichment(self, details=None, **kwargs):
+        time.sleep(DELAY)
+        return {"matches": [{"id": d["id"], "email": f"{d['id']}@example.com"} for d in details]}
+
+    def organization_jobs_postings(self, organization_id):
+        return {"organization_job_postings": [{"id": f"{organization_id}-job"}]}
+
+
+def test_fan_out_batches_orgs_and_overlaps_stages():
+    app = FakeApp()
+    started = time.monotonic()
+    result = fan_out(app, max_organization_pages=4, include_job_postings=True)
+    elapsed = time.monotonic() - started
+    assert result["people_count"] == 80
+    assert all(p["enriched"] and p["person"]["email"] for p in result["people"])
+    assert len(result["job_postings"]) == 40
+    assert all(len(ids) <= 10 for ids in app.people_calls)
+    assert sum(len(ids) for ids in app.people_calls) == 40
+    # Run serially this would take 4 org pages + 4 people searches + 8 enrichments.
+    assert elapsed < 16 * DELAY * 0.75
+    assert result["stages"]["enrichment"]["received"] == 80
+
+
+def test_fan_out_streams_to_file_and_stops_early(tmp_path):
+    result = fan_out(FakeApp(), path=tmp_path / "out.ndjson", max_organization_pages=4, max_people=5, enrich=False)
+    assert result["people_count"] == 5
+    assert len((tmp_path / "out.ndjson").read_text().splitlines()) == 5
+
+
+def test_failed_batches_are_counted_and_skipped():
+    def double(batch):
+        if 3 in batch:
+            raise RuntimeError("boom")
+        return [x * 2 for x in batch]
+
+    pipeline = StagedPipeline([Stage("double", double, workers=2, batch_size=1)])
+    assert sorted(pipeline.run(range(5))) == [0, 2, 4, 8]
+    assert pipeline.metrics()["double"]["errors"] == 1
@@ -0,0 +1,47 @@
+import hashlib
+import json
+
+from universal_mcp_apollo import hashing
+from universal_mcp_apollo.hashing import HashedEmailTable, enrich_hashed_file, hash_emails
+from universal_mcp_apollo.planner import EnrichmentPlanner
+
+
+def test_hash_emails_in_process_pool_keeps_order():
+    emails = [f" User{i}@Acme.com" for i in range(50)] + ["bad"]
+    digests = hash_emails(iter(emails), processes=2, chunk_size=10, pool_threshold=20)
+    assert digests[3] == hashlib.sha256(b"user3@acme.com").hexdigest()
+    assert digests[-1] is None
+    assert hash_emails(emails, processes=2, chunk_size=10) == digests
+
+
+def test_small_inputs_are_hashed_in_process(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(hashing, "ProcessPoolExecutor", no_pool)
+    emails = (f"user{i}@acme.com" for i in range(100))
+    assert len(hash_emails(emails, processes=4, chunk_size=10, pool_threshold=100)) == 100
+    assert len(hash_emails([f"user{i}@acme.com" for i in range(100)], processes=1, chunk_size=10, pool_threshold=0)) == 100
+
+
+def test_table_round_trip(tmp_path):
+    table = HashedEmailTable.build(["a@x.io", "A@x.io", "b@x.io"], algorithm="md5", processes=1)
+    digest = hashlib.md5(b"a@x.io").hexdigest()
+    assert table.rows_for(digest) == [0, 1]
+    table.save(tmp_path / "lookup.csv")
+    loaded = HashedEmailTable.load(tmp_path / "lookup.csv")
+    assert loaded.algorithm == "md5" and loaded.rows_for(digest) == [0, 1]
+
+
+class FakeApp:
+    def bulk_people_enrichment(self, details=None, **kwargs):
+        return {"matches": [{"id": d["hashed_email"][:6], "email": "hidden"} for d in details]}
+
+
+def test_enrich_hashed_file_maps_matches_to_rows(tmp_path):
+    source = tmp_path / "leads.csv"
+    source.write_text("email\na@x.io\nA@X.io\nnot-an-email\n")
+    report = enrich_hashed_file(EnrichmentPlanner(FakeApp()), source, tmp_path / "out.ndjson", processes=1)
+    lines = [json.loads(line) for line in (tmp_path / "out.ndjson").read_text().splitlines()]
+    assert [line["matched"] for line in lines] == [True, True, False]
+    assert report["sent_to_api"] == 1
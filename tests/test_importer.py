@@ -0,0 +1,57 @@
+import threading
+
+from universal_mcp_apollo.importer import ImportPipeline, read_records
+from universal_mcp_apollo.normalize import canonical_domain, canonical_email, canonical_phone
+
+
+def test_canonicalization():
+    assert canonical_email("  Jo@Acme.COM ") == "jo@acme.com"
+    assert canonical_domain("https://www.Acme.com/about?x=1") == "acme.com"
+    assert canonical_domain("jo@acme.com") == "acme.com"
+    assert canonical_phone("+1 (555) 303-1234 ext. 12") == "+15553031234"
+    assert canonical_phone("0044 7911 123456") == "+447911123456"
+
+
+class FakeApp:
+    def __init__(self):
+        self.created = []
+        self.lock = threading.Lock()
+
+    def create_a_contact(self, **kwargs):
+        with self.lock:
+            self.created.append(kwargs)
+        return {"contact": kwargs}
+
+
+def test_import_normalizes_validates_and_dedups(tmp_path):
+    path = tmp_path / "leads.csv"
+    path.write_text(
+        "email,first_name,last_name,label_names,direct_phone,ignored\n"
+        "Jo@Acme.com,Jo,Lee,Conf 2025; VIP,555-303-1234,x\n"
+        "jo@acme.com ,Jo,Lee,,,\n"
+        "not-an-email,Al,Bo,,,\n"
+        ",Sam,Po,,,\n"
+    )
+    app = FakeApp()
+    result = ImportPipeline(app, batch_size=2, workers=2).run(read_records(path))
+    assert result["read"] == 4
+    assert result["created"] == 2
+    assert result["duplicates"] == 1
+    assert result["invalid"] == 1 and result["errors"][0]["row"] == 3
+    jo = next(c for c in app.created if c.get("email"))
+    assert jo == {"email": "jo@acme.com", "first_name": "Jo", "last_name": "Lee", "label_names_": ["Conf 2025", "VIP"], "direct_phone": "5553031234"}
+
+
+def test_malformed_ndjson_lines_are_counted_not_fatal(tmp_path):
+    path = tmp_path / "leads.ndjson"
+    path.write_text(
+        '{"email": "jo@acme.com"}\n'
+        '{"email": "al@acme.com"\n'
+        '\n'
+        '["not", "an", "object"]\n'
+        '{"email": "sam@acme.com"}\n'
+    )
+    app = FakeApp()
+    result = ImportPipeline(app, batch_size=2, workers=2).run_file(path)
+    assert result["read"] == 4 and result["created"] == 2 and result["invalid"] == 2
+    assert [e["error"].split(":")[0] for e in result["errors"]] == ["line 2", "line 4"]
@@ -0,0 +1,80 @@
+import httpx
+import pytest
+
+from universal_mcp_apollo.jobs import DONE, FAILED, UNKNOWN, JobJournal, JobRunner
+
+
+class FakeApp:
+    def __init__(self, errors=None):
+        self.batches = []
+        self.errors = errors or {}
+
+    def bulk_people_enrichment(self, details=None, **kwargs):
+        self.batches.append(details)
+        error = self.errors.get(details[0]["id"]) if details and "id" in details[0] else None
+        if error is not None:
+            raise error
+        return {"matches": details}
+
+    def update_contact_stage(self, contact_ids_=None, **kwargs):
+        return self.bulk_people_enrichment([{"id": c} for c in contact_ids_])
+
+
+def test_job_runs_in_chunks_and_reports_progress(tmp_path):
+    app = FakeApp()
+    runner = JobRunner(app, JobJournal(tmp_path / "jobs.sqlite3"))
+    job_id = runner.submit("bulk_people_enrichment", [{"email": f"p{i}@x.io"} for i in range(25)], background=False)
+    assert sorted(map(len, app.batches)) == [5, 10, 10]
+    [progress] = runner.progress(job_id)
+    assert progress["status"] == "completed"
+    assert progress["items"][DONE] == 25
+
+
+def test_resume_never_resends_in_doubt_chunks(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    journal = JobJournal(path)
+    job_id = journal.create_job("bulk_people_enrichment", {}, [[{"id": "a"}], [{"id": "b"}]])
+    journal.set_job_status(job_id, "running")
+    journal.mark(job_id, 0, "dispatched")
+    journal.close()
+
+    app = FakeApp()
+    runner = JobRunner(app, JobJournal(path))
+    runner.resume()
+    runner._threads[job_id].join()
+    assert app.batches == [[{"id": "b"}]]
+    [progress] = runner.progress(job_id)
+    assert progress["chunks"][UNKNOWN] == 1
+    assert progress["status"] == "needs_attention"
+
+
+def _status_error(status):
+    request = httpx.Request("POST", "https://api.apollo.io/api/v1/people/bulk_match")
+    return httpx.HTTPStatusError(str(status), request=request, response=httpx.Response(status, request=request))
+
+
+def test_only_rejected_non_idempotent_chunks_are_retried(tmp_path):
+    request = httpx.Request("POST", "https://api.apollo.io/api/v1/people/bulk_match")
+    app = FakeApp({"a": _status_error(422), "b": httpx.ReadTimeout("timed out", request=request), "c": _status_error(502)})
+    runner = JobRunner(app, JobJournal(tmp_path / "jobs.sqlite3"))
+    job_id = runner.submit("bulk_people_enrichment", [{"id": "a"}] * 10 + [{"id": "b"}] * 10 + [{"id": "c"}] * 10, background=False)
+    [progress] = runner.progress(job_id)
+    assert progress["chunks"][FAILED] == 1 and progress["chunks"][UNKNOWN] == 2
+
+    app.errors = {}
+    runner.retry(job_id)
+    runner._threads[job_id].join()
+    assert [batch[0]["id"] for batch in app.batches[3:]] == ["a"]
+    [progress] = runner.progress(job_id)
+    assert progress["chunks"][UNKNOWN] == 2 and progress["chunks"][DONE] == 1
+
+    runner.retry(job_id, include_unknown=True)
+    runner._threads[job_id].join()
+    assert runner.progress(job_id)[0]["status"] == "completed"
+    with pytest.raises(ValueError):
+        runner.retry("no-such-job")
+
+    # Idempotent kinds can always be sent again.
+    app.errors = {"d": httpx.ReadTimeout("timed out", request=request)}
+    job_id = runner.submit("update_contact_stage", ["d"], background=False, contact_stage_id="s")
+    assert runner.progress(job_id)[0]["chunks"][FAILED] == 1
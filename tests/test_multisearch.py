@@ -0,0 +1,61 @@
+import json
+import zlib
+
+import pytest
+
+from universal_mcp_apollo.multisearch import expand_grid, id_key, multi_search
+
+
+class FakeApp:
+    """Each title matches people 0..9 of that title's team; 'any' overlaps every team."""
+
+    def people_search(self, person_titles_=None, person_locations_=None, q_keywords=None, page=None, per_page=None):
+        title = (person_titles_ or ["any"])[0]
+        ids = range(5) if title == "any" else range(10)
+        people = [{"id": f"{(0 if title == 'any' else zlib.crc32(title.encode()) % 1000):04d}{i:020x}", "title": title} for i in ids]
+        start = (page - 1) * per_page
+        return {"people": people[start:start + per_page], "pagination": {"total_pages": -(-len(people) // per_page)}}
+
+
+def test_expand_grid_is_lazy_and_wraps_scalars():
+    grid = expand_grid({"person_titles_": ["cto", "cfo"], "person_locations_": ["Berlin", "Paris", "Rome"]}, {"q_keywords": "x"})
+    first = next(grid)
+    assert first == {"q_keywords": "x", "person_titles_": ["cto"], "person_locations_": ["Berlin"]}
+    assert len(list(grid)) == 5
+
+
+def test_id_key_is_exact_for_apollo_ids():
+    assert id_key("5f0c1e2d3b4a596877665544") == 0x5F0C1E2D3B4A596877665544
+    assert id_key("not-hex") == id_key("not-hex") < 0
+
+
+def test_union_dedups_across_queries_and_attributes_first_match():
+    result = multi_search(
+        FakeApp(),
+        queries=[{"person_titles_": ["cto"]}, {"person_titles_": ["cto"]}],
+        grid={"person_titles_": ["cfo", "any"]},
+        per_page=4,
+        max_pages=None,
+        workers=2,
+    )
+    ids = [r["id"] for r in result["records"]]
+    assert len(ids) == len(set(ids)) == 25
+    assert result["duplicates"] == 10
+    assert result["queries"] == 4
+    cto = [r for r in result["records"] if r["title"] == "cto"]
+    assert {r["matched_query"] for r in cto} <= {0, 1}
+    assert sum(q["new"] for q in result["per_query"][:2]) == 10
+    assert result["per_query"][2]["filters"] == {"person_titles_": ["cfo"]}
+
+
+def test_streams_to_file_and_stops_at_max_results(tmp_path):
+    grid = {"person_titles_": [f"title-{i}" for i in range(50)], "person_locations_": [f"city-{i}" for i in range(50)]}
+    result = multi_search(FakeApp(), grid=grid, per_page=10, max_results=15, path=tmp_path / "out.ndjson")
+    lines = (tmp_path / "out.ndjson").read_text().splitlines()
+    assert len(lines) == 15 and "matched_query" in json.loads(lines[0])
+    assert result["queries"] < 2500
+
+
+def test_unknown_filter_rejected():
+    with pytest.raises(ValueError):
+        multi_search(FakeApp(), queries=[{"bogus": 1}])
@@ -0,0 +1,95 @@
+from universal_mcp_apollo.normalize import canonical_company_name, canonical_linkedin, dedup
+from universal_mcp_apollo.planner import EnrichmentPlanner, enrich_organizations
+from universal_mcp_apollo.scheduler import BULK, current_priority
+
+
+def test_company_and_linkedin_canonicalization():
+    assert canonical_company_name("The ACME, Inc.") == "acme"
+    assert canonical_linkedin("https://www.linkedin.com/in/Tim-Z/?trk=x") == "linkedin.com/in/tim-z"
+
+
+def test_dedup_folds_variants_back_onto_rows():
+    rows = [{"domain": "www.Acme.com/"}, {"domain": "acme.com"}, {"name": "ACME Inc"}, {"name": "Acme, Inc."}]
+    result = dedup(rows, kind="organizations")
+    assert len(result) == 2
+    assert result.fold_back(["domain", "name"]) == ["domain", "domain", "name", "name"]
+
+    people = dedup([{"email": "Jo@Acme.com"}, {"email": "jo@acme.com", "linkedin_url": "linkedin.com/in/jo"}, {"linkedin_url": "https://linkedin.com/in/jo/"}])
+    assert len(people) == 1
+    assert people.unique_rows[0]["linkedin_url"] == "linkedin.com/in/jo"
+
+
+def test_conflicting_identifiers_block_weak_key_merges():
+    people = dedup([
+        {"email": "john.smith@ibm.com", "name": "John Smith", "domain": "ibm.com"},
+        {"email": "js2@ibm.com", "name": "John Smith", "domain": "ibm.com"},
+        {"name": "John Smith", "domain": "ibm.com"},
+        {"name": "John Smith", "domain": "ibm.com", "linkedin_url": "linkedin.com/in/js"},
+    ])
+    assert people.group_of == [0, 1, 2, 2]
+
+    # A shared name cannot join rows whose domains differ, directly or through a third row.
+    organizations = dedup([
+        {"domain": "foo.github.io", "name": "GitHub"},
+        {"domain": "bar.github.io"},
+        {"domain": "github.com", "name": "GitHub"},
+        {"domain": "acme.com"},
+        {"domain": "acme.de"},
+        {"name": "GitHub, Inc."},
+    ], kind="organizations", fuzzy=True)
+    assert organizations.group_of == [0, 1, 2, 3, 4, 0]
+
+
+def test_fuzzy_names_fold_near_duplicates_only():
+    # Legal suffixes are stripped first, so the typo has to be in the name proper.
+    rows = [{"name": "Acme Manufacturing Corporation"}, {"name": "Acme Manufacturng Corp."}, {"name": "Acme Marketing"}]
+    assert dedup(rows, kind="organizations", fuzzy=True).group_of == [0, 0, 1]
+    assert dedup(rows, kind="organizations").group_of == [0, 1, 2]
+
+
+class FakeApp:
+    def __init__(self, rename=None, drop=()):
+        self.calls = []
+        self.priorities = []
+        self.rename = rename or {}
+        self.drop = drop
+
+    def bulk_organization_enrichment(self, domains_):
+        self.calls.append(domains_)
+        self.priorities.append(current_priority())
+        return {"organizations": [{"name": d, "primary_domain": self.rename.get(d, d)} for d in domains_ if d not in self.drop]}
+
+    def bulk_people_enrichment(self, details, **kwargs):
+        self.calls.append(details)
+        return {"matches": [{"id": f"p-{d['email']}", "email": d["email"]} for d in details], "credits_consumed": len(details)}
+
+
+def test_enrich_organizations_pays_once_per_company():
+    app = FakeApp()
+    result = enrich_organizations(app, ["www.Acme.com/", "acme.com", "ACME Inc", "foo.github.io", "github.com", "acme.de"])
+    assert app.calls == [["acme.com", "foo.github.io", "github.com", "acme.de"]]
+    assert [o and o["name"] for o in result["organizations"]] == ["acme.com", "acme.com", None, "foo.github.io", "github.com", "acme.de"]
+    assert result["report"]["credits_saved"] == 1
+    assert app.priorities == [BULK]
+
+
+def test_organizations_pair_by_position_when_apollo_renames_the_domain():
+    app = FakeApp(rename={"acme.com": "acme-global.com"})
+    result = enrich_organizations(app, ["acme.com", "github.com"])
+    assert [o["primary_domain"] for o in result["organizations"]] == ["acme-global.com", "github.com"]
+
+    # A response of the wrong length is paired by domain instead.
+    app = FakeApp(drop={"acme.com"})
+    result = enrich_organizations(app, ["acme.com", "github.com"])
+    assert result["organizations"][0] is None and result["organizations"][1]["primary_domain"] == "github.com"
+
+
+def test_namesakes_at_one_company_are_enriched_separately():
+    app = FakeApp()
+    details = [
+        {"email": "john.smith@ibm.com", "name": "John Smith", "domain": "ibm.com"},
+        {"email": "js2@ibm.com", "name": "John Smith", "domain": "ibm.com"},
+    ]
+    result = EnrichmentPlanner(app).enrich(details)
+    assert [m["email"] for m in result["matches"]] == ["john.smith@ibm.com", "js2@ibm.com"]
+    assert result["report"]["sent_to_api"] == 2
@@ -0,0 +1,51 @@
+import hashlib
+
+from universal_mcp_apollo.planner import EnrichmentPlanner
+from universal_mcp_apollo.scheduler import BULK, current_priority
+
+
+class FakeApp:
+    def __init__(self):
+        self.sent = []
+
+    def bulk_people_enrichment(self, details=None, **kwargs):
+        self.sent.extend(details)
+        return {"matches": [{"id": f"p{len(self.sent)}", "email": d.get("email")} for d in details]}
+
+
+def test_known_and_duplicate_records_are_not_sent():
+    app = FakeApp()
+    planner = EnrichmentPlanner(app)
+    planner.index.add({"id": "c1", "email": "Known@Acme.com", "linkedin_url": "https://www.linkedin.com/in/known/"})
+    details = [
+        {"email": "known@acme.com"},
+        {"hashed_email": hashlib.md5(b"known@acme.com").hexdigest()},
+        {"linkedin_url": "linkedin.com/in/known"},
+        {"email": "new@acme.com"},
+        {"email": " NEW@acme.com"},
+    ]
+    result = planner.enrich(details)
+    assert app.sent == [{"email": "new@acme.com"}]
+    assert result["matches"][0]["id"] == "c1"
+    assert result["matches"][3] is result["matches"][4]
+    assert result["report"]["credits_saved"] == 4
+
+    planner.enrich([{"email": "new@acme.com"}])
+    assert len(app.sent) == 1
+
+
+class ShuffledApp:
+    def __init__(self):
+        self.priorities = []
+
+    def bulk_people_enrichment(self, details=None, **kwargs):
+        self.priorities.append(current_priority())
+        # Reordered and one short: "b" matched nothing and was left out.
+        return {"matches": [{"id": "pc", "email": "c@x.io"}, {"id": "pa", "email": "a@x.io"}]}
+
+
+def test_matches_are_paired_by_identifier_at_bulk_priority():
+    app = ShuffledApp()
+    result = EnrichmentPlanner(app).enrich([{"email": "a@x.io"}, {"email": "b@x.io"}, {"email": "c@x.io"}])
+    assert [m and m["id"] for m in result["matches"]] == ["pa", None, "pc"]
+    assert app.priorities == [BULK]
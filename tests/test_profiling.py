@@ -0,0 +1,84 @@
+import json
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_apollo.app import ApolloApp
+from universal_mcp_apollo.profiling import PHASES, Profiler
+from universal_mcp_apollo.transport import FAMILIES
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    time.sleep(0.05)
+    if request.url.path.endswith("/organizations/enrich"):
+        return httpx.Response(500, json={"error": "boom"})
+    return httpx.Response(200, json={"organizations": [{"id": f"{i:024x}", "name": f"Org {i}"} for i in range(500)]})
+
+
+def _app(profiler=None, data_dir=None) -> ApolloApp:
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"api_key": "key"}
+    app = ApolloApp(integration=integration, adaptive_concurrency=False, profiler=profiler, data_dir=data_dir)
+    transport = httpx.MockTransport(_handler)
+    app._clients = {family: httpx.Client(transport=transport) for family in FAMILIES}
+    return app
+
+
+def test_sampled_slow_call_is_captured_with_phases(tmp_path):
+    dump = tmp_path / "slow.ndjson"
+    app = _app(Profiler(sample_rate=1.0, slow_seconds=0.03, dump_path=dump))
+    app.invoke_tool("organization_search", q_organization_name="Example", per_page=100)
+    report = app.get_slow_tool_calls()
+    assert report["enabled"] and report["tools"]["organization_search"]["sampled"] == 1
+    call = report["calls"][0]
+    assert call["tool"] == "organization_search" and call["sampled"]
+    assert call["arguments"] == {"q_organization_name": "Example", "per_page": 100}
+    assert set(PHASES) <= set(call["phases"])
+    assert call["phases"]["http"] >= 0.05
+    assert call["phases"]["decode"] > 0 and call["phases"]["serialize"] > 0
+    assert sum(call["phases"].values()) == pytest.approx(call["seconds"], abs=1e-3)
+    (request,) = call["requests"]
+    assert request["method"] == "POST" and request["status"] == 200 and request["bytes"] > 10_000
+    assert request["decode"] is not None
+    assert json.loads(dump.read_text().splitlines()[0])["tool"] == "organization_search"
+
+
+def test_unsampled_calls_are_timed_and_errors_recorded(tmp_path):
+    app = _app(Profiler(sample_rate=0.0, slow_seconds=0.03, capacity=2), data_dir=str(tmp_path))
+    for _ in range(3):
+        app.invoke_tool("list_account_stages")
+    with pytest.raises(httpx.HTTPStatusError):
+        app.invoke_tool("organization_enrichment", domain="example.com")
+    calls = app.get_slow_tool_calls()["calls"]
+    assert [c["tool"] for c in calls] == ["organization_enrichment", "list_account_stages"]
+    assert calls[0]["error"].startswith("HTTPStatusError") and calls[0]["phases"] is None
+    # Unsampled calls still keep each request's status and size, without timings.
+    (request,) = calls[0]["requests"]
+    assert request["status"] == 500 and request["bytes"] > 0 and "http" not in request
+    stats = app.get_slow_tool_calls()["tools"]
+    assert stats["list_account_stages"]["calls"] == 3 and stats["list_account_stages"]["phase_seconds_avg"] is None
+    assert stats["organization_enrichment"]["errors"] == 1
+    assert app.get_slow_tool_calls(tool="list_account_stages", limit=1)["calls"][0]["tool"] == "list_account_stages"
+    dumped = app.get_slow_tool_calls(path="dump.ndjson")
+    assert dumped["dumped"] == 2 and len((tmp_path / "dump.ndjson").read_text().splitlines()) == 2
+    for outside in ("../dump.ndjson", "/etc/passwd"):
+        with pytest.raises(PermissionError):
+            app.get_slow_tool_calls(path=outside)
+
+
+def test_fast_calls_are_not_captured_and_profiling_is_opt_in():
+    app = _app(Profiler(sample_rate=1.0, slow_seconds=10.0))
+    app.invoke_tool("list_deal_stages")
+    assert app.get_slow_tool_calls()["calls"] == []
+    assert app.get_slow_tool_calls()["tools"]["list_deal_stages"]["calls"] == 1
+    assert _app().get_slow_tool_calls()["enabled"] is False
+
+
+def test_requests_sent_from_bulk_worker_threads_are_profiled():
+    app = _app(Profiler(sample_rate=1.0, slow_seconds=0.0))
+    template = {"user_id": "5f0c1e2d3b4a596877665544", "priority": "high", "due_at": "2025-03-01T09:00:00Z", "status": "scheduled"}
+    app.invoke_tool("create_tasks_in_bulk", tasks=[{"contact_id": "c1", "type": "call"}, {"contact_id": "c2", "type": "action_item"}], template=template)
+    (call,) = app.get_slow_tool_calls()["calls"]
+    assert len(call["requests"]) == 2 and call["phases"]["http"] >= 0.1
@@ -0,0 +1,83 @@
+import pytest
+
+from universal_mcp_apollo.reference import ReferenceRegistry
+from universal_mcp_apollo.scheduler import BACKGROUND, current_priority
+
+
+class FakeApp:
+    def __init__(self):
+        self.calls = 0
+        self.priorities = []
+
+        self.stages = [{"id": "6095a710bd01d100a506d4ae", "name": "Qualified"}]
+
+    def list_contact_stages(self):
+        self.calls += 1
+        self.priorities.append(current_priority())
+        return {"contact_stages": list(self.stages)}
+
+    def get_a_list_of_users(self, page=None, per_page=None):
+        self.calls += 1
+        return {
+            "users": [{"id": "5e66b6381e05b4008c8331b8", "first_name": "Tim", "last_name": "Zheng", "email": "tim@apollo.io"}],
+            "pagination": {"page": page, "total_pages": 1},
+        }
+
+
+def test_resolves_names_and_passes_ids_through():
+    app = FakeApp()
+    registry = ReferenceRegistry(app)
+    assert registry.resolve("contact_stage", "qualified") == "6095a710bd01d100a506d4ae"
+    assert registry.resolve("contact_stage", " QUALIFIED ") == "6095a710bd01d100a506d4ae"
+    assert registry.resolve("user", "tim@apollo.io") == "5e66b6381e05b4008c8331b8"
+    assert registry.resolve("user", "Tim Zheng") == "5e66b6381e05b4008c8331b8"
+    assert app.calls == 2
+    assert registry.resolve("contact_stage", "6095a710bd01d100a506d4ae") == "6095a710bd01d100a506d4ae"
+    assert app.calls == 2
+
+
+def test_unknown_name_raises():
+    registry = ReferenceRegistry(FakeApp())
+    with pytest.raises(ValueError):
+        registry.resolve("contact_stage", "Nope")
+
+
+def test_periodic_refresh_runs_at_background_priority():
+    app = FakeApp()
+    registry = ReferenceRegistry(app, refresh_interval=60)
+    registry.start()
+    registry.stop()
+    assert app.priorities == [BACKGROUND]
+
+
+def test_unknown_name_reloads_its_kind_once_per_interval():
+    app = FakeApp()
+    registry = ReferenceRegistry(app, miss_refresh_interval=0)
+    assert registry.resolve("contact_stage", "Qualified") == "6095a710bd01d100a506d4ae"
+    app.stages.append({"id": "6095a710bd01d100a506d4af", "name": "Won"})
+    assert registry.resolve("contact_stage", "won") == "6095a710bd01d100a506d4af"
+    assert app.calls == 2
+
+    registry.miss_refresh_interval = 3600
+    with pytest.raises(ValueError):
+        registry.resolve("contact_stage", "Lost")
+    assert app.calls == 2
+
+
+class BrokenApp(FakeApp):
+    def list_contact_stages(self):
+        self.calls += 1
+        raise RuntimeError("Apollo is down")
+
+
+def test_values_pass_through_when_loading_fails():
+    app = BrokenApp()
+    registry = ReferenceRegistry(app, miss_refresh_interval=0)
+    assert registry.resolve("contact_stage", "Qualified") == "Qualified"
+    assert registry.resolve("contact_stage", "6095a710bd01d100a506d4ae") == "6095a710bd01d100a506d4ae"
+
+    # A failed reload after a miss also leaves the value for Apollo to judge.
+    registry = ReferenceRegistry(FakeApp(), miss_refresh_interval=0)
+    registry.resolve("contact_stage", "Qualified")
+    registry.app = app
+    assert registry.resolve("contact_stage", "Won") == "Won"
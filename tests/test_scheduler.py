@@ -0,0 +1,42 @@
+import threading
+import time
+
+from universal_mcp_apollo.scheduler import BULK, INTERACTIVE, PriorityScheduler
+
+
+def _queue(scheduler, levels):
+    order = []
+
+    def worker(level):
+        with scheduler.slot(level):
+            order.append(level)
+
+    threads = []
+    for level in levels:
+        thread = threading.Thread(target=worker, args=(level,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.02)
+    return order, threads
+
+
+def test_interactive_jumps_ahead_of_bulk():
+    scheduler = PriorityScheduler(max_inflight=1, min_share={})
+    scheduler.acquire(BULK)
+    order, threads = _queue(scheduler, [BULK, BULK, INTERACTIVE])
+    assert scheduler.metrics()["classes"][BULK]["queue_depth"] == 2
+    scheduler.release()
+    for thread in threads:
+        thread.join()
+    assert order == [INTERACTIVE, BULK, BULK]
+
+
+def test_bulk_gets_minimum_share():
+    scheduler = PriorityScheduler(max_inflight=1, min_share={BULK: 0.5}, window=2)
+    scheduler.acquire(INTERACTIVE)
+    order, threads = _queue(scheduler, [INTERACTIVE, BULK])
+    scheduler.release()
+    for thread in threads:
+        thread.join()
+    assert order == [BULK, INTERACTIVE]
+    assert scheduler.metrics()["classes"][BULK]["admitted"] == 1
@@ -0,0 +1,113 @@
+import csv
+import threading
+
+import pytest
+
+from universal_mcp_apollo.planner import EnrichmentPlanner
+from universal_mcp_apollo.tasks import TaskBatchEngine, create_tasks, render
+
+USER = "5f0c1e2d3b4a596877665544"
+TEMPLATE = {"user_id": USER, "priority": "medium", "due_at": "2025-03-01T09:00:00Z", "type": "call", "status": "scheduled"}
+
+
+class FakeReference:
+    def resolve(self, kind, value):
+        if value == "Ada":
+            return USER
+        if value == "nobody":
+            raise ValueError("Unknown user 'nobody'.")
+        return value
+
+
+class FakeApp:
+    def __init__(self, list_tasks=True):
+        self.enrichment_planner = EnrichmentPlanner(self)
+        self.reference = FakeReference()
+        self.list_tasks = list_tasks
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def create_task(self, user_id, contact_ids_, priority, due_at, type, status, note=None):
+        with self._lock:
+            self.calls.append({"user_id": user_id, "contact_ids": list(contact_ids_), "type": type, "priority": priority, "note": note})
+        if type == "action_item":
+            raise RuntimeError("503")
+        if not self.list_tasks:
+            return True
+        # Apollo leaves out contacts it cannot create a task for.
+        return {"tasks": [{"id": f"task-{c}-{type}", "contact_id": c} for c in contact_ids_ if not c.endswith("-x")]}
+
+
+def test_render_fills_placeholders_from_the_contact():
+    assert render("Call {first_name} about {title}", {"first_name": "Ada", "title": "CTO"}) == "Call Ada about CTO"
+    assert render("Call {first_name}", None) == "Call "
+    assert render("Mind the { brace", {}) == "Mind the { brace"
+    assert render(None, {}) is None
+
+
+def test_specs_are_grouped_into_the_fewest_calls():
+    app = FakeApp()
+    specs = [
+        {"contact_ids": [f"c{i}" for i in range(150)]},
+        {"contact_id": "c0", "user_id": "Ada"},
+        {"contact_ids": ["c1", "c2-x"], "type": "outreach_manual_email", "priority": "high"},
+        {"contact_id": "c3", "type": "outreach_manual_email", "priority": "high"},
+    ]
+    result = TaskBatchEngine(app, workers=4).run(specs, TEMPLATE)
+    assert result["groups"] == 2 and result["api_calls"] == 3 and result["personalized_calls"] == 0
+    assert sorted(len(call["contact_ids"]) for call in app.calls) == [3, 50, 100]
+    # The same contact in two specs with identical attributes is one task.
+    assert result["duplicate"] == 1
+    assert result["created"] == 150 + 2 and result["failed"] == 1
+    assert result["by_contact"]["c1"] == ["task-c1-call", "task-c1-outreach_manual_email"]
+    failed = [row for row in result["outcomes"] if row["outcome"] == "failed"]
+    assert failed == [{"spec": 2, "contact_id": "c2-x", "outcome": "failed", "task_id": None, "error": "not in the response"}]
+
+
+def test_notes_are_rendered_per_contact_and_split_groups():
+    app = FakeApp()
+    index = app.enrichment_planner.index
+    index.add({"id": "a", "first_name": "Ada"})
+    index.add({"id": "b", "first_name": "Grace"})
+    index.add({"id": "c", "first_name": "Ada"})
+    result = TaskBatchEngine(app).run([{"contact_ids": ["a", "b", "c"], "note": "Follow up with {first_name}"}], TEMPLATE)
+    assert result["api_calls"] == 2 and result["personalized_calls"] == 2
+    notes = sorted((call["note"], call["contact_ids"]) for call in app.calls)
+    assert notes == [("Follow up with Ada", ["a", "c"]), ("Follow up with Grace", ["b"])]
+
+
+def test_invalid_specs_are_rejected_locally():
+    app = FakeApp()
+    result = TaskBatchEngine(app).run([
+        {"contact_id": "c1", "priority": "urgent"},
+        {"contact_id": "c2", "due_at": "tomorrow"},
+        {"contact_id": "c3", "user_id": "nobody"},
+        {"contact_id": "c4", "colour": "red"},
+        {"note": "no contacts"},
+        {"contact_id": "c5", "type": "action_item"},
+        {"contact_ids": "c6"},
+    ], TEMPLATE)
+    assert result["invalid"] == 6 and result["failed"] == 1 and result["api_calls"] == 1
+    errors = [row["error"] for row in result["outcomes"]]
+    assert "'priority' must be one of" in errors[0]
+    assert "ISO 8601" in errors[1]
+    assert errors[2] == "Unknown user 'nobody'."
+    assert errors[3] == "unknown task fields ['colour']"
+    assert errors[4] == "no contact_id or contact_ids"
+    assert errors[5] == "503"
+    assert errors[6] == "contact_ids must be a list of IDs (got 'c6')"
+
+
+def test_responses_without_task_list_and_csv_output(tmp_path):
+    app = FakeApp(list_tasks=False)
+    path = tmp_path / "tasks.csv"
+    result = create_tasks(app, [{"contact_ids": ["a", "b"]}], TEMPLATE, path=path)
+    assert result["created"] == 0 and result["unconfirmed"] == 2 and result["by_contact"] == {}
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["outcome"] for row in rows] == ["unconfirmed", "unconfirmed"]
+
+
+def test_workers_must_be_positive():
+    with pytest.raises(ValueError):
+        create_tasks(FakeApp(), [{"contact_ids": ["a"]}], TEMPLATE, workers=0)
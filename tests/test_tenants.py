@@ -0,0 +1,149 @@
+import threading
+import time
+
+import pytest
+
+from universal_mcp_apollo.app import ApolloApp
+from universal_mcp_apollo.jobs import JobJournal
+from universal_mcp_apollo.tenants import HIDDEN_TOOLS, FairGate, MultiTenantApolloApp, TenantPool
+
+
+class FakeApp:
+    def __init__(self, integration):
+        self.integration = integration
+        self.request_gate = None
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_pool_isolates_and_evicts_lru_tenants():
+    pool = TenantPool(max_tenants=2, app_factory=FakeApp)
+    apps = []
+    for key in ("key-a", "key-b", "key-a", "key-c"):
+        with pool.session(key) as app:
+            apps.append(app)
+    assert apps[0] is apps[2]
+    assert apps[0] is not apps[1]
+    assert apps[0].integration.get_credentials() == {"api_key": "key-a"}
+    assert len(pool) == 2
+    assert apps[1].closed
+
+
+def test_fair_gate_prefers_least_busy_tenant():
+    gate = FairGate(max_concurrent=2)
+    order = []
+    gate.acquire("noisy")
+    gate.acquire("noisy")
+
+    def worker(tenant):
+        with gate.slot(tenant):
+            order.append(tenant)
+
+    threads = [threading.Thread(target=worker, args=("noisy",))]
+    threads[0].start()
+    time.sleep(0.05)
+    threads.append(threading.Thread(target=worker, args=("quiet",)))
+    threads[1].start()
+    time.sleep(0.05)
+    gate.release("noisy")
+    for thread in threads:
+        thread.join()
+    gate.release("noisy")
+    assert order == ["quiet", "noisy"]
+
+
+def test_calls_without_a_tenant_key_are_rejected(monkeypatch):
+    monkeypatch.setenv("APOLLO_API_KEY", "operator-key")
+    pool = TenantPool(app_factory=FakeApp)
+    with pytest.raises(PermissionError):
+        with pool.session():
+            pass
+    assert len(pool) == 0
+
+
+def test_gate_is_held_per_request_not_per_session():
+    pool = TenantPool(max_concurrent=1, app_factory=FakeApp)
+    admitted = threading.Event()
+
+    def quiet_request(app):
+        with app.request_gate():
+            admitted.set()
+
+    with pool.session("noisy") as noisy, pool.session("quiet") as quiet:
+        # Checked out but between requests (say, waiting on its own rate limit): no slot held.
+        quiet_request(quiet)
+        admitted.clear()
+        with noisy.request_gate():
+            thread = threading.Thread(target=quiet_request, args=(quiet,))
+            thread.start()
+            assert not admitted.wait(0.05)
+        thread.join()
+        assert admitted.is_set()
+
+
+def test_idle_tenants_are_evicted_on_a_timer():
+    pool = TenantPool(idle_timeout=0.05, app_factory=FakeApp)
+    with pool.session("key-a") as app:
+        pass
+    pool.start()
+    try:
+        deadline = time.monotonic() + 3
+        while len(pool) and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        pool.stop()
+    assert len(pool) == 0 and app.closed
+
+
+def test_tenants_get_no_file_or_admin_access(tmp_path):
+    app = MultiTenantApolloApp(pool=TenantPool(app_factory=lambda integration: ApolloApp(integration=integration, data_dir=str(tmp_path))))
+    names = {tool.__name__ for tool in app.list_tools()}
+    assert names and not names & HIDDEN_TOOLS
+    with app.pool.session("key-a") as tenant:
+        with pytest.raises(PermissionError):
+            tenant.multi_people_search(queries=[{"q_keywords": "cto"}], path="people.ndjson")
+    app.close()
+
+
+def test_tenants_with_running_jobs_are_not_evicted(tmp_path):
+    release = threading.Event()
+
+    def factory(integration):
+        app = ApolloApp(integration=integration, job_journal_path=str(tmp_path / "jobs.sqlite3"))
+        app.update_contact_stage = lambda **kwargs: release.wait(5)
+        return app
+
+    pool = TenantPool(idle_timeout=0, app_factory=factory)
+    with pool.session("key-a") as app:
+        job_id = app.start_bulk_job("update_contact_stage", ["c1"], {"contact_stage_id": "s1"})["id"]
+    pool.evict_idle()
+    assert len(pool) == 1
+    release.set()
+    deadline = time.monotonic() + 5
+    while app.jobs.active() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert app.jobs.progress(job_id)[0]["status"] == "completed"
+    pool.evict_idle()
+    assert len(pool) == 0
+
+
+def test_unfinished_jobs_resume_when_a_tenant_returns(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    journal = JobJournal(path)
+    job_id = journal.create_job("update_contact_stage", {"contact_stage_id": "s1"}, [["c1"]])
+    journal.set_job_status(job_id, "running")
+    journal.close()
+    sent = []
+
+    def factory(integration):
+        app = ApolloApp(integration=integration, job_journal_path=str(path))
+        app.update_contact_stage = lambda **kwargs: sent.append(kwargs["contact_ids_"])
+        return app
+
+    pool = TenantPool(app_factory=factory)
+    with pool.session("key-a") as app:
+        app.jobs._threads[job_id].join(5)
+    assert sent == [["c1"]] and app.jobs.progress(job_id)[0]["status"] == "completed"
+    pool.close()
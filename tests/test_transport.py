@@ -0,0 +1,27 @@
+import json
+
+from universal_mcp_apollo.transport import BULK, DEFAULT, LOOKUP, SEARCH, endpoint_family, load_profiles
+
+
+def test_endpoint_families():
+    base = "https://api.apollo.io/api/v1"
+    assert endpoint_family(f"{base}/people/bulk_match") == BULK
+    assert endpoint_family(f"{base}/emailer_campaigns/abc/add_contact_ids") == BULK
+    assert endpoint_family(f"{base}/mixed_people/search") == SEARCH
+    assert endpoint_family(f"{base}/organizations/abc/job_postings") == SEARCH
+    assert endpoint_family(f"{base}/account_stages") == LOOKUP
+    assert endpoint_family(f"{base}/opportunities/abc") == DEFAULT
+
+
+def test_profiles_load_from_config_then_env(tmp_path):
+    config = tmp_path / "transport.json"
+    config.write_text(json.dumps({"bulk": {"read_timeout": 300, "http2": True}}))
+    profiles = load_profiles(
+        env={"APOLLO_TRANSPORT_CONFIG": str(config), "APOLLO_TRANSPORT_BULK_MAX_CONNECTIONS": "64", "APOLLO_TRANSPORT_LOOKUP_HTTP2": "yes"}
+    )
+    assert profiles[BULK].read_timeout == 300.0
+    assert profiles[BULK].http2 is True
+    assert profiles[BULK].max_connections == 64
+    assert profiles[LOOKUP].http2 is True
+    assert profiles[DEFAULT].read_timeout == 30.0
+    assert profiles[BULK].timeout().read == 300.0
@@ -0,0 +1,92 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from universal_mcp_apollo.app import VALIDATORS, ApolloApp
+from universal_mcp_apollo.validation import Rule, compile_validators
+
+TASK = {
+    "user_id": "u1",
+    "contact_ids_": ["c1", "c2"],
+    "priority": "high",
+    "due_at": "2025-02-15T08:10:30Z",
+    "type": "call",
+    "status": "scheduled",
+}
+
+
+def _errors(tool, **kwargs):
+    return VALIDATORS[tool].errors((), kwargs)
+
+
+def test_every_tool_has_a_validator():
+    app = ApolloApp(integration=MagicMock())
+    assert set(VALIDATORS) == {tool.__name__ for tool in app.tools()}
+
+
+def test_valid_arguments_pass():
+    assert _errors("create_task", **TASK) == []
+    assert _errors("people_search", person_titles_=["cto"], page=2, per_page=100) == []
+    assert _errors("search_for_sequences", page="2", per_page="25") == []
+    assert VALIDATORS["view_deal"].errors(("d1",), {}) == []
+
+
+def test_required_and_types():
+    assert _errors("organization_enrichment") == ["missing required parameter 'domain'"]
+    assert _errors("people_search", per_page="ten") == ["'per_page' must be integer (got string)"]
+    assert _errors("people_search", include_similar_titles=1) == ["'include_similar_titles' must be boolean (got integer)"]
+    assert _errors("people_search", page=True) == ["'page' must be integer (got boolean)"]
+    assert _errors("update_contact_stage", contact_ids_="c1", contact_stage_id="s") == ["'contact_ids_' must be array (got string)"]
+    assert _errors("update_contact_stage", contact_ids_=["c1", 2], contact_stage_id="s") == ["'contact_ids_' items must be string (got integer)"]
+    assert _errors("view_deal", opportunity_id="d1", extra=1) == ["unexpected parameter 'extra'"]
+    assert _errors("analyze_deals", min_amount=10) == []
+
+
+def test_documented_constraints():
+    assert _errors("create_task", **{**TASK, "priority": "urgent"}) == ["'priority' must be one of high, medium, low (got 'urgent')"]
+    assert "ISO 8601" in _errors("create_task", **{**TASK, "due_at": "next friday"})[0]
+    assert _errors("people_search", per_page=500) == ["'per_page' must be an integer between 1 and 100 (got 500)"]
+    assert _errors("search_for_sequences", page="0") == ["'page' must be an integer at least 1 (got '0')"]
+    assert _errors("bulk_people_enrichment", details=[{}] * 11) == ["'details' accepts at most 10 items (got 11)"]
+    assert _errors("people_enrichment", email="a@b.co", reveal_phone_number=True) == [
+        "'webhook_url' is required when 'reveal_phone_number' is true"
+    ]
+    assert _errors(
+        "add_contacts_to_sequence", sequence_id="s1", emailer_campaign_id="s2", contact_ids_=["c1"], send_email_from_email_account_id="m"
+    ) == ["'emailer_campaign_id' must match 'sequence_id' (got 's2' and 's1')"]
+    assert _errors("update_contact_status_sequence", emailer_campaign_ids_=["s"], contact_ids_=["c"], mode="pause") == [
+        "'mode' must be one of mark_as_finished, remove, stop (got 'pause')"
+    ]
+    assert _errors("update_deal", opportunity_id="d1", amount="1,000", closed_date="30/10/2025") == [
+        "'amount' must be a number without commas or currency symbols (got '1,000')",
+        "'closed_date' must be a date in YYYY-MM-DD format (got '30/10/2025')",
+    ]
+    assert _errors("analyze_deals", group_by=["owner_id", "region"])[0].startswith("'group_by' may only contain")
+    assert _errors("start_bulk_job", kind="delete_everything", items=[1])[0].startswith("'kind' must be one of")
+
+
+def test_invoke_tool_rejects_before_any_request():
+    app = ApolloApp(integration=MagicMock())
+    app._post = MagicMock()
+    with pytest.raises(ValueError, match=r"Invalid arguments for create_task: 'status' must be one of"):
+        app.invoke_tool("create_task", **{**TASK, "status": "done"})
+    with pytest.raises(ValueError, match="missing required parameter 'domain'"):
+        app.list_tools()[2]()
+    app._post.assert_not_called()
+
+
+def test_constraints_must_name_real_parameters():
+    with pytest.raises(TypeError, match="unknown parameters"):
+        compile_validators(ApolloApp, {"view_deal": (Rule(("deal_id",), bool, ""),)})
+    with pytest.raises(TypeError, match="unknown tools"):
+        compile_validators(ApolloApp, {"drop_database": ()})
+
+
+def test_validation_takes_microseconds():
+    validator = VALIDATORS["create_task"]
+    kwargs = {**TASK, "contact_ids_": [f"c{i}" for i in range(100)]}
+    started = time.perf_counter()
+    for _ in range(1000):
+        validator((), kwargs)
+    assert (time.perf_counter() - started) / 1000 < 0.001
@@ -0,0 +1,119 @@
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_apollo.app import ApolloApp
+from universal_mcp_apollo.cassette import RECORD, Cassette
+from universal_mcp_apollo.planner import PersistentPersonIndex
+from universal_mcp_apollo.ratelimit import FileTokenBucket
+from universal_mcp_apollo.transport import FAMILIES
+from universal_mcp_apollo.workers import LOCAL_TOOLS, PooledApolloApp, WorkerPool
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/organizations/enrich"):
+        return httpx.Response(500, json={"error": "boom"})
+    per_page = int(request.url.params.get("per_page", 1))
+    people = [{"id": f"{i:024x}", "name": "x" * 50} for i in range(per_page)]
+    return httpx.Response(200, json={"pid": os.getpid(), "people": people})
+
+
+def _offline_app(**options) -> ApolloApp:
+    integration = MagicMock()
+    integration.get_credentials.return_value = {"api_key": "key"}
+    app = ApolloApp(integration=integration, adaptive_concurrency=False, **options)
+    transport = httpx.MockTransport(_handler)
+    app._clients = {family: httpx.Client(transport=transport) for family in FAMILIES}
+    return app
+
+
+def _drain(path: str, attempts: int) -> int:
+    bucket = FileTokenBucket(path, rate_per_minute=0.6, capacity=10)
+    return sum(bucket.try_acquire() for _ in range(attempts))
+
+
+def test_file_bucket_budget_is_shared_across_processes(tmp_path):
+    path = str(tmp_path / "rate.bucket")
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        taken = list(pool.map(_drain, [path, path], [20, 20]))
+    assert sum(taken) == 10
+    assert FileTokenBucket(path, rate_per_minute=0.6, capacity=10).available < 1
+
+
+def test_persistent_index_is_shared_and_merged(tmp_path):
+    path = tmp_path / "people.sqlite3"
+    first, second = PersistentPersonIndex(path), PersistentPersonIndex(path)
+    first.add({"id": "p1", "email": "Ada@Example.com"})
+    assert second.lookup({"email": "ada@example.com"})["id"] == "p1"
+    second.add({"id": "p1", "title": "CTO"})
+    fresh = PersistentPersonIndex(path)
+    assert fresh.get("id", "p1") == {"id": "p1", "email": "Ada@Example.com", "title": "CTO"}
+    app = ApolloApp(integration=MagicMock(), cache_path=str(path))
+    assert app.enrichment_planner.index.lookup({"id": "p1"})["title"] == "CTO"
+    for index in (first, second, fresh):
+        index.close()
+    app.close()
+
+
+def test_workers_are_recycled_after_max_tasks():
+    pool = WorkerPool(workers=1, app_factory=_offline_app, max_tasks_per_child=2)
+    try:
+        pids = [json.loads(pool.submit("people_search", kwargs={"per_page": 1}).result()[0])["pid"] for _ in range(4)]
+    finally:
+        pool.close()
+    assert len(set(pids)) == 2 and pids[0] == pids[1] and pids[2] == pids[3]
+    assert os.getpid() not in pids
+    assert pool.metrics()["completed"] == 4
+
+
+def test_pooled_app_validates_encodes_and_serves_cursors_locally():
+    pool = WorkerPool(workers=2, app_factory=_offline_app, options={"result_chunk_bytes": 2_000})
+    app = PooledApolloApp(pool, integration=MagicMock(), result_chunk_bytes=2_000)
+    try:
+        with pytest.raises(ValueError, match="'per_page' must be an integer between 1 and 100"):
+            app.call("people_search", per_page=500)
+        assert pool.metrics()["submitted"] == 0
+
+        page = json.loads(app.call("people_search", per_page=100).result())
+        cursor = page["result_cursor"]
+        assert cursor["total_records"] == 100 and cursor["chunks"] > 1
+        records = list(page["people"])
+        chunk = cursor["next_chunk"]
+        while chunk is not None:
+            more = app.invoke_tool("fetch_result_chunk", cursor=cursor["token"], chunk=chunk)
+            records += more["people"]
+            chunk = more["result_cursor"]["next_chunk"]
+        assert [r["id"] for r in records] == [f"{i:024x}" for i in range(100)]
+
+        with pytest.raises(RuntimeError, match="HTTPStatusError"):
+            app.call("organization_enrichment", domain="example.com").result()
+        assert app.get_request_scheduler_metrics()["worker_pool"]["failed"] == 1
+    finally:
+        app.close()
+
+
+def test_stateful_tools_run_in_the_server_process():
+    import asyncio
+
+    pool = WorkerPool(workers=1, app_factory=_offline_app)
+    app = PooledApolloApp(pool, integration=MagicMock())
+    try:
+        assert {"analyze_deals", "sync_enrichment_cache", "enroll_contacts_in_sequences"} <= set(LOCAL_TOOLS)
+        tools = {tool.__name__: tool for tool in app.list_tools()}
+        app.analyze_deals = lambda **kwargs: {"pid": os.getpid()}
+        assert asyncio.run(tools["analyze_deals"]()) == {"pid": os.getpid()}
+        assert pool.metrics()["submitted"] == 0
+    finally:
+        app.close()
+
+
+def test_workers_never_get_a_cassette(tmp_path):
+    cassette = Cassette(tmp_path / "apollo.ndjson.gz", mode=RECORD)
+    with pytest.raises(ValueError):
+        WorkerPool(1, {"cassette": cassette})
+    cassette.close()